@@ -0,0 +1,58 @@
+# ===================================================================================
+# Python file : batch.py
+# Description:
+# Headless entry point for Mesh Editor Pro. Runs the mesh operations listed in a
+# JSON job file without creating a QApplication or a render window, and prints a
+# per-job timing summary.
+#
+# Job file layout:
+#   {"jobs": [{"name": "cut", "inputs": {"body": "body.stl", "tool": "tool.stl"},
+#              "operations": [{"op": "boolean", "inputs": ["body", "tool"],
+#                              "operation": "difference", "result": "cut"}],
+#              "outputs": {"cut": "out/cut.stl"}}]}
+# A job may set "sanitize_profile" (skip, fast, standard or robust); --sanitize-profile
+# sets it for jobs that do not.
+# ===================================================================================
+
+import sys
+import os
+import json
+import time
+import argparse
+import vtk
+
+try:
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+except Exception as e:
+    print(f"Error setting up system path: {e}")
+
+from mesh_editor_pro_core.core.batch_runner import BatchRunner, load_job_file, summarize, format_summary
+from mesh_editor_pro_core.core.operations import SANITIZE_PROFILES
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Run Mesh Editor Pro operations headlessly from a job file.")
+    parser.add_argument("job_file", help="JSON file listing input meshes, operations and outputs.")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes (default: all cores).")
+    parser.add_argument("--report", help="Write the summary report as JSON to this path.")
+    parser.add_argument("--sanitize-profile", choices=SANITIZE_PROFILES, help="How thoroughly results are cleaned (default: standard).")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    vtk.vtkObject.GlobalWarningDisplayOff()
+    try:
+        jobs = load_job_file(args.job_file)
+        for job in jobs: job.setdefault('sanitize_profile', args.sanitize_profile)
+    except Exception as e:
+        print(f"Could not read job file: {e}")
+        sys.exit(2)
+
+    start = time.perf_counter()
+    results = BatchRunner(args.workers).run(jobs, on_result=lambda r: print(f"[{r['status'].upper()}] {r['name']} ({r['seconds']:.3f}s)", flush=True))
+    summary = summarize(results, time.perf_counter() - start)
+    print(format_summary(summary))
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f: json.dump(summary, f, indent=2)
+    sys.exit(0 if summary['failed'] == 0 else 1)
\ No newline at end of file
@@ -0,0 +1,6 @@
+# ===================================================================================
+# Python file : __init__.py
+# Description:
+# This file makes the 'benchmarks' directory a Python package. Benchmarks run
+# headless from the project root, e.g. 'python -m benchmarks.bench_boolean_culling'.
+# ===================================================================================
\ No newline at end of file
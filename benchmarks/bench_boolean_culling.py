@@ -0,0 +1,53 @@
+# ===================================================================================
+# Python file : bench_boolean_culling.py
+# Description:
+# Measures how bounding-volume pre-culling speeds up booleans as the mesh grows.
+# A small sphere is cut into spheres of increasing triangle count, once with the
+# full boolean filter and once with culling enabled. Runs without a display.
+# ===================================================================================
+
+import argparse
+import time
+import vtk
+
+from mesh_editor_pro_core.core.operations import MeshOperations
+from mesh_editor_pro_core.core.sanitize_cache import SanitizationCache
+
+def make_body(triangles):
+    """A unit sphere with roughly the requested number of triangles."""
+    res = max(8, int((triangles / 2) ** 0.5))
+    sphere = vtk.vtkSphereSource(); sphere.SetRadius(1.0); sphere.SetThetaResolution(res); sphere.SetPhiResolution(res); sphere.Update()
+    return sphere.GetOutput()
+
+def make_tool():
+    """A small closed drill head crossing the sphere surface on the X axis."""
+    tool = vtk.vtkSphereSource(); tool.SetRadius(0.1); tool.SetCenter(1.0, 0, 0); tool.SetThetaResolution(48); tool.SetPhiResolution(48); tool.Update()
+    return tool.GetOutput()
+
+def time_boolean(ops, body, tool, op_type, repeat):
+    best = float('inf'); result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter(); result = ops.perform_boolean(body, tool, op_type); best = min(best, time.perf_counter() - t0)
+    return best, result.GetNumberOfCells()
+
+def run(sizes, op_type, repeat):
+    print(f"{'Triangles':>10} {'Near %':>8} {'Full (s)':>10} {'Culled (s)':>11} {'Speedup':>8} {'Cells full/culled':>20}")
+    for size in sizes:
+        body, tool, cache = make_body(size), make_tool(), SanitizationCache(max_memory_mb=8192)
+        full_ops, culled_ops = MeshOperations(cache), MeshOperations(cache)
+        full_ops.boolean_culling = False
+        p1, _ = culled_ops._get_sanitized_for_boolean(body); p2, _ = culled_ops._get_sanitized_for_boolean(tool)
+        split = culled_ops._split_for_boolean(p1, p2)
+        near = 100.0 * (split[1].sum() + split[3].sum()) / (len(split[0][1]) + len(split[2][1])) if split else 100.0
+        full_t, full_cells = time_boolean(full_ops, body, tool, op_type, repeat)
+        culled_t, culled_cells = time_boolean(culled_ops, body, tool, op_type, repeat)
+        print(f"{p1.GetNumberOfCells():>10} {near:>7.2f}% {full_t:>10.3f} {culled_t:>11.3f} {full_t / culled_t:>7.1f}x {f'{full_cells}/{culled_cells}':>20}", flush=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark boolean pre-culling against the full boolean filter.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 500_000, 1_000_000, 2_000_000, 5_000_000])
+    parser.add_argument("--op", default="difference", choices=["union", "intersection", "difference"])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+    vtk.vtkObject.GlobalWarningDisplayOff()
+    run(args.sizes, args.op, args.repeat)
\ No newline at end of file
@@ -0,0 +1,218 @@
+# ===================================================================================
+# Python file : bench_operations.py
+# Description:
+# Benchmark suite for MeshOperations and FileHandler. Builds synthetic inputs at
+# several sizes (the primitives of the Create 3D menu and noisy scan-like
+# patches), times every operation plus sanitization, import and export, and
+# records the peak memory of each case, which runs in its own worker process.
+# Every run is appended to a JSON Lines history file and compared against an
+# earlier run, so a change to the backend shows up as a per-case ratio.
+# ===================================================================================
+
+import argparse
+import datetime
+import fnmatch
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+from mesh_editor_pro_core.core import mesh_arrays
+from mesh_editor_pro_core.core.operations import MeshOperations, _arc_segments
+from mesh_editor_pro_core.core.shape_factory import build_shape
+from mesh_editor_pro_core.utils.file_io import FileHandler
+
+try: import resource
+except ImportError: resource = None  # Windows: peak memory is not reported
+
+SIZES = {'small': 20_000, 'medium': 200_000, 'large': 1_000_000}  # approximate input triangles
+TEMP_DIRS = []  # scratch directories of the file cases, removed after each case
+DEFAULT_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+
+def sphere(triangles, center=(0, 0, 0)):
+    polydata = build_shape('sphere', {'Radius': 1.0, 'Resolution': max(8, int((triangles / 2) ** 0.5))})
+    polydata.GetPoints().SetData(numpy_support.numpy_to_vtk(mesh_arrays.points_array(polydata) + center, deep=True)); return polydata
+
+def cylinder(triangles): return build_shape('cylinder', {'Radius': 0.5, 'Height': 2.0, 'Resolution': max(8, triangles // 4)})
+
+def scan(triangles, seed=0):
+    """An open, noisy height field patch, like a raw scan: no normals, slightly jittered points."""
+    k = max(4, int((triangles / 2) ** 0.5)); plane = vtk.vtkPlaneSource(); plane.SetResolution(k, k)
+    tri = vtk.vtkTriangleFilter(); tri.SetInputConnection(plane.GetOutputPort()); tri.Update()
+    polydata = vtk.vtkPolyData(); polydata.DeepCopy(tri.GetOutput()); polydata.GetPointData().Initialize()
+    points = mesh_arrays.points_array(polydata).copy(); rng = np.random.default_rng(seed)
+    points[:, 2] = 0.05 * np.sin(6 * points[:, 0]) * np.cos(4 * points[:, 1]) + rng.normal(0, 0.002, len(points))
+    points[:, :2] += rng.normal(0, 0.0005, (len(points), 2))
+    polydata.GetPoints().SetData(numpy_support.numpy_to_vtk(points, deep=True)); return polydata
+
+def polygon(sides, radius=0.5, z=0.0):
+    source = vtk.vtkRegularPolygonSource(); source.SetNumberOfSides(max(3, sides)); source.SetRadius(radius); source.SetCenter(0, 0, z); source.Update()
+    return source.GetOutput()
+
+def polyline(points):
+    polydata = vtk.vtkPolyData(); vtk_points = vtk.vtkPoints(); vtk_points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(points, dtype=np.float64), deep=True))
+    line = vtk.vtkPolyLine(); line.GetPointIds().SetNumberOfIds(len(points))
+    for i in range(len(points)): line.GetPointIds().SetId(i, i)
+    cells = vtk.vtkCellArray(); cells.InsertNextCell(line); polydata.SetPoints(vtk_points); polydata.SetLines(cells); return polydata
+
+def revolve_profile(triangles):
+    """
+    An open curve off the Z axis whose full revolution has about the requested triangle count: each profile segment
+    becomes two triangles per revolve step, and the steps follow from the default chord tolerance at radius 1.3.
+    """
+    ops = MeshOperations(); segments = _arc_segments(1.3, 360, ops.chord_tolerance, ops.max_segments) if ops.chord_tolerance else 60
+    t = np.linspace(0, 2, max(4, triangles // (2 * segments) + 1)); return polyline(np.column_stack([1 + 0.3 * np.sin(3 * t), np.zeros_like(t), t]))
+
+def plane(triangles):
+    """A flat square grid with about the requested triangle count and an open border."""
+    n = max(2, int(np.sqrt(triangles / 2))); source = vtk.vtkPlaneSource(); source.SetResolution(n, n)
+    triangle = vtk.vtkTriangleFilter(); triangle.SetInputConnection(source.GetOutputPort()); triangle.Update(); return triangle.GetOutput()
+
+def _boundary_edges(polydata):
+    edges = vtk.vtkFeatureEdges(); edges.SetInputData(polydata); edges.BoundaryEdgesOn(); edges.FeatureEdgesOff(); edges.NonManifoldEdgesOff(); edges.ManifoldEdgesOff(); edges.Update()
+    return edges.GetOutput().GetNumberOfCells()
+
+def _checked_open_decimate(polydata, target):
+    """Decimates an open mesh and fails the case if its border changed or the result exceeds the target."""
+    result = MeshOperations().perform_decimate(polydata, target)
+    if _boundary_edges(result) != _boundary_edges(polydata): raise ValueError(f"border changed from {_boundary_edges(polydata)} to {_boundary_edges(result)} edges")
+    if result.GetNumberOfCells() > target: raise ValueError(f"{result.GetNumberOfCells()} triangles exceed the target of {target}")
+    return result
+
+def _file_cases():
+    cases = {}
+    for fmt in ('stl', 'ply', 'vtp'):
+        cases[f"export:{fmt}"] = (lambda n, f=fmt: _export_setup(n, f), lambda s: FileHandler().export_polydata(s[1], s[0]))
+        cases[f"import:{fmt}"] = (lambda n, f=fmt: _import_setup(n, f), lambda s: FileHandler().import_file(s[1], streaming=False))
+    cases["import:stl-streaming"] = (lambda n: _import_setup(n, 'stl'), lambda s: FileHandler().import_file(s[1], streaming=True))
+    return cases
+
+def _export_setup(triangles, fmt):
+    TEMP_DIRS.append(tempfile.mkdtemp(prefix="mesh_bench_")); return scan(triangles), os.path.join(TEMP_DIRS[-1], f"scan.{fmt}")
+
+def _import_setup(triangles, fmt):
+    polydata, path = _export_setup(triangles, fmt); writer = FileHandler()._get_writer(path)
+    if fmt in ('stl', 'ply'): writer.SetFileTypeToBinary()
+    writer.SetInputData(polydata); writer.Write(); return polydata, path
+
+# case name -> (setup(triangles) -> state, run(state) -> polydata or None); a fresh MeshOperations per run keeps the sanitize cache cold
+CASES = {
+    'sanitize:sphere': (sphere, lambda s: MeshOperations()._get_sanitized_polydata(s)),
+    'sanitize:cylinder': (cylinder, lambda s: MeshOperations()._get_sanitized_polydata(s)),
+    'sanitize:scan': (scan, lambda s: MeshOperations()._get_sanitized_polydata(s)),
+    'boolean:difference': (lambda n: (sphere(n // 2), sphere(n // 2, (0.6, 0.1, 0.05))), lambda s: MeshOperations().perform_boolean(*s, 'difference')),
+    'boolean:union': (lambda n: (sphere(n // 2), sphere(n // 2, (0.6, 0.1, 0.05))), lambda s: MeshOperations().perform_boolean(*s, 'union')),
+    'extrude:polygon': (lambda n: polygon(n // 4), lambda s: MeshOperations().perform_extrude(s, 1.0)),
+    'revolve:curve': (revolve_profile, lambda s: MeshOperations().perform_revolve(s, 360)),
+    'sweep:circle': (lambda n: (polygon(32, 0.2), polyline(np.column_stack([np.zeros(max(2, n // 64)), np.zeros(max(2, n // 64)), np.linspace(0, 5, max(2, n // 64))]))),
+                     lambda s: MeshOperations().perform_sweep(*s)),
+    'loft:circles': (lambda n: [polygon(64, 0.5 + 0.1 * np.sin(i), i * 0.5) for i in range(max(2, n // 1800))], lambda s: MeshOperations().perform_loft(s)),
+    'decimate:scan': (scan, lambda s: MeshOperations().perform_decimate(s, s.GetNumberOfCells() // 10)),
+    'decimate:open-plane': (plane, lambda s: _checked_open_decimate(s, s.GetNumberOfCells() // 8)),
+    'decimate:sphere-error': (sphere, lambda s: MeshOperations().perform_decimate(s, max_error=1e-3)),
+    **_file_cases(),
+}
+
+def _max_rss_mb():
+    if resource is None: return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024  # bytes on macOS, KiB elsewhere
+
+def run_case(name, size, repeat):
+    """Sets up and times one case; returns a JSON-ready record. Runs in its own process so peak RSS belongs to this case."""
+    vtk.vtkObject.GlobalWarningDisplayOff()
+    setup, run = CASES[name]; record = {'case': name, 'size': size, 'triangles': SIZES[size], 'seconds': [], 'median': None, 'cells': None, 'error': None}
+    try:
+        state = setup(SIZES[size]); base = _max_rss_mb()
+        for _ in range(repeat):
+            t0 = time.perf_counter(); result = run(state); record['seconds'].append(time.perf_counter() - t0)
+        record['median'] = statistics.median(record['seconds'])
+        record['cells'] = result.GetNumberOfCells() if result is not None else None
+        peak = _max_rss_mb(); record['peak_rss_mb'] = peak; record['op_peak_mb'] = peak - base if peak is not None else None
+    except Exception as e: record['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        while TEMP_DIRS: shutil.rmtree(TEMP_DIRS.pop(), ignore_errors=True)
+    return record
+
+def run_isolated(name, size, repeat):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool: return pool.submit(run_case, name, size, repeat).result()
+
+def git_commit():
+    try: return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError): return None
+
+def load_history(path):
+    if not os.path.exists(path): return []
+    with open(path, 'r', encoding='utf-8') as f: return [json.loads(line) for line in f if line.strip()]
+
+def find_baseline(history, selector):
+    """The newest run whose label or commit matches selector; 'last' means the newest run from this machine."""
+    if selector == 'none': return None
+    for run in reversed(history):
+        if selector == 'last' and run.get('host') == platform.node(): return run
+        if selector in (run.get('label'), run.get('commit')): return run
+    return None
+
+def compare(results, baseline, threshold):
+    """Prints each case against the baseline and returns the list of regressed case keys."""
+    base = {(r['case'], r['size']): r for r in baseline['results']} if baseline else {}
+    if baseline: print(f"\nBaseline: {baseline.get('label') or baseline.get('commit')} from {baseline['timestamp']}")
+    print(f"{'Case':<24} {'Size':<7} {'Median (s)':>11} {'Peak (MB)':>10} {'Cells':>10} {'Baseline (s)':>13} {'Ratio':>7}")
+    regressions = []
+    for r in results:
+        b = base.get((r['case'], r['size'])); ratio = r['median'] / b['median'] if b and b.get('median') and r['median'] else None
+        flag = "" if ratio is None else " slower" if ratio > 1 + threshold else " faster" if ratio < 1 - threshold else ""
+        if flag == " slower": regressions.append(f"{r['case']}/{r['size']}")
+        if r['error']: print(f"{r['case']:<24} {r['size']:<7} {'error: ' + r['error']}"); continue
+        peak = f"{r['op_peak_mb']:.0f}" if r.get('op_peak_mb') is not None else "n/a"
+        base_s, ratio_s = (f"{b['median']:.3f}", f"{ratio:.2f}") if ratio is not None else ("-", "-")
+        print(f"{r['case']:<24} {r['size']:<7} {r['median']:>11.3f} {peak:>10} {r['cells']!s:>10} {base_s:>13} {ratio_s:>7}{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark mesh operations and file I/O, tracking results across runs.")
+    parser.add_argument("--cases", nargs="+", default=["*"], help="case name patterns, e.g. 'boolean:*' 'import:*'")
+    parser.add_argument("--sizes", nargs="+", default=["small", "medium"], choices=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON Lines file each run is appended to")
+    parser.add_argument("--label", help="name for this run in the history (default: the git commit)")
+    parser.add_argument("--baseline", default="last", help="label or commit to compare against, 'last' (newest run on this machine) or 'none'")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 if any case regressed")
+    parser.add_argument("--in-process", action="store_true", help="run cases in this process (faster; peak memory becomes cumulative)")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+    if args.list: print("\n".join(CASES)); return 0
+    names = [n for n in CASES if any(fnmatch.fnmatch(n, p) for p in args.cases)]
+    if not names: parser.error(f"No case matches {args.cases}.")
+    vtk.vtkObject.GlobalWarningDisplayOff()
+    baseline = find_baseline(load_history(args.history), args.baseline); results = []
+    for size in args.sizes:
+        for name in names:
+            results.append((run_case if args.in_process else run_isolated)(name, size, args.repeat))
+            r = results[-1]; print(f"  {name} [{size}]: " + (f"{r['median']:.3f} s" if r['median'] is not None else r['error']), flush=True)
+    commit = git_commit()
+    run = {'timestamp': datetime.datetime.now().isoformat(timespec='seconds'), 'label': args.label or commit, 'commit': commit, 'host': platform.node(),
+           'platform': platform.platform(), 'python': platform.python_version(), 'vtk': vtk.vtkVersion.GetVTKVersion(), 'cpus': os.cpu_count(),
+           'repeat': args.repeat, 'isolated': not args.in_process, 'results': results}
+    regressions = compare(results, baseline, args.threshold)
+    if not args.no_save:
+        with open(args.history, 'a', encoding='utf-8') as f: f.write(json.dumps(run) + "\n")
+        print(f"\nAppended to {args.history}")
+    if regressions: print(f"Regressions over {100 * args.threshold:.0f}%: {', '.join(regressions)}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
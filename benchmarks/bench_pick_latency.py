@@ -0,0 +1,64 @@
+# ===================================================================================
+# Python file : bench_pick_latency.py
+# Description:
+# Measures the latency of a working-plane pick on a large mesh: the cell pick plus
+# reading the picked cell's normal. The old path tests every cell and recomputes
+# normals for the whole mesh on each click; the new one reuses the actor's cached
+# cell locator and computes the normal of the picked cell only.
+# ===================================================================================
+
+import argparse
+import random
+import statistics
+import time
+
+import vtk
+
+from mesh_editor_pro_core.core.managed_actor import ManagedActor
+
+def make_actor(triangles):
+    resolution = max(8, int((triangles / 2) ** 0.5))
+    source = vtk.vtkSphereSource(); source.SetRadius(5); source.SetThetaResolution(resolution); source.SetPhiResolution(resolution); source.Update()
+    polydata = vtk.vtkPolyData(); polydata.ShallowCopy(source.GetOutput()); polydata.GetPointData().SetNormals(None)
+    mapper = vtk.vtkPolyDataMapper(); mapper.SetInputData(polydata); actor = ManagedActor("Part"); actor.SetMapper(mapper)
+    return actor
+
+def pick_old(picker, renderer, actor, x, y):
+    picker.Pick(x, y, 0, renderer)
+    if picker.GetCellId() == -1: return None
+    normals = vtk.vtkPolyDataNormals(); normals.SetInputData(actor.GetMapper().GetInput()); normals.ComputeCellNormalsOn(); normals.Update()
+    return normals.GetOutput().GetCellData().GetNormals().GetTuple(picker.GetCellId())
+
+def pick_new(picker, renderer, actor, x, y):
+    picker.RemoveAllLocators(); picker.AddLocator(actor.cell_locator()); picker.Pick(x, y, 0, renderer)
+    return actor.cell_normal(picker.GetCellId()) if picker.GetCellId() != -1 else None
+
+def time_picks(pick, renderer, actor, positions):
+    picker = vtk.vtkCellPicker(); picker.SetTolerance(0.005); times, normals = [], []
+    for x, y in positions:
+        t0 = time.perf_counter(); normals.append(pick(picker, renderer, actor, x, y)); times.append(time.perf_counter() - t0)
+    return times, normals
+
+def run(triangles, picks, size):
+    actor = make_actor(triangles); cells = actor.GetMapper().GetInput().GetNumberOfCells()
+    window = vtk.vtkRenderWindow(); window.SetOffScreenRendering(1); window.SetSize(size, size)
+    renderer = vtk.vtkRenderer(); window.AddRenderer(renderer); renderer.AddActor(actor); renderer.ResetCamera(); window.Render()
+    rng = random.Random(0); positions = [(rng.randint(size // 3, 2 * size // 3), rng.randint(size // 3, 2 * size // 3)) for _ in range(picks)]
+    old, old_normals = time_picks(pick_old, renderer, actor, positions)
+    new, new_normals = time_picks(pick_new, renderer, actor, positions)
+    agree = sum(1 for a, b in zip(old_normals, new_normals) if a and b and abs(sum(p * q for p, q in zip(a, b))) > 0.99)
+    print(f"{cells} triangles, {picks} picks at {size}x{size}; normals agree on {agree}/{picks} picks")
+    print(f"{'Path':<28} {'First (ms)':>11} {'Median (ms)':>12} {'Max (ms)':>10}")
+    for label, times in (("Full normals, no locator", old), ("Cached locator, cell normal", new)):
+        rest = times[1:] or times
+        print(f"{label:<28} {1000 * times[0]:>11.1f} {1000 * statistics.median(rest):>12.2f} {1000 * max(rest):>10.2f}")
+    print(f"Speed-up after the first pick: {statistics.median(old[1:] or old) / statistics.median(new[1:] or new):.0f}x", flush=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark working-plane pick latency on a large mesh.")
+    parser.add_argument("--triangles", type=int, default=2_000_000)
+    parser.add_argument("--picks", type=int, default=10)
+    parser.add_argument("--size", type=int, default=600, help="window width and height in pixels")
+    args = parser.parse_args()
+    vtk.vtkObject.GlobalWarningDisplayOff()
+    run(args.triangles, args.picks, args.size)
\ No newline at end of file
@@ -0,0 +1,82 @@
+# ===================================================================================
+# Python file : bench_scene_registry.py
+# Description:
+# Measures how object creation and deletion scale with scene size. Actors that
+# all share one base name are created and then deleted in batches, once with the
+# old list-and-scan bookkeeping and once with SceneRegistry; a flat time per
+# batch means the cost no longer grows with the scene. '--app' runs the same
+# workload through the main window (offscreen) so the object browser is included.
+# ===================================================================================
+
+import argparse
+import os
+import time
+
+from mesh_editor_pro_core.core.managed_actor import ManagedActor
+from mesh_editor_pro_core.core.scene_registry import SceneRegistry
+
+class ListScene:
+    """The bookkeeping SceneRegistry replaced: a list with linear name scans."""
+    def __init__(self): self.actors = []
+    def unique_name(self, name):
+        final_name, i = name, 1
+        while any(a.name == final_name for a in self.actors): final_name = f"{name}_{i}"; i += 1
+        return final_name
+    def add(self, actor): self.actors.append(actor)
+    def remove(self, actor): self.actors.remove(actor)
+    def find(self, name): return next((a for a in self.actors if a.name == name), None)
+
+def run_backend(scene, count, batch):
+    """Creates count actors named 'Part', then deletes them by name; returns per-batch seconds for both phases."""
+    create, delete, names = [], [], []
+    for start in range(0, count, batch):
+        t0 = time.perf_counter()
+        for _ in range(start, min(start + batch, count)):
+            actor = ManagedActor(scene.unique_name("Part")); scene.add(actor); names.append(actor.name)
+        create.append(time.perf_counter() - t0)
+    for start in range(0, count, batch):
+        t0 = time.perf_counter()
+        for name in names[start:start + batch]: scene.remove(scene.find(name))
+        delete.append(time.perf_counter() - t0)
+    return create, delete
+
+def run_app(count, batch):
+    """Same workload through MeshCreatorApp, one transaction per batch, browser updates included."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    import vtk
+    from PyQt5.QtWidgets import QApplication
+    from mesh_editor_pro_core.main_window import MeshCreatorApp
+    vtk.vtkObject.GlobalWarningDisplayOff(); qt_app = QApplication.instance() or QApplication([]); app = MeshCreatorApp()
+    point = vtk.vtkPolyData(); point.SetPoints(vtk.vtkPoints()); point.GetPoints().InsertNextPoint(0, 0, 0)
+    create, delete = [], []
+    for start in range(0, count, batch):
+        t0 = time.perf_counter()
+        with app.transaction("Create"):
+            for _ in range(start, min(start + batch, count)): app._create_actor_from_polydata(point, "Part")
+        create.append(time.perf_counter() - t0)
+    names = [a.name for a in app.actors]
+    for start in range(0, count, batch):
+        t0 = time.perf_counter()
+        with app.transaction("Delete"):
+            for name in names[start:start + batch]: app.delete_actor_by_name(name)
+        delete.append(time.perf_counter() - t0)
+    app.history.clear(); qt_app.processEvents()
+    return create, delete
+
+def report(label, count, batch, create, delete):
+    print(f"{label}: {count} actors in batches of {batch}")
+    print(f"{'Batch':>6} {'Create (ms)':>12} {'Delete (ms)':>12}")
+    for i, (c, d) in enumerate(zip(create, delete)): print(f"{i + 1:>6} {1000 * c:>12.1f} {1000 * d:>12.1f}")
+    print(f"{'Total':>6} {sum(create):>11.2f}s {sum(delete):>11.2f}s\n", flush=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark scene bookkeeping as the number of actors grows.")
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=5_000)
+    parser.add_argument("--legacy-count", type=int, default=1_000, help="actors for the list-based baseline, which grows cubically with shared names")
+    parser.add_argument("--app", action="store_true", help="also run the workload through the main window")
+    args = parser.parse_args()
+    legacy_batch = max(1, args.legacy_count // 10)
+    report("List scan (before)", args.legacy_count, legacy_batch, *run_backend(ListScene(), args.legacy_count, legacy_batch))
+    report("SceneRegistry", args.count, args.batch, *run_backend(SceneRegistry(), args.count, args.batch))
+    if args.app: report("MeshCreatorApp", args.count, args.batch, *run_app(args.count, args.batch))
\ No newline at end of file
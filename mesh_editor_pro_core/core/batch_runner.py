@@ -0,0 +1,99 @@
+# ===================================================================================
+# Python file : batch_runner.py
+# Description:
+# Runs mesh operations from a job file without any GUI. Each job loads its input
+# meshes, applies a list of MeshOperations steps and exports the named results.
+# Independent jobs are spread across a process pool.
+# ===================================================================================
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .operations import MeshOperations
+from ..utils.file_io import FileHandler
+
+def _op_boolean(ops, meshes, step):
+    inputs = [meshes[n] for n in step['inputs']]
+    return ops.perform_boolean(*inputs, step['operation']) if len(inputs) == 2 else ops.perform_boolean_nary(inputs, step['operation'])
+def _op_extrude(ops, meshes, step): return ops.perform_extrude(meshes[step['input']], step.get('length', 1.0), tuple(step.get('vector', (0, 0, 1))))
+def _op_revolve(ops, meshes, step): return ops.perform_revolve(meshes[step['input']], step.get('angle', 360), step.get('chord_tolerance'))
+def _op_sweep(ops, meshes, step): return ops.perform_sweep(meshes[step['profile']], meshes[step['path']])
+def _op_loft(ops, meshes, step): return ops.perform_loft([meshes[n] for n in step['inputs']], step.get('chord_tolerance'))
+def _op_decimate(ops, meshes, step): return ops.perform_decimate(meshes[step['input']], step.get('target_triangles'), step.get('max_error'), step.get('feature_angle', 30.0))
+
+OPERATIONS = {'boolean': _op_boolean, 'extrude': _op_extrude, 'revolve': _op_revolve, 'sweep': _op_sweep, 'loft': _op_loft, 'decimate': _op_decimate}
+
+def load_job_file(path):
+    """Reads a JSON job file and resolves relative paths against its directory."""
+    with open(path, 'r', encoding='utf-8') as f: spec = json.load(f)
+    jobs = spec['jobs'] if isinstance(spec, dict) else spec
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for i, job in enumerate(jobs):
+        job.setdefault('name', f"job_{i + 1}")
+        job['inputs'] = {k: os.path.join(base_dir, v) for k, v in job.get('inputs', {}).items()}
+        job['outputs'] = {k: os.path.join(base_dir, v) for k, v in job.get('outputs', {}).items()}
+    return jobs
+
+def run_job(job, in_pool=False):
+    """
+    Executes a single job and returns a picklable result record with per-step timings. Inside the batch pool the
+    operations run in this process only, so jobs do not each start their own worker pools.
+    """
+    record = {'name': job['name'], 'status': 'ok', 'error': None, 'steps': [], 'seconds': 0.0}
+    start = time.perf_counter(); ops, handler, meshes = MeshOperations(), FileHandler(), {}
+    ops.sanitize_profile = job.get('sanitize_profile') or ops.sanitize_profile
+    if in_pool: ops.boolean_workers = ops.decimate_workers = 1
+    def timed(label, fn):
+        t0 = time.perf_counter(); result = fn()
+        record['steps'].append({'step': label, 'seconds': time.perf_counter() - t0}); return result
+    try:
+        for name, path in job['inputs'].items(): meshes[name] = timed(f"import:{name}", lambda p=path: handler.import_file(p))
+        for step in job.get('operations', []):
+            if step.get('op') not in OPERATIONS: raise ValueError(f"Unknown operation: {step.get('op')}")
+            meshes[step['result']] = timed(f"{step['op']}:{step['result']}", lambda s=step: OPERATIONS[s['op']](ops, meshes, s))
+        for name, path in job['outputs'].items():
+            if name not in meshes: raise ValueError(f"Output '{name}' was never produced.")
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            timed(f"export:{name}", lambda n=name, p=path: handler.export_polydata(p, meshes[n]))
+    except Exception as e: record['status'], record['error'] = 'failed', f"{type(e).__name__}: {e}"
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+class BatchRunner:
+    """Runs a list of jobs, in-process or across a process pool."""
+
+    def __init__(self, max_workers=None): self.max_workers = max_workers or os.cpu_count() or 1
+
+    def run(self, jobs, on_result=None):
+        """Runs all jobs and returns their result records in job order."""
+        results = [None] * len(jobs)
+        if self.max_workers == 1 or len(jobs) <= 1:
+            for i, job in enumerate(jobs):
+                results[i] = run_job(job)
+                if on_result: on_result(results[i])
+            return results
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+            futures = {pool.submit(run_job, job, True): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try: results[i] = future.result()
+                except Exception as e: results[i] = {'name': jobs[i]['name'], 'status': 'failed', 'error': f"Worker crashed: {e}", 'steps': [], 'seconds': 0.0}
+                if on_result: on_result(results[i])
+        return results
+
+def summarize(results, wall_seconds):
+    """Builds a summary report dictionary from job result records."""
+    failed = [r for r in results if r['status'] != 'ok']; job_times = [r['seconds'] for r in results]
+    return {'jobs': len(results), 'succeeded': len(results) - len(failed), 'failed': len(failed), 'wall_seconds': wall_seconds,
+            'cpu_seconds': sum(job_times), 'slowest_job': max(results, key=lambda r: r['seconds'])['name'] if results else None, 'results': results}
+
+def format_summary(summary):
+    """Formats a summary report as plain text."""
+    lines = [f"{'Job':<32} {'Status':<8} {'Seconds':>10}", "-" * 52]
+    for r in summary['results']:
+        lines.append(f"{r['name'][:32]:<32} {r['status']:<8} {r['seconds']:>10.3f}")
+        if r['error']: lines.append(f"    {r['error']}")
+    lines += ["-" * 52, f"{summary['succeeded']}/{summary['jobs']} jobs succeeded in {summary['wall_seconds']:.3f}s wall ({summary['cpu_seconds']:.3f}s summed job time)."]
+    return "\n".join(lines)
\ No newline at end of file
@@ -9,27 +9,78 @@ class Command:
     """Base class for commands to enable a unified undo/redo interface."""
     def execute(self): raise NotImplementedError
     def undo(self): raise NotImplementedError
+    def added_actors(self): return []
+    def removed_actors(self): return []
+    def changed_actors(self): return []  # actors whose geometry the command edits in place
 
 class AddActorCommand(Command):
     """Command to add a new actor to the scene."""
     def __init__(self, renderer, actor): self.renderer, self.actor = renderer, actor
     def execute(self): self.renderer.AddActor(self.actor)
     def undo(self): self.renderer.RemoveActor(self.actor)
+    def added_actors(self): return [self.actor]
+
+class AddActorsCommand(Command):
+    """Command to add a group of actors, such as an imported assembly, as one undo step."""
+    def __init__(self, renderer, actors): self.renderer, self.actors = renderer, list(actors)
+    def execute(self): [self.renderer.AddActor(a) for a in self.actors]
+    def undo(self): [self.renderer.RemoveActor(a) for a in self.actors]
+    def added_actors(self): return list(self.actors)
 
 class DeleteActorCommand(Command):
     """Command to remove an actor from the scene."""
     def __init__(self, renderer, actor): self.renderer, self.actor = renderer, actor
     def execute(self): self.renderer.RemoveActor(self.actor)
     def undo(self): self.renderer.AddActor(self.actor)
+    def removed_actors(self): return [self.actor]
 
 class ReplaceActorCommand(Command):
     """Command to replace one actor with another."""
     def __init__(self, renderer, new_actor, old_actor): self.renderer, self.new_actor, self.old_actor = renderer, new_actor, old_actor
     def execute(self): self.renderer.RemoveActor(self.old_actor); self.renderer.AddActor(self.new_actor)
     def undo(self): self.renderer.RemoveActor(self.new_actor); self.renderer.AddActor(self.old_actor)
+    def added_actors(self): return [self.new_actor]
+    def removed_actors(self): return [self.old_actor]
 
 class BooleanOperationCommand(Command):
     """Command for boolean operations."""
     def __init__(self, renderer, new_actor, old_actor1, old_actor2): self.renderer, self.new_actor, self.old_actor1, self.old_actor2 = renderer, new_actor, old_actor1, old_actor2
     def execute(self): self.renderer.RemoveActor(self.old_actor1); self.renderer.RemoveActor(self.old_actor2); self.renderer.AddActor(self.new_actor)
-    def undo(self): self.renderer.RemoveActor(self.new_actor); self.renderer.AddActor(self.old_actor1); self.renderer.AddActor(self.old_actor2)
\ No newline at end of file
+    def undo(self): self.renderer.RemoveActor(self.new_actor); self.renderer.AddActor(self.old_actor1); self.renderer.AddActor(self.old_actor2)
+    def added_actors(self): return [self.new_actor]
+    def removed_actors(self): return [self.old_actor1, self.old_actor2]
+
+class NaryBooleanCommand(Command):
+    """Command for a boolean combining any number of meshes into one."""
+    def __init__(self, renderer, new_actor, old_actors): self.renderer, self.new_actor, self.old_actors = renderer, new_actor, list(old_actors)
+    def execute(self): [self.renderer.RemoveActor(a) for a in self.old_actors]; self.renderer.AddActor(self.new_actor)
+    def undo(self): self.renderer.RemoveActor(self.new_actor); [self.renderer.AddActor(a) for a in self.old_actors]
+    def added_actors(self): return [self.new_actor]
+    def removed_actors(self): return list(self.old_actors)
+
+class TranslateGeometryCommand(Command):
+    """Moves actors' points in place, one offset per actor; only the offsets are stored, so no geometry is copied."""
+    def __init__(self, actors, offsets): self.actors, self.offsets = list(actors), [tuple(float(c) for c in o) for o in offsets]
+    def execute(self): [a.translate(o) for a, o in zip(self.actors, self.offsets)]
+    def undo(self): [a.translate(tuple(-c for c in o)) for a, o in zip(self.actors, self.offsets)]
+    def changed_actors(self): return list(self.actors)
+
+class MacroCommand(Command):
+    """A group of executed commands that undo and redo as one step."""
+    def __init__(self, commands): self.commands = list(commands)
+    def execute(self): [c.execute() for c in self.commands]
+    def undo(self): [c.undo() for c in reversed(self.commands)]
+    def added_actors(self): return self._net_change()[0]
+    def removed_actors(self): return self._net_change()[1]
+    def changed_actors(self): return list({a: None for c in self.commands for a in c.changed_actors()})
+    def _net_change(self):
+        """Actors the group adds to and removes from the scene overall; ones both added and removed inside it cancel out."""
+        added, removed = {}, {}
+        for c in self.commands:
+            for a in c.removed_actors():
+                if a in added: del added[a]
+                else: removed[a] = True
+            for a in c.added_actors():
+                if a in removed: del removed[a]
+                else: added[a] = True
+        return list(added), list(removed)
\ No newline at end of file
@@ -0,0 +1,180 @@
+# ===================================================================================
+# Python file : history.py
+# Description:
+# Undo/redo history with a memory budget. Geometry of actors that only the
+# history still references (removed by an undone-able command, or added by a
+# redoable one) is compressed in memory or spilled to disk once the budget is
+# exceeded, farthest from the current state first, and restored lazily when
+# undo or redo brings the actor back. Pure backend logic with no GUI code.
+# ===================================================================================
+
+import os
+import shutil
+import tempfile
+import zlib
+import numpy as np
+
+from mesh_editor_pro_core.core import mesh_arrays
+
+class HistoryManager:
+    """Undo and redo stacks of Command objects whose off-scene geometry is kept within memory_budget_mb."""
+
+    def __init__(self, memory_budget_mb=1024, compress_limit_mb=64, compress_level=1, spill_dir=None):
+        self.memory_budget_mb, self.compress_limit_mb, self.compress_level = memory_budget_mb, compress_limit_mb, compress_level
+        self.spill_root, self.spill_dir = spill_dir, None
+        self.undo_stack, self.redo_stack = [], []
+        self.snapshots = {}  # actor -> {'arrays' | 'blob' | 'path', 'descs', 'nbytes', 'stored'}
+        self.off_scene = {}  # actor -> bytes it holds in memory, least recently moved off the scene first
+        self.resident_bytes = self.disk_bytes = 0
+
+    def can_undo(self): return bool(self.undo_stack)
+    def can_redo(self): return bool(self.redo_stack)
+
+    def push(self, command):
+        """Records an executed command; the redo branch it replaces is discarded."""
+        self.undo_stack.append(command); dropped, self.redo_stack = self.redo_stack, []
+        for c in dropped: self._forget(c.added_actors())
+        self._leave_scene(command.removed_actors())
+
+    def undo(self):
+        """Pops the next command to undo after restoring the geometry its undo puts back; the caller runs command.undo()."""
+        command = self.undo_stack.pop(); self._enter_scene(command.removed_actors()); self._leave_scene(command.added_actors())
+        self.redo_stack.append(command); return command
+
+    def redo(self):
+        """Pops the next command to redo after restoring the geometry it adds; the caller runs command.execute()."""
+        command = self.redo_stack.pop(); self._enter_scene(command.added_actors()); self._leave_scene(command.removed_actors())
+        self.undo_stack.append(command); return command
+
+    def cancel_undo(self):
+        """Puts back a command whose undo() failed."""
+        command = self.redo_stack.pop(); self._enter_scene(command.added_actors()); self._leave_scene(command.removed_actors())
+        self.undo_stack.append(command)
+
+    def cancel_redo(self):
+        """Puts back a command whose execute() failed on redo."""
+        command = self.undo_stack.pop(); self._enter_scene(command.removed_actors()); self._leave_scene(command.added_actors())
+        self.redo_stack.append(command)
+
+    def clear(self):
+        self.undo_stack, self.redo_stack = [], []; self._forget(list(self.off_scene)); self._release(list(self.snapshots))
+        self.resident_bytes = self.disk_bytes = 0
+        if self.spill_dir: shutil.rmtree(self.spill_dir, ignore_errors=True); self.spill_dir = None
+
+    def off_scene_actors(self):
+        """Actors held only by the history, least recently moved off the scene first."""
+        return list(self.off_scene)
+
+    def trim(self, live_actors=()):
+        """
+        Compresses, then spills, off-scene geometry until history memory fits the budget. Actors in live_actors
+        (the scene, or inputs of a running task) are never touched.
+        """
+        budget = self.memory_budget_mb * 1024 * 1024
+        if self.resident_bytes <= budget: return self.resident_bytes
+        for actor in list(self.off_scene):
+            if self.resident_bytes <= budget: break
+            if actor in live_actors: continue
+            snapshot = self.snapshots.get(actor)
+            if snapshot is None:
+                polydata = self._polydata(actor)
+                if polydata is None or not polydata.GetNumberOfPoints(): continue
+                snapshot = self._take(actor, polydata)
+            elif 'blob' in snapshot: self._spill(snapshot)
+            else: continue
+            self._set_resident(actor, 0 if 'path' in snapshot else snapshot['stored'])
+        return self.resident_bytes
+
+    def restore(self, actors):
+        """Rebuilds the geometry of any offloaded actors in place, so mappers and commands keep their references."""
+        for actor in actors:
+            snapshot = self.snapshots.pop(actor, None)
+            if snapshot is None: continue
+            arrays, deep = self._load(snapshot), snapshot.get('compressed', True)
+            self._polydata(actor).ShallowCopy(mesh_arrays.arrays_to_polydata(arrays, deep=deep))
+            self._discard(snapshot)
+
+    def memory_bytes(self):
+        """Bytes of history geometry held in memory, counting compressed snapshots at their compressed size."""
+        return self.resident_bytes
+
+    def stats(self):
+        return {'undo_steps': len(self.undo_stack), 'redo_steps': len(self.redo_stack), 'memory_mb': self.resident_bytes / (1024 * 1024),
+                'disk_mb': self.disk_bytes / (1024 * 1024), 'offloaded': len(self.snapshots), 'budget_mb': self.memory_budget_mb}
+
+    def _enter_scene(self, actors):
+        self.restore(actors)
+        for actor in actors: self.resident_bytes -= self.off_scene.pop(actor, 0)
+
+    def _leave_scene(self, actors):
+        for actor in actors:
+            self.resident_bytes -= self.off_scene.pop(actor, 0)
+            polydata = self._polydata(actor); size = polydata.GetActualMemorySize() * 1024 if polydata else 0
+            self.off_scene[actor] = size; self.resident_bytes += size
+
+    def _set_resident(self, actor, size):
+        self.resident_bytes += size - self.off_scene[actor]; self.off_scene[actor] = size
+
+    def _forget(self, actors):
+        for actor in actors: self.resident_bytes -= self.off_scene.pop(actor, 0)
+        self._release(actors)
+
+    def _polydata(self, actor):
+        mapper = actor.GetMapper()
+        return mapper.GetInput() if mapper else None
+
+    def _take(self, actor, polydata):
+        """Moves an actor's geometry into a compressed or spilled snapshot and empties its polydata."""
+        arrays = mesh_arrays.polydata_to_arrays(polydata, attributes=True); descs, nbytes = {}, 0
+        for key, array in arrays.items(): descs[key] = (nbytes, array.dtype.str, array.shape); nbytes += self._padded(array.nbytes)
+        snapshot = {'descs': descs, 'nbytes': nbytes}
+        if nbytes <= self.compress_limit_mb * 1024 * 1024:
+            compressor = zlib.compressobj(self.compress_level); chunks = [compressor.compress(c) for c in self._chunks(arrays)]
+            chunks.append(compressor.flush()); snapshot['blob'] = b''.join(chunks); snapshot['stored'] = len(snapshot['blob'])
+        else:
+            snapshot['arrays'] = arrays; self._spill(snapshot)
+        polydata.Initialize(); self.snapshots[actor] = snapshot
+        actor.release_caches()
+        return snapshot
+
+    def _spill(self, snapshot):
+        """Writes a snapshot's raw or compressed bytes to the spill directory and drops the in-memory copy."""
+        if self.spill_dir is None: self.spill_dir = tempfile.mkdtemp(prefix="mesh_editor_history_", dir=self.spill_root)
+        fd, path = tempfile.mkstemp(suffix=".bin", dir=self.spill_dir)
+        with os.fdopen(fd, 'wb') as f:
+            if 'blob' in snapshot: f.write(snapshot.pop('blob')); snapshot['compressed'] = True
+            else:
+                for chunk in self._chunks(snapshot.pop('arrays')): f.write(chunk)
+                snapshot['stored'], snapshot['compressed'] = snapshot['nbytes'], False
+        snapshot['path'] = path; self.disk_bytes += snapshot['stored']
+
+    def _load(self, snapshot):
+        if 'path' in snapshot and not snapshot['compressed']: data = np.fromfile(snapshot['path'], dtype=np.uint8)
+        else:
+            blob = snapshot.get('blob')
+            if blob is None:
+                with open(snapshot['path'], 'rb') as f: blob = f.read()
+            data = np.frombuffer(zlib.decompress(blob), dtype=np.uint8)
+        arrays = {}
+        for key, (offset, dtype, shape) in snapshot['descs'].items():
+            dtype = np.dtype(dtype); arrays[key] = data[offset:offset + dtype.itemsize * int(np.prod(shape, dtype=np.int64))].view(dtype).reshape(shape)
+        return arrays
+
+    def _chunks(self, arrays):
+        """Raw bytes of each array, padded so every array starts on an aligned offset."""
+        for array in arrays.values():
+            yield memoryview(np.ascontiguousarray(array)).cast('B'); yield b'\0' * (self._padded(array.nbytes) - array.nbytes)
+
+    def _padded(self, nbytes, align=16):
+        return nbytes + (-nbytes % align)
+
+    def _discard(self, snapshot):
+        if 'path' in snapshot:
+            self.disk_bytes -= snapshot['stored']
+            try: os.remove(snapshot['path'])
+            except OSError: pass
+
+    def _release(self, actors):
+        for actor in actors:
+            snapshot = self.snapshots.pop(actor, None)
+            if snapshot: self._discard(snapshot)
\ No newline at end of file
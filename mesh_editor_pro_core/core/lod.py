@@ -0,0 +1,39 @@
+# ===================================================================================
+# Python file : lod.py
+# Description:
+# Builds decimated level-of-detail copies of a mesh with quadric decimation.
+# Each level is decimated from the previous one, so the coarse levels cost
+# little extra. Pure backend logic, safe to run on a worker thread.
+# ===================================================================================
+
+import vtk
+
+from mesh_editor_pro_core.core import mesh_arrays
+from mesh_editor_pro_core.core.progress import ProgressMonitor
+
+DEFAULT_REDUCTIONS = (0.75, 0.95)  # fraction of the full-resolution triangles removed at each level
+
+def build_lod_levels(polydata, reductions=DEFAULT_REDUCTIONS, monitor=None):
+    """
+    Returns decimated copies of polydata, finest first, with point normals for smooth shading. reductions are
+    fractions of the original triangle count to remove and must increase.
+    """
+    monitor = monitor or ProgressMonitor()
+    source = polydata
+    if mesh_arrays.triangle_arrays(polydata) is None:
+        triangles = monitor.observe(vtk.vtkTriangleFilter()); triangles.SetInputData(polydata); triangles.PassVertsOff(); triangles.PassLinesOff()
+        triangles.Update(); monitor.check(); source = triangles.GetOutput()
+    full_cells, levels, removed = source.GetNumberOfCells(), [], 0.0
+    for reduction in reductions:
+        # Reduction relative to the previous level that leaves (1 - reduction) of the original cells.
+        step = 1.0 - (1.0 - reduction) / (1.0 - removed)
+        if step <= 0: continue
+        decimate = monitor.observe(vtk.vtkQuadricDecimation()); decimate.SetInputData(source); decimate.SetTargetReduction(step)
+        decimate.VolumePreservationOn(); decimate.AttributeErrorMetricOff()
+        normals = monitor.observe(vtk.vtkPolyDataNormals()); normals.SetInputConnection(decimate.GetOutputPort())
+        normals.SplittingOff(); normals.ConsistencyOff(); normals.ComputeCellNormalsOff()
+        normals.Update(); monitor.check()
+        level = vtk.vtkPolyData(); level.ShallowCopy(normals.GetOutput())
+        if level.GetNumberOfCells() == 0: break
+        levels.append(level); source, removed = level, 1.0 - level.GetNumberOfCells() / full_cells
+    return levels
\ No newline at end of file
@@ -2,10 +2,16 @@
 # Python file : managed_actor.py
 # Description:
 # Defines a custom actor class that inherits from vtk.vtkLODActor to support
-# Level-Of-Detail rendering, ensuring consistent use of VTKLODActor.
+# Level-Of-Detail rendering, ensuring consistent use of VTKLODActor. Also offers
+# zero-copy NumPy views of the geometry and vectorized in-place edits for the
+# Python console and plugins.
 # ===================================================================================
 
+import numpy as np
 import vtk
+from vtk.util import numpy_support
+
+from mesh_editor_pro_core.core import mesh_arrays
 
 class ManagedActor(vtk.vtkLODActor):
     """
@@ -13,4 +19,118 @@ class ManagedActor(vtk.vtkLODActor):
     """
     def __init__(self, name=""):
         super().__init__()
-        self.name = name
\ No newline at end of file
+        self.name = name
+        self.saved_blocks = {}  # project path -> where that file last stored this actor's geometry
+        self.lod_source_mtime = None  # geometry MTime the current LOD mappers were decimated from
+        self.pick_locator = None  # (geometry MTime, vtkStaticCellLocator) reused by surface picking
+
+    def set_lod_levels(self, levels, source_mtime=None):
+        """
+        Replaces the LOD mappers with decimated copies of the geometry, finest first. The render window switches
+        to a coarser level while interaction needs a faster frame and back to full resolution when it stops.
+        """
+        self.GetLODMappers().RemoveAllItems()
+        full = self.GetMapper()
+        for level in levels:
+            mapper = vtk.vtkPolyDataMapper(); mapper.SetInputData(level)
+            if full: mapper.SetScalarVisibility(full.GetScalarVisibility()); mapper.SetScalarMode(full.GetScalarMode())
+            self.AddLODMapper(mapper)
+        self.lod_source_mtime = source_mtime if levels else None; self.Modified()
+
+    def clear_lod_levels(self): self.set_lod_levels([])
+
+    def lod_levels_current(self):
+        """True if LOD mappers exist and were built from the geometry as it is now."""
+        polydata = self.GetMapper().GetInput() if self.GetMapper() else None
+        return self.lod_source_mtime is not None and polydata is not None and polydata.GetMTime() == self.lod_source_mtime
+
+    def cell_locator(self):
+        """A static cell locator over the current geometry, built on first use and rebuilt only after the geometry changes."""
+        polydata = self.GetMapper().GetInput()
+        if self.pick_locator is None or self.pick_locator[0] != polydata.GetMTime() or self.pick_locator[1].GetDataSet() is not polydata:
+            locator = vtk.vtkStaticCellLocator(); locator.SetDataSet(polydata); locator.BuildLocator()
+            self.pick_locator = (polydata.GetMTime(), locator)
+        return self.pick_locator[1]
+
+    def clear_cell_locator(self): self.pick_locator = None
+
+    def release_caches(self):
+        """Drops everything derived from the geometry (LOD levels, pick locator), e.g. once the history has taken it away."""
+        self.clear_lod_levels(); self.clear_cell_locator()
+
+    def cell_normal(self, cell_id):
+        """The normal of one cell: its stored cell normal if there is one, otherwise computed from that cell's points alone."""
+        polydata = self.GetMapper().GetInput(); normals = polydata.GetCellData().GetNormals()
+        if normals: return normals.GetTuple3(cell_id)
+        ids, points, normal = vtk.vtkIdList(), vtk.vtkPoints(), [0.0, 0.0, 0.0]
+        polydata.GetCellPoints(cell_id, ids); polydata.GetPoints().GetPoints(ids, points); vtk.vtkPolygon.ComputeNormal(points, normal)
+        return tuple(normal)
+
+    # NumPy access. Views share memory with the VTK arrays; after writing through them call geometry_modified().
+
+    def polydata(self): return self.GetMapper().GetInput()
+
+    def points(self):
+        """Zero-copy (N, 3) view of the points."""
+        return mesh_arrays.points_array(self.polydata())
+
+    def cells(self, kind='polys'):
+        """Zero-copy (offsets, connectivity) views of 'verts', 'lines', 'polys' or 'strips', or None if there are none."""
+        return mesh_arrays.cell_arrays(self.polydata(), kind)
+
+    def point_data(self, name):
+        """Zero-copy view of a point data array (e.g. 'Normals'), or None."""
+        array = self.polydata().GetPointData().GetArray(name)
+        return numpy_support.vtk_to_numpy(array) if array is not None else None
+
+    def cell_data(self, name):
+        """Zero-copy view of a cell data array, or None."""
+        array = self.polydata().GetCellData().GetArray(name)
+        return numpy_support.vtk_to_numpy(array) if array is not None else None
+
+    def geometry_modified(self):
+        """Marks the geometry changed after in-place edits, so rendering, picking, saving and undo see the new data."""
+        polydata = self.polydata()
+        if polydata.GetPoints(): polydata.GetPoints().Modified()
+        polydata.Modified(); self.clear_lod_levels()
+
+    def transform(self, matrix):
+        """Applies a 3x3 or 4x4 matrix (NumPy or nested lists) to the geometry in place."""
+        mesh_arrays.transform_points(self.polydata(), matrix); self.geometry_modified()
+
+    def translate(self, offset):
+        matrix = np.eye(4); matrix[:3, 3] = offset; self.transform(matrix)
+
+    def scale(self, factors, center=None):
+        """Scales by one factor or one per axis about center (default: the bounding-box centre)."""
+        center = np.asarray(self.polydata().GetCenter() if center is None else center, dtype=np.float64)
+        matrix = np.eye(4); matrix[:3, :3] = np.diag(np.broadcast_to(np.asarray(factors, dtype=np.float64), (3,))); matrix[:3, 3] = center - matrix[:3, :3] @ center
+        self.transform(matrix)
+
+    def filter_cells(self, predicate):
+        """
+        Keeps the cells selected by predicate, in place. predicate is a boolean mask with one entry per cell, or a
+        function taking the (M, 3) cell centroids and returning such a mask. Returns the number of cells removed.
+        """
+        polydata = self.polydata(); before = polydata.GetNumberOfCells()
+        keep = predicate(mesh_arrays.cell_centroids(polydata)) if callable(predicate) else predicate
+        mesh_arrays.filter_cells(polydata, keep); self.geometry_modified()
+        return before - polydata.GetNumberOfCells()
+
+    def get_appearance(self):
+        """Returns the display properties that are stored with a project."""
+        prop = self.GetProperty()
+        return {'color': list(prop.GetColor()), 'opacity': prop.GetOpacity(), 'representation': prop.GetRepresentation(),
+                'edge_visibility': bool(prop.GetEdgeVisibility()), 'edge_color': list(prop.GetEdgeColor()), 'line_width': prop.GetLineWidth(),
+                'visible': bool(self.GetVisibility())}
+
+    def apply_appearance(self, appearance):
+        """Restores display properties saved by get_appearance; missing keys are left unchanged."""
+        prop = self.GetProperty()
+        if 'color' in appearance: prop.SetColor(*appearance['color'])
+        if 'opacity' in appearance: prop.SetOpacity(appearance['opacity'])
+        if 'representation' in appearance: prop.SetRepresentation(appearance['representation'])
+        if 'edge_visibility' in appearance: prop.SetEdgeVisibility(appearance['edge_visibility'])
+        if 'edge_color' in appearance: prop.SetEdgeColor(*appearance['edge_color'])
+        if 'line_width' in appearance: prop.SetLineWidth(appearance['line_width'])
+        if 'visible' in appearance: self.SetVisibility(appearance['visible'])
\ No newline at end of file
@@ -0,0 +1,165 @@
+# ===================================================================================
+# Python file : mesh_arrays.py
+# Description:
+# Conversions between vtkPolyData and NumPy arrays, used by backend code that
+# processes whole meshes with vectorized array operations instead of per-cell VTK
+# calls.
+# ===================================================================================
+
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+CELL_KINDS = ('verts', 'lines', 'polys', 'strips')
+
+def points_array(polydata):
+    """Returns the points of a polydata as an (N, 3) array view."""
+    points = polydata.GetPoints()
+    return numpy_support.vtk_to_numpy(points.GetData()) if points else np.empty((0, 3))
+
+def triangle_arrays(polydata):
+    """Returns (points, triangles) for a pure triangle mesh, or None if it holds other cell types."""
+    polys = polydata.GetPolys()
+    if polydata.GetNumberOfVerts() or polydata.GetNumberOfLines() or polydata.GetNumberOfStrips(): return None
+    if polys.GetNumberOfConnectivityIds() != 3 * polys.GetNumberOfCells(): return None
+    triangles = numpy_support.vtk_to_numpy(polys.GetConnectivityArray()).reshape(-1, 3)
+    return points_array(polydata), triangles
+
+def triangle_bounds(points, triangles):
+    """Returns per-triangle (lower, upper) bounding box corners as two (M, 3) arrays."""
+    lower, upper = np.empty((len(triangles), 3)), np.empty((len(triangles), 3))
+    for axis in range(3):
+        corners = points[:, axis][triangles]; lower[:, axis] = corners.min(axis=1); upper[:, axis] = corners.max(axis=1)
+    return lower, upper
+
+def closed_manifold(triangles, point_count):
+    """
+    Returns (closed, oriented): closed when every edge is shared by exactly two triangles, i.e. the triangles form
+    watertight manifold surfaces; oriented when the two triangles on each edge also traverse it in opposite directions.
+    Sorts edge keys with numpy, no VTK filters.
+    """
+    if not len(triangles): return False, False
+    a = triangles.ravel().astype(np.int64); b = triangles[:, [1, 2, 0]].ravel().astype(np.int64)
+    if np.any(a == b): return False, False
+    undirected = np.sort(np.minimum(a, b) * point_count + np.maximum(a, b))
+    if len(undirected) % 2 or np.any(undirected[0::2] != undirected[1::2]) or np.any(undirected[1:-1:2] == undirected[2::2]): return False, False
+    directed = np.sort(a * point_count + b)
+    return True, not bool(np.any(directed[1:] == directed[:-1]))
+
+def signed_volume(points, triangles):
+    """Volume enclosed by a closed triangle mesh; negative when its triangles wind inward."""
+    p0, p1, p2 = (points[triangles[:, i]] for i in range(3))
+    return float(np.einsum('ij,ij->', p0, np.cross(p1, p2))) / 6.0
+
+def polydata_from_triangles(points, triangles, compact=True, deep=True):
+    """
+    Builds a triangle polydata from arrays, optionally dropping points no triangle references.
+    With deep=False the VTK arrays share memory with contiguous, int64-indexed inputs.
+    """
+    triangles = np.asarray(triangles, dtype=np.int64)
+    if compact and len(triangles):
+        used = np.unique(triangles); remap = np.empty(len(points), dtype=np.int64); remap[used] = np.arange(len(used))
+        points, triangles = points[used], remap[triangles]
+    elif compact: points = points[:0]
+    vtk_points = vtk.vtkPoints(); vtk_points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(points), deep=deep))
+    offsets = numpy_support.numpy_to_vtkIdTypeArray(np.arange(0, 3 * len(triangles) + 1, 3, dtype=np.int64), deep=deep)
+    connectivity = numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(triangles).ravel(), deep=deep)
+    polys = vtk.vtkCellArray(); polys.SetData(offsets, connectivity)
+    polydata = vtk.vtkPolyData(); polydata.SetPoints(vtk_points); polydata.SetPolys(polys)
+    return polydata
+
+def polydata_to_arrays(polydata, attributes=False):
+    """
+    Returns a dict of plain arrays (points, per-kind offsets/connectivity, optional normals) describing a polydata.
+    With attributes=True every other numeric point and cell data array is included as 'point_data:<name>' or 'cell_data:<name>'.
+    """
+    arrays = {'points': points_array(polydata)}
+    for kind in CELL_KINDS:
+        cells = getattr(polydata, f"Get{kind.capitalize()}")()
+        if cells and cells.GetNumberOfCells():
+            arrays[f"{kind}_offsets"] = numpy_support.vtk_to_numpy(cells.GetOffsetsArray()).astype(np.int64, copy=False)
+            arrays[f"{kind}_connectivity"] = numpy_support.vtk_to_numpy(cells.GetConnectivityArray()).astype(np.int64, copy=False)
+    normals = polydata.GetPointData().GetNormals()
+    if normals: arrays['point_normals'] = numpy_support.vtk_to_numpy(normals)
+    for prefix, data in (('point_data', polydata.GetPointData()), ('cell_data', polydata.GetCellData())) if attributes else ():
+        for i in range(data.GetNumberOfArrays()):
+            array = data.GetArray(i)
+            if array is None or array is normals: continue
+            arrays[f"{prefix}:{array.GetName() or i}"] = numpy_support.vtk_to_numpy(array)
+    return arrays
+
+def arrays_to_polydata(arrays, deep=True):
+    """Rebuilds a polydata from polydata_to_arrays output; with deep=False the VTK arrays share the given memory."""
+    polydata = vtk.vtkPolyData(); points = vtk.vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(arrays['points']).reshape(-1, 3), deep=deep)); polydata.SetPoints(points)
+    for kind in CELL_KINDS:
+        if f"{kind}_offsets" not in arrays: continue
+        cells = vtk.vtkCellArray()
+        cells.SetData(numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(arrays[f"{kind}_offsets"], dtype=np.int64), deep=deep),
+                      numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(arrays[f"{kind}_connectivity"], dtype=np.int64), deep=deep))
+        getattr(polydata, f"Set{kind.capitalize()}")(cells)
+    if 'point_normals' in arrays:
+        normals = numpy_support.numpy_to_vtk(np.ascontiguousarray(arrays['point_normals']), deep=deep); normals.SetName("Normals"); polydata.GetPointData().SetNormals(normals)
+    for key, values in arrays.items():
+        prefix, _, name = key.partition(':')
+        if prefix not in ('point_data', 'cell_data'): continue
+        array = numpy_support.numpy_to_vtk(np.ascontiguousarray(values), deep=deep); array.SetName(name)
+        (polydata.GetPointData() if prefix == 'point_data' else polydata.GetCellData()).AddArray(array)
+    return polydata
+
+def cell_arrays(polydata, kind='polys'):
+    """Returns zero-copy (offsets, connectivity) views of one cell kind, or None if the polydata has no such cells."""
+    cells = getattr(polydata, f"Get{kind.capitalize()}")()
+    if not cells or not cells.GetNumberOfCells(): return None
+    return numpy_support.vtk_to_numpy(cells.GetOffsetsArray()), numpy_support.vtk_to_numpy(cells.GetConnectivityArray())
+
+def cell_centroids(polydata):
+    """Returns the (M, 3) mean of each cell's points, in cell-id order (verts, lines, polys, strips)."""
+    points, parts = points_array(polydata), []
+    for kind in CELL_KINDS:
+        arrays = cell_arrays(polydata, kind)
+        if arrays is None: continue
+        offsets, connectivity = arrays; sizes = np.diff(offsets)
+        sums = np.add.reduceat(points[connectivity], offsets[:-1], axis=0) if len(connectivity) else np.zeros((len(sizes), 3))
+        parts.append(sums / np.maximum(sizes, 1)[:, None])
+    return np.concatenate(parts) if parts else np.empty((0, 3))
+
+def transform_points(polydata, matrix):
+    """Applies a 3x3 or 4x4 matrix to the points in place; point and cell normals get the inverse transpose, renormalized."""
+    matrix = np.asarray(matrix, dtype=np.float64); linear, offset = matrix[:3, :3], matrix[:3, 3] if matrix.shape == (4, 4) else np.zeros(3)
+    points = points_array(polydata)
+    if len(points): points[:] = points @ linear.T + offset
+    normal_matrix = np.linalg.inv(linear).T
+    for data in (polydata.GetPointData(), polydata.GetCellData()):
+        normals = data.GetNormals()
+        if normals is None: continue
+        values = numpy_support.vtk_to_numpy(normals); values[:] = values @ normal_matrix.T
+        values /= np.maximum(np.linalg.norm(values, axis=1), 1e-300)[:, None]; normals.Modified()
+    if polydata.GetPoints(): polydata.GetPoints().Modified()
+    polydata.Modified()
+
+def filter_cells(polydata, keep):
+    """Keeps only the cells where the boolean mask keep (one entry per cell, in cell-id order) is true, with their cell data, in place."""
+    keep, start = np.asarray(keep, dtype=bool), 0
+    if len(keep) != polydata.GetNumberOfCells(): raise ValueError(f"Mask has {len(keep)} entries for {polydata.GetNumberOfCells()} cells.")
+    for kind in CELL_KINDS:
+        arrays = cell_arrays(polydata, kind)
+        if arrays is None: continue
+        offsets, connectivity = arrays; sizes = np.diff(offsets); mask = keep[start:start + len(sizes)]; start += len(sizes)
+        kept_sizes = sizes[mask]; new_offsets = np.zeros(len(kept_sizes) + 1, dtype=np.int64); np.cumsum(kept_sizes, out=new_offsets[1:])
+        cells = vtk.vtkCellArray()
+        cells.SetData(numpy_support.numpy_to_vtkIdTypeArray(new_offsets, deep=True),
+                      numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(connectivity[np.repeat(mask, sizes)], dtype=np.int64), deep=True))
+        getattr(polydata, f"Set{kind.capitalize()}")(cells)
+    data, kept = polydata.GetCellData(), []
+    for i in range(data.GetNumberOfArrays()):
+        array = data.GetAbstractArray(i)
+        if not isinstance(array, vtk.vtkDataArray): continue
+        values = numpy_support.vtk_to_numpy(array)[keep]
+        new = numpy_support.numpy_to_vtk(np.ascontiguousarray(values), deep=True, array_type=array.GetDataType()); new.SetName(array.GetName())
+        kept.append((new, data.IsArrayAnAttribute(i)))
+    data.Initialize()
+    for array, attribute in kept:
+        index = data.AddArray(array)
+        if attribute >= 0: data.SetActiveAttribute(index, attribute)
+    polydata.DeleteCells(); polydata.Modified()
\ No newline at end of file
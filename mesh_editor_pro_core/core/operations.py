@@ -5,64 +5,388 @@
 # the newly implemented Extrude, Revolve, Sweep, and Loft operations.
 # ===================================================================================
 
+import copy
+import multiprocessing
+import os
+import numpy as np
 import vtk
+from vtk.util import numpy_support
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from . import mesh_arrays
+from .profiler import StageProfiler
+from .progress import ProgressMonitor
+from .sanitize_cache import SanitizationCache
+
+SANITIZE_PROFILES = ('skip', 'fast', 'standard', 'robust')  # cheapest to most thorough
 
 class MeshOperations:
     """A class to handle complex mesh operations as a backend service."""
 
-    def _get_sanitized_polydata(self, polydata):
-        """More aggressively cleans polydata to be watertight and manifold."""
-        clean1 = vtk.vtkCleanPolyData(); clean1.SetInputData(polydata); clean1.Update()
-        triangle = vtk.vtkTriangleFilter(); triangle.SetInputConnection(clean1.GetOutputPort())
+    def __init__(self, sanitize_cache=None, monitor=None):
+        self.sanitize_cache = sanitize_cache if sanitize_cache is not None else SanitizationCache()
+        self.monitor = monitor or ProgressMonitor()
+        self.profiler = None  # a StageProfiler records every filter stage when set
+        self.sanitize_profile = 'standard'  # one of SANITIZE_PROFILES, applied to every operation's output
+        self.chord_tolerance, self.max_segments = 1e-3, 1024  # revolve/loft surface deviation in model units; None keeps the fixed 60 and 30x30 tessellation
+        self.boolean_culling, self.cull_min_cells, self.cull_max_fraction, self.cull_margin = True, 20000, 0.6, 0.02
+        self.boolean_workers, self.parallel_boolean_min_cells = os.cpu_count() or 1, 200_000
+        self.decimate_workers, self.parallel_decimate_min_cells, self.decimate_refine_steps = os.cpu_count() or 1, 1_000_000, 5
+
+    def with_monitor(self, monitor):
+        """Returns a copy sharing this instance's cache and settings that reports to the given monitor."""
+        ops = copy.copy(self); ops.monitor = monitor; return ops
+
+    def _run(self, *algorithms):
+        """
+        Updates a filter chain (last algorithm is the sink) under the progress monitor and returns its output. Stages
+        update one at a time, so cancellation is checked between them and a profiler, if set, times each one.
+        """
+        for alg in algorithms: self.monitor.observe(alg)
+        self.monitor.check()
+        for alg in algorithms:
+            if self.profiler: self.profiler.update(alg)
+            else: alg.Update()
+            self.monitor.check()
+        return algorithms[-1].GetOutput()
+
+    def _get_sanitized_polydata(self, polydata, profile=None):
+        """Cleans polydata with a sanitize profile, by default self.sanitize_profile."""
+        return self._sanitize(polydata, profile or self.sanitize_profile)[0]
+
+    def _sanitize(self, polydata, profile):
+        """
+        Returns (sanitized, closed) for one of SANITIZE_PROFILES: 'skip' returns the input, 'fast' only merges duplicate
+        points and 'robust' always fills holes and re-orients normals to make the mesh watertight and manifold.
+        'standard' first checks the cleaned triangles with numpy: a closed surface skips hole filling and the second
+        clean, and one that is also consistently oriented only has an inward winding fixed before its normals are computed.
+        closed is True when the result is known to be watertight, else None.
+        """
+        if profile not in SANITIZE_PROFILES: raise ValueError(f"Unknown sanitize profile '{profile}'.")
+        if profile == 'skip': return polydata, None
+        clean1 = vtk.vtkCleanPolyData(); clean1.SetInputData(polydata); self._run(clean1)
+        if profile == 'fast': return clean1.GetOutput(), None
+        triangle = vtk.vtkTriangleFilter(); triangle.SetInputConnection(clean1.GetOutputPort()); self._run(triangle)
+        normals = vtk.vtkPolyDataNormals(); normals.SplittingOff()
+        arrays = mesh_arrays.triangle_arrays(triangle.GetOutput()) if profile == 'standard' else None
+        closed, oriented = mesh_arrays.closed_manifold(arrays[1], len(arrays[0])) if arrays is not None else (False, False)
+        if oriented:
+            upstream = triangle
+            if mesh_arrays.signed_volume(*arrays) < 0: upstream = vtk.vtkReverseSense(); upstream.SetInputConnection(triangle.GetOutputPort()); upstream.ReverseCellsOn(); self._run(upstream)
+            normals.SetInputConnection(upstream.GetOutputPort()); normals.ConsistencyOff()
+            return self._run(normals), True
+        if closed:
+            normals.SetInputConnection(triangle.GetOutputPort()); normals.ConsistencyOn(); normals.AutoOrientNormalsOn()
+            return self._run(normals), True
         fill = vtk.vtkFillHolesFilter(); fill.SetInputConnection(triangle.GetOutputPort()); fill.SetHoleSize(1e6)
-        clean2 = vtk.vtkCleanPolyData(); clean2.SetInputConnection(fill.GetOutputPort()); clean2.Update()
-        normals = vtk.vtkPolyDataNormals(); normals.SetInputConnection(clean2.GetOutputPort()); normals.ConsistencyOn(); normals.AutoOrientNormalsOn()
-        normals.Update(); return normals.GetOutput()
+        clean2 = vtk.vtkCleanPolyData(); clean2.SetInputConnection(fill.GetOutputPort()); self._run(fill, clean2)
+        normals.SetInputConnection(clean2.GetOutputPort()); normals.ConsistencyOn(); normals.AutoOrientNormalsOn()
+        return self._run(normals), None
 
     def _is_mesh_valid_for_boolean(self, polydata):
         """Checks if a mesh is suitable for booleans."""
         if not polydata or polydata.GetNumberOfCells() == 0: return False
-        feature_edges = vtk.vtkFeatureEdges(); feature_edges.SetInputData(polydata); feature_edges.BoundaryEdgesOn(); feature_edges.NonManifoldEdgesOn(); feature_edges.Update()
-        return feature_edges.GetOutput().GetNumberOfCells() == 0
+        feature_edges = vtk.vtkFeatureEdges(); feature_edges.SetInputData(polydata); feature_edges.BoundaryEdgesOn(); feature_edges.NonManifoldEdgesOn(); feature_edges.FeatureEdgesOff(); feature_edges.ManifoldEdgesOff()
+        return self._run(feature_edges).GetNumberOfCells() == 0
+
+    def _get_sanitized_for_boolean(self, polydata):
+        """Returns (sanitized, is_valid) for a boolean input, reusing cached results for unchanged geometry."""
+        profile = self.sanitize_profile if self.sanitize_profile in ('standard', 'robust') else 'standard'  # the boolean filter needs closed inputs
+        entry = self.sanitize_cache.get(polydata, profile)
+        if entry is None:
+            sanitized, closed = self._sanitize(polydata, profile)
+            entry = self.sanitize_cache.put(polydata, sanitized, closed, profile) or {'sanitized': sanitized, 'is_valid': closed}
+        if entry['is_valid'] is None: entry['is_valid'] = self._is_mesh_valid_for_boolean(entry['sanitized'])
+        return entry['sanitized'], entry['is_valid']
 
     def perform_boolean(self, polydata1, polydata2, operation_type):
         """Performs a boolean operation, raising a ValueError on failure."""
-        p1 = self._get_sanitized_polydata(polydata1); p2 = self._get_sanitized_polydata(polydata2)
-        if not self._is_mesh_valid_for_boolean(p1) or not self._is_mesh_valid_for_boolean(p2): raise ValueError("One or both meshes are not watertight or have non-manifold edges after sanitization.")
-        bool_op = vtk.vtkBooleanOperationPolyDataFilter(); bool_op.SetInputData(0, p1); bool_op.SetInputData(1, p2)
-        op_map = {'union': 0, 'intersection': 1, 'difference': 2}
-        bool_op.SetOperation(op_map[operation_type]); bool_op.ReorientDifferenceCellsOn(); bool_op.SetTolerance(1e-6); bool_op.Update()
-        result = bool_op.GetOutput()
+        (p1, valid1), (p2, valid2) = self._get_sanitized_for_boolean(polydata1), self._get_sanitized_for_boolean(polydata2)
+        if not valid1 or not valid2: raise ValueError("One or both meshes are not watertight or have non-manifold edges after sanitization.")
+        result = self._perform_culled_boolean(p1, p2, operation_type) if self.boolean_culling else None
+        if result is None: result = self._run_boolean_filter(p1, p2, operation_type)
         if not result or result.GetNumberOfPoints() == 0 or result.GetNumberOfCells() == 0: raise ValueError("Result was empty. Meshes may not intersect or the intersection may be ambiguous.")
         return result
 
+    def perform_boolean_nary(self, polydatas, operation_type):
+        """
+        Combines any number of meshes in one boolean: the union or intersection of all of them, or the first minus all
+        the others. Inputs are paired in a balanced tree, so every intermediate mesh stays small compared with folding
+        one input at a time, and the independent pairs of each tree level run across spawned worker processes once the
+        meshes are large enough; geometry crosses the process boundary as plain arrays.
+        """
+        polydatas = list(polydatas)
+        if len(polydatas) < 2: raise ValueError("A boolean needs at least two meshes.")
+        if operation_type == 'difference':
+            tool = polydatas[1] if len(polydatas) == 2 else self.perform_boolean_nary(polydatas[1:], 'union')
+            return self.perform_boolean(polydatas[0], tool, 'difference')
+        level, done, total = self._spatial_order(polydatas), 0, len(polydatas) - 1
+        workers = min(self.boolean_workers, len(polydatas) // 2)
+        use_pool = workers > 1 and sum(pd.GetNumberOfCells() for pd in polydatas) >= self.parallel_boolean_min_cells
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) if use_pool else None
+        try:
+            while len(level) > 1:
+                pairs, carry = [(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)], level[len(level) - len(level) % 2:]
+                if pool and len(pairs) > 1:
+                    settings = (self.boolean_culling, self.cull_min_cells, self.cull_max_fraction, self.cull_margin, self.sanitize_profile)
+                    pending = [pool.submit(_boolean_pair_to_arrays, settings, mesh_arrays.polydata_to_arrays(p1), mesh_arrays.polydata_to_arrays(p2), operation_type, self.profiler is not None) for p1, p2 in pairs]
+                    fetch = lambda i: self._from_worker(self._await(pending[i]))
+                else: fetch = lambda i: self._combine_pair(*pairs[i], operation_type)
+                results = []
+                for i in range(len(pairs)):
+                    results.append(fetch(i)); done += 1
+                    self.monitor.report(done / total, f"Boolean {operation_type} {done}/{total}"); self.monitor.check()
+                level = results + carry
+        except BaseException:
+            if pool: _abandon_pool(pool); pool = None
+            raise
+        finally:
+            if pool: pool.shutdown(wait=True)
+        return level[0]
+
+    def _await(self, future, poll_seconds=0.1):
+        """The result of a worker-process future, checking for cancellation while it runs."""
+        while True:
+            try: return future.result(timeout=poll_seconds)
+            except FutureTimeout: self.monitor.check()
+
+    def _from_worker(self, result):
+        """Polydata for a worker's (arrays, trace) result, merging the worker's profiled stages into ours."""
+        arrays, trace = result
+        if trace and self.profiler is not None: self.profiler.merge(*trace)
+        return mesh_arrays.arrays_to_polydata(arrays, deep=False)
+
+    def _combine_pair(self, polydata1, polydata2, operation_type):
+        """One step of the N-ary boolean; a union of meshes whose bounds do not overlap is just their sanitized append."""
+        if operation_type == 'union':
+            b1, b2 = np.reshape(polydata1.GetBounds(), (3, 2)), np.reshape(polydata2.GetBounds(), (3, 2))
+            if np.any(b1[:, 0] > b2[:, 1]) or np.any(b2[:, 0] > b1[:, 1]):
+                (p1, valid1), (p2, valid2) = self._get_sanitized_for_boolean(polydata1), self._get_sanitized_for_boolean(polydata2)
+                if not valid1 or not valid2: raise ValueError("One or both meshes are not watertight or have non-manifold edges after sanitization.")
+                append = vtk.vtkAppendPolyData(); append.AddInputData(p1); append.AddInputData(p2)
+                return self._run(append)
+        return self.perform_boolean(polydata1, polydata2, operation_type)
+
+    @staticmethod
+    def _spatial_order(polydatas):
+        """Sorts meshes along the axis their centers spread most, so tree neighbours are likely to touch."""
+        centers = np.array([np.reshape(pd.GetBounds(), (3, 2)).mean(axis=1) for pd in polydatas])
+        axis = int(np.argmax(np.ptp(centers, axis=0)))
+        return [polydatas[i] for i in np.argsort(centers[:, axis], kind='stable')]
+
+    def _run_boolean_filter(self, p1, p2, operation_type):
+        bool_op = vtk.vtkBooleanOperationPolyDataFilter(); bool_op.SetInputData(0, p1); bool_op.SetInputData(1, p2)
+        op_map = {'union': 0, 'intersection': 1, 'difference': 2}
+        bool_op.SetOperation(op_map[operation_type]); bool_op.ReorientDifferenceCellsOn(); bool_op.SetTolerance(1e-6)
+        return self._run(bool_op)
+
+    def _split_for_boolean(self, p1, p2):
+        """
+        Bounding-volume pre-culling: marks the triangles of each mesh whose bounding box touches the padded
+        overlap of both mesh bounds. Triangles outside it lie outside the other mesh and cannot intersect it.
+        Returns (arrays1, near_mask1, arrays2, near_mask2), or None if the meshes are not pure triangle meshes
+        or their bounds do not overlap.
+        """
+        arrays1, arrays2 = mesh_arrays.triangle_arrays(p1), mesh_arrays.triangle_arrays(p2)
+        if arrays1 is None or arrays2 is None or not len(arrays1[1]) or not len(arrays2[1]): return None
+        lower = np.maximum(arrays1[0].min(axis=0), arrays2[0].min(axis=0)); upper = np.minimum(arrays1[0].max(axis=0), arrays2[0].max(axis=0))
+        if np.any(lower > upper): return None
+        pad = self.cull_margin * np.linalg.norm(upper - lower) + 1e-6
+        masks = []
+        for points, triangles in (arrays1, arrays2):
+            tri_lower, tri_upper = mesh_arrays.triangle_bounds(points, triangles)
+            masks.append(np.all((tri_upper >= lower - pad) & (tri_lower <= upper + pad), axis=1))
+        return arrays1, masks[0], arrays2, masks[1]
+
+    def _perform_culled_boolean(self, p1, p2, operation_type):
+        """Runs the boolean filter on the overlapping region only and stitches the untouched cells back."""
+        if p1.GetNumberOfCells() + p2.GetNumberOfCells() < self.cull_min_cells: return None
+        split = self._split_for_boolean(p1, p2)
+        if split is None: return None
+        (points1, tris1), near1, (points2, tris2), near2 = split
+        if not near1.any() or not near2.any() or (near1.sum() + near2.sum()) > self.cull_max_fraction * (len(tris1) + len(tris2)): return None
+        result = self._run_boolean_filter(mesh_arrays.polydata_from_triangles(points1, tris1[near1]), mesh_arrays.polydata_from_triangles(points2, tris2[near2]), operation_type)
+        if not result or result.GetNumberOfCells() == 0: return None
+        keep_far1, keep_far2 = {'union': (True, True), 'intersection': (False, False), 'difference': (True, False)}[operation_type]
+        append = vtk.vtkAppendPolyData(); append.AddInputData(result)
+        if keep_far1 and not near1.all(): append.AddInputData(mesh_arrays.polydata_from_triangles(points1, tris1[~near1]))
+        if keep_far2 and not near2.all(): append.AddInputData(mesh_arrays.polydata_from_triangles(points2, tris2[~near2]))
+        stitch = vtk.vtkCleanPolyData(); stitch.SetInputConnection(append.GetOutputPort()); stitch.PointMergingOn()
+        return self._run(append, stitch)
+
     def perform_extrude(self, profile_data, length, vector=(0, 0, 1)):
         """Extrudes a profile along a vector."""
         if not profile_data or profile_data.GetNumberOfPoints() == 0: raise ValueError("Input profile for extrusion is empty.")
         extrude = vtk.vtkLinearExtrusionFilter(); extrude.SetInputData(profile_data); extrude.SetScaleFactor(1.0); extrude.SetExtrusionTypeToVectorExtrusion()
-        extrude.SetVector(vector[0] * length, vector[1] * length, vector[2] * length); extrude.Update()
-        return self._get_sanitized_polydata(extrude.GetOutput())
+        extrude.SetVector(vector[0] * length, vector[1] * length, vector[2] * length)
+        return self._get_sanitized_polydata(self._run(extrude))
 
-    def perform_revolve(self, profile_data, angle=360):
-        """Revolves a profile around the Y-axis."""
+    def perform_revolve(self, profile_data, angle=360, chord_tolerance=None):
+        """
+        Revolves a profile around the Z-axis. With a chord tolerance (default self.chord_tolerance) the number of
+        segments is the fewest that keep the facets of the outermost profile point within it of the true circle.
+        """
         if not profile_data or profile_data.GetNumberOfPoints() == 0: raise ValueError("Input profile for revolution is empty.")
-        revolve = vtk.vtkRotationalExtrusionFilter(); revolve.SetInputData(profile_data); revolve.SetResolution(60); revolve.SetAngle(angle); revolve.Update()
-        return self._get_sanitized_polydata(revolve.GetOutput())
+        tolerance = self.chord_tolerance if chord_tolerance is None else chord_tolerance
+        points = mesh_arrays.points_array(profile_data); radius = float(np.hypot(points[:, 0], points[:, 1]).max())
+        segments = _arc_segments(radius, angle, tolerance, self.max_segments) if tolerance else 60
+        revolve = vtk.vtkRotationalExtrusionFilter(); revolve.SetInputData(profile_data); revolve.SetResolution(segments); revolve.SetAngle(angle)
+        return self._get_sanitized_polydata(self._run(revolve))
 
     def perform_sweep(self, profile_data, path_data):
         """Sweeps a profile along a path."""
         if not profile_data or profile_data.GetNumberOfPoints() == 0: raise ValueError("Input profile for sweep is empty.")
         if not path_data or path_data.GetNumberOfPoints() == 0: raise ValueError("Input path for sweep is empty.")
-        sweep = vtk.vtkSweepFilter(); sweep.SetInputData(profile_data); sweep.SetSourceData(path_data); sweep.Update()
-        return self._get_sanitized_polydata(sweep.GetOutput())
+        sweep = vtk.vtkSweepFilter(); sweep.SetInputData(profile_data); sweep.SetSourceData(path_data)
+        return self._get_sanitized_polydata(self._run(sweep))
 
-    def perform_loft(self, profiles):
-        """Lofts a surface between two or more profiles."""
+    def perform_loft(self, profiles, chord_tolerance=None):
+        """
+        Lofts a ruled surface between two or more profile polylines. With a chord tolerance (default
+        self.chord_tolerance) the profiles are resampled finely enough for their sharpest curvature, and the
+        strip between two profiles is split only as much as its twist requires; otherwise a fixed 30x30 is used.
+        """
         if not profiles or len(profiles) < 2: raise ValueError("Loft requires at least two profiles.")
         append = vtk.vtkAppendPolyData()
         for pd in profiles:
             if pd and pd.GetNumberOfPoints() > 0: append.AddInputData(pd)
-        append.Update()
-        if append.GetOutput().GetNumberOfPoints() == 0: raise ValueError("None of the selected profiles contain valid geometry.")
-        loft = vtk.vtkRuledSurfaceFilter(); loft.SetInputConnection(append.GetOutputPort()); loft.SetResolution(30, 30); loft.SetOnRatio(1); loft.Update()
-        return self._get_sanitized_polydata(loft.GetOutput())
\ No newline at end of file
+        if self._run(append).GetNumberOfPoints() == 0: raise ValueError("None of the selected profiles contain valid geometry.")
+        tolerance = self.chord_tolerance if chord_tolerance is None else chord_tolerance
+        resolution = _loft_resolution(append.GetOutput(), tolerance, self.max_segments) if tolerance else None
+        loft = vtk.vtkRuledSurfaceFilter(); loft.SetInputConnection(append.GetOutputPort()); loft.SetResolution(*(resolution or (30, 30))); loft.SetOnRatio(1)
+        return self._get_sanitized_polydata(self._run(loft))
+
+    def perform_decimate(self, polydata, target_triangles=None, max_error=None, feature_angle=30.0):
+        """
+        Reduces a mesh towards target_triangles triangles without moving its surface by more than max_error (model
+        units); either may be None but not both. Topology, open borders and edges sharper than feature_angle are kept.
+        Meshes of parallel_decimate_min_cells or more are cut into slabs along their longest axis that are decimated
+        in spawned worker processes with their cut edges pinned, then stitched back together.
+        """
+        if not polydata or polydata.GetNumberOfCells() == 0: raise ValueError("Input mesh for decimation is empty.")
+        if not target_triangles and max_error is None: raise ValueError("Decimation needs a target triangle count or an error bound.")
+        triangle = vtk.vtkTriangleFilter(); triangle.SetInputData(polydata); triangle.PassVertsOff(); triangle.PassLinesOff()
+        source = self._run(triangle); count = source.GetNumberOfCells()
+        if count == 0: raise ValueError("Input mesh for decimation has no surface cells.")
+        reduction = 1.0 - target_triangles / count if target_triangles else 1.0
+        if reduction <= 0: return self._clean_decimated(source)
+        settings = (reduction, max_error, feature_angle)
+        workers = min(self.decimate_workers, count // 2)
+        if workers < 2 or count < self.parallel_decimate_min_cells: return self._clean_decimated(self._decimate(source, *settings))
+        append = vtk.vtkAppendPolyData()
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            pending = [pool.submit(_decimate_to_arrays, settings, self.decimate_refine_steps, arrays, self.profiler is not None) for arrays in _decimation_slabs(source, workers)]
+            for done, future in enumerate(pending, 1):
+                append.AddInputData(self._from_worker(self._await(future)))
+                self.monitor.report(done / len(pending), f"Decimate slab {done}/{len(pending)}"); self.monitor.check()
+        except BaseException:
+            _abandon_pool(pool); raise
+        pool.shutdown(wait=True)
+        stitch = vtk.vtkCleanPolyData(); stitch.SetInputConnection(append.GetOutputPort()); stitch.PointMergingOn(); stitch.SetTolerance(0.0)
+        return self._clean_decimated(self._run(append, stitch))
+
+    def _clean_decimated(self, polydata):
+        """Merges duplicate points only; the fuller profiles fill holes, which would close open borders and add triangles."""
+        return self._get_sanitized_polydata(polydata, 'skip' if self.sanitize_profile == 'skip' else 'fast')
+
+    def _decimate(self, polydata, reduction, max_error, feature_angle):
+        """
+        Decimates a triangle mesh; border vertices are never removed, so slab seams stay intact. vtkDecimatePro only
+        estimates its error, so with max_error the distance of every input vertex to the result is measured and the
+        reduction is bisected, decimate_refine_steps times, down to the largest one found that keeps within it.
+        """
+        result = self._decimate_pass(polydata, reduction, max_error, feature_angle)
+        if max_error is None: return result
+        points = mesh_arrays.points_array(polydata)
+        if _max_deviation(points, result) <= max_error: return result
+        best, low, high = polydata, 0.0, reduction
+        for _ in range(self.decimate_refine_steps):
+            result = self._decimate_pass(polydata, (low + high) / 2, max_error, feature_angle)
+            if _max_deviation(points, result) <= max_error: best, low = result, (low + high) / 2
+            else: high = (low + high) / 2
+        return best
+
+    def _decimate_pass(self, polydata, reduction, max_error, feature_angle):
+        decimate = vtk.vtkDecimatePro(); decimate.SetInputData(polydata); decimate.SetTargetReduction(min(reduction, 1.0)); decimate.PreserveTopologyOn()
+        decimate.SetFeatureAngle(feature_angle); decimate.SplittingOff(); decimate.BoundaryVertexDeletionOff()
+        if max_error is not None: decimate.SetErrorIsAbsolute(1); decimate.SetAbsoluteError(max_error); decimate.AccumulateErrorOn()
+        return self._run(decimate)
+
+def _abandon_pool(pool):
+    """Stops a process pool without waiting for it: queued work is cancelled and busy workers are terminated."""
+    if hasattr(pool, 'terminate_workers'): pool.terminate_workers(); return  # Python 3.14+
+    processes = list((pool._processes or {}).values())  # no public way to stop running work before 3.14
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes: process.terminate()
+
+def _worker_result(ops, result):
+    """A worker's (arrays, trace) return value; trace is the worker profiler's exported stages, or None."""
+    arrays = {key: np.array(array) for key, array in mesh_arrays.polydata_to_arrays(result).items()}
+    return arrays, ops.profiler.export_stages() if ops.profiler is not None else None
+
+def _boolean_pair_to_arrays(settings, arrays1, arrays2, operation_type, profile=False):
+    """Worker-process entry point: runs one pair of an N-ary boolean on plain arrays and returns the result as arrays."""
+    ops = MeshOperations(); ops.boolean_culling, ops.cull_min_cells, ops.cull_max_fraction, ops.cull_margin, ops.sanitize_profile = settings
+    if profile: ops.profiler = StageProfiler()
+    result = ops._combine_pair(mesh_arrays.arrays_to_polydata(arrays1, deep=False), mesh_arrays.arrays_to_polydata(arrays2, deep=False), operation_type)
+    return _worker_result(ops, result)
+
+def _decimation_slabs(polydata, count):
+    """Splits a triangle mesh into count slabs of about equal triangle count along its longest axis, as plain arrays."""
+    points, triangles = mesh_arrays.triangle_arrays(polydata)
+    centers = points[triangles].mean(axis=1); axis = int(np.argmax(np.ptp(points, axis=0)))
+    slab = np.searchsorted(np.quantile(centers[:, axis], np.linspace(0, 1, count + 1)[1:-1]), centers[:, axis])
+    return [mesh_arrays.polydata_to_arrays(mesh_arrays.polydata_from_triangles(points, triangles[slab == i])) for i in range(count) if np.any(slab == i)]
+
+def _decimate_to_arrays(settings, refine_steps, arrays, profile=False):
+    """Worker-process entry point: decimates one slab given as plain arrays and returns the result as arrays."""
+    ops = MeshOperations(); ops.decimate_refine_steps = refine_steps
+    if profile: ops.profiler = StageProfiler()
+    result = ops._decimate(mesh_arrays.arrays_to_polydata(arrays, deep=False), *settings)
+    return _worker_result(ops, result)
+
+def _max_deviation(points, polydata):
+    """Largest distance from any of points to the surface of polydata."""
+    distance = vtk.vtkImplicitPolyDataDistance(); distance.SetInput(polydata); values = vtk.vtkDoubleArray()
+    distance.FunctionValue(numpy_support.numpy_to_vtk(np.ascontiguousarray(points, dtype=np.float64)), values)
+    return float(np.abs(numpy_support.vtk_to_numpy(values)).max()) if values.GetNumberOfTuples() else 0.0
+
+def _arc_segments(radius, angle, tolerance, max_segments):
+    """Fewest segments of an arc of radius and angle (degrees) whose chords stay within tolerance; at least one per 45 degrees."""
+    step = 2 * np.arccos(1 - tolerance / radius) if 0 < tolerance < radius else np.pi / 2
+    return int(min(max_segments, max(np.ceil(abs(angle) / 45), np.ceil(np.radians(abs(angle)) / step), 1)))
+
+def _loft_resolution(polydata, tolerance, max_segments):
+    """
+    (along, across) resolution of vtkRuledSurfaceFilter for the polylines of polydata, or None if it has fewer than
+    two. Along a profile, a chord of length h over curvature k deviates by about h*h*k/8. Between two profiles each
+    cell is a bilinear patch whose two triangles deviate from it by a quarter of its twist p00 - p10 - p01 + p11 out
+    of the patch plane; splitting the strip n times divides that by n, and when the twist dominates the profiles are
+    sampled more finely as well, so both directions share the work.
+    """
+    lines = mesh_arrays.cell_arrays(polydata, 'lines')
+    if lines is None or len(lines[0]) < 3: return None
+    points = mesh_arrays.points_array(polydata); offsets, connectivity = lines; curvature, profiles = 0.0, []
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        p = points[connectivity[start:end]]
+        if len(p) < 2: continue
+        edges = np.diff(p, axis=0); lengths = np.linalg.norm(edges, axis=1)
+        if len(p) > 2:
+            u = edges / np.maximum(lengths, 1e-300)[:, None]; turn = np.arccos(np.clip(np.einsum('ij,ij->i', u[:-1], u[1:]), -1, 1))
+            curvature = max(curvature, float(np.max(turn / np.maximum((lengths[:-1] + lengths[1:]) / 2, 1e-300))))
+        profiles.append((p, np.concatenate([[0.0], np.cumsum(lengths)])))
+    if len(profiles) < 2: return None
+    def twist(along):
+        t = np.linspace(0, 1, along + 1)
+        samples = [np.column_stack([np.interp(t * arc[-1], arc, p[:, i]) for i in range(3)]) for p, arc in profiles]
+        worst = 0.0
+        for a, b in zip(samples[:-1], samples[1:]):
+            normal = np.cross(b[1:] - a[:-1], b[:-1] - a[1:]); normal /= np.maximum(np.linalg.norm(normal, axis=1), 1e-300)[:, None]
+            worst = max(worst, float(np.abs(np.einsum('ij,ij->i', a[:-1] - a[1:] - b[:-1] + b[1:], normal)).max()))
+        return worst
+    length = max(arc[-1] for _, arc in profiles)
+    along = int(min(max_segments, max(1, np.ceil(length / np.sqrt(8 * tolerance / curvature)) if curvature > 0 else 1)))
+    cells = twist(along) * along / (4 * tolerance)  # along * across patches needed for the twist
+    if cells > along * along: along = int(min(max_segments, np.ceil(np.sqrt(cells))))
+    across = int(min(max_segments, max(1, np.ceil(twist(along) / (4 * tolerance)))))
+    return along, across
\ No newline at end of file
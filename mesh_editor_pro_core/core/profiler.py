@@ -0,0 +1,118 @@
+# ===================================================================================
+# Python file : profiler.py
+# Description:
+# Per-stage instrumentation of VTK filter pipelines. Every filter that
+# MeshOperations updates is recorded with its wall time, input and output cell
+# counts and how much process memory changed while it ran, grouped under the
+# operation that ran it. Stages recorded in worker processes are merged back in.
+# Records can be exported in the Chrome trace event format (chrome://tracing,
+# Perfetto). No GUI dependencies.
+# ===================================================================================
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+try: import resource
+except ImportError: resource = None  # Windows: peak memory is not recorded
+
+PAGE_MB = os.sysconf('SC_PAGE_SIZE') / (1024 * 1024) if hasattr(os, 'sysconf') else None
+
+def _peak_rss_mb():
+    if resource is None: return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024  # bytes on macOS, KiB elsewhere
+
+def _rss_mb():
+    """Current resident set size; read from /proc, so None where there is none."""
+    if PAGE_MB is None: return None
+    try:
+        with open('/proc/self/statm', 'rb') as f: return int(f.read().split()[1]) * PAGE_MB
+    except (OSError, ValueError, IndexError): return None
+
+def _input_cells(algorithm):
+    cells = 0
+    for port in range(algorithm.GetNumberOfInputPorts()):
+        for connection in range(algorithm.GetNumberOfInputConnections(port)):
+            data = algorithm.GetInputDataObject(port, connection)
+            if data is not None and hasattr(data, 'GetNumberOfCells'): cells += data.GetNumberOfCells()
+    return cells
+
+class StageProfiler:
+    """
+    Collects timing records from any thread. Operations are spans opened with operation(); stages are the filters
+    updated inside them. Only the most recent max_records stages are kept. A stage's memory is the change in the
+    process's resident size while it ran (rss_delta_mb) and how far it raised the process's peak (peak_growth_mb);
+    both are process-wide, so stages running at the same time on other threads show up in each other's numbers.
+    """
+
+    def __init__(self, enabled=True, max_records=10_000):
+        self.enabled = enabled; self.origin = time.perf_counter(); self.lock = threading.Lock(); self.local = threading.local()
+        self.operations = deque(maxlen=max_records); self.stages = deque(maxlen=max_records); self.next_id = 0
+
+    @contextmanager
+    def operation(self, name):
+        """Groups the stages run by this thread inside the block under one named span."""
+        if not self.enabled: yield; return
+        with self.lock: op_id = self.next_id; self.next_id += 1
+        record = {'id': op_id, 'name': name, 'start': time.perf_counter() - self.origin, 'seconds': None, 'thread': threading.get_ident(), 'status': 'running'}
+        stack = self.local.__dict__.setdefault('stack', []); stack.append(op_id); self.operations.append(record)
+        try: yield; record['status'] = 'ok'
+        except BaseException as e: record['status'] = type(e).__name__; raise
+        finally: record['seconds'] = time.perf_counter() - self.origin - record['start']; stack.pop()
+
+    def update(self, algorithm):
+        """Updates one algorithm and records it as a stage; upstream filters should already be up to date."""
+        if not self.enabled: algorithm.Update(); return
+        rss, peak = _rss_mb(), _peak_rss_mb()
+        start = time.perf_counter(); algorithm.Update(); seconds = time.perf_counter() - start
+        rss_after, peak_after = _rss_mb(), _peak_rss_mb()
+        output = algorithm.GetOutputDataObject(0); stack = getattr(self.local, 'stack', None)
+        self.stages.append({'operation': stack[-1] if stack else None, 'name': algorithm.GetClassName(), 'start': start - self.origin, 'seconds': seconds,
+                            'process': os.getpid(), 'thread': threading.get_ident(), 'input_cells': _input_cells(algorithm),
+                            'output_cells': output.GetNumberOfCells() if hasattr(output, 'GetNumberOfCells') else None,
+                            'output_kb': output.GetActualMemorySize() if output is not None else None,
+                            'rss_delta_mb': rss_after - rss if rss is not None and rss_after is not None else None,
+                            'peak_growth_mb': peak_after - peak if peak is not None else None})
+
+    def export_stages(self):
+        """(origin, stages) for merge() in another process; perf_counter is system-wide, so the origins line the clocks up."""
+        return self.origin, list(self.stages)
+
+    def merge(self, origin, stages):
+        """Adds stages exported by a worker process's profiler under this thread's current operation."""
+        if not self.enabled: return
+        stack = getattr(self.local, 'stack', None); op_id, shift = stack[-1] if stack else None, origin - self.origin
+        for stage in stages: self.stages.append(dict(stage, operation=op_id, start=stage['start'] + shift))
+
+    def clear(self): self.operations.clear(); self.stages.clear()
+
+    def snapshot(self):
+        """Returns (operations, stages) as lists, safe to read while workers keep recording."""
+        return list(self.operations), list(self.stages)
+
+    def summary(self):
+        """Total seconds, call count and largest input per filter class, slowest first."""
+        totals = {}
+        for stage in list(self.stages):
+            entry = totals.setdefault(stage['name'], {'name': stage['name'], 'seconds': 0.0, 'calls': 0, 'max_input_cells': 0})
+            entry['seconds'] += stage['seconds']; entry['calls'] += 1; entry['max_input_cells'] = max(entry['max_input_cells'], stage['input_cells'])
+        return sorted(totals.values(), key=lambda e: -e['seconds'])
+
+    def chrome_trace(self):
+        """The records as a Chrome trace event dictionary: operations and stages as complete ('X') events in microseconds."""
+        operations, stages = self.snapshot(); pid = os.getpid(); events = []
+        for op in operations:
+            events.append({'name': op['name'], 'cat': 'operation', 'ph': 'X', 'pid': pid, 'tid': op['thread'], 'ts': op['start'] * 1e6,
+                           'dur': (op['seconds'] or 0.0) * 1e6, 'args': {'status': op['status']}})
+        for stage in stages:
+            args = {k: stage[k] for k in ('input_cells', 'output_cells', 'output_kb', 'rss_delta_mb', 'peak_growth_mb') if stage[k] is not None}
+            events.append({'name': stage['name'], 'cat': 'stage', 'ph': 'X', 'pid': stage['process'], 'tid': stage['thread'], 'ts': stage['start'] * 1e6, 'dur': stage['seconds'] * 1e6, 'args': args})
+        return {'traceEvents': sorted(events, key=lambda e: (e['ts'], -e['dur'])), 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, file_path):
+        with open(file_path, 'w', encoding='utf-8') as f: json.dump(self.chrome_trace(), f)
\ No newline at end of file
@@ -0,0 +1,32 @@
+# ===================================================================================
+# Python file : progress.py
+# Description:
+# Progress reporting and cancellation for long-running backend work. A monitor
+# observes VTK filter progress events, forwards them to a callback and aborts the
+# running filter once cancellation has been requested. No GUI dependencies.
+# ===================================================================================
+
+class OperationCancelled(Exception):
+    """Raised when a running operation is cancelled through its ProgressMonitor."""
+
+class ProgressMonitor:
+    """Forwards progress of observed VTK algorithms and carries a cancellation flag."""
+
+    def __init__(self, callback=None): self.callback, self.cancelled = callback, False
+    def cancel(self): self.cancelled = True
+
+    def report(self, fraction, stage=""):
+        """Reports progress in [0, 1] for the named stage."""
+        if self.callback: self.callback(float(fraction), stage)
+
+    def observe(self, algorithm):
+        """Attaches progress and abort handling to a VTK algorithm."""
+        algorithm.AddObserver("ProgressEvent", self._on_progress); return algorithm
+
+    def check(self):
+        """Raises OperationCancelled if cancellation was requested."""
+        if self.cancelled: raise OperationCancelled("Operation cancelled.")
+
+    def _on_progress(self, algorithm, event):
+        if self.cancelled: algorithm.SetAbortExecute(1); return
+        self.report(algorithm.GetProgress(), algorithm.GetClassName())
\ No newline at end of file
@@ -0,0 +1,63 @@
+# ===================================================================================
+# Python file : sanitize_cache.py
+# Description:
+# A bounded, least-recently-used cache for sanitized polydata. Repeated boolean
+# operations on unchanged geometry reuse the cleaned mesh and its watertightness
+# verdict instead of running the full sanitization pipeline again.
+# ===================================================================================
+
+import threading
+from collections import OrderedDict
+
+import vtk
+
+class SanitizationCache:
+    """LRU cache keyed on polydata identity, modified time and sanitize profile, bounded by memory."""
+
+    def __init__(self, max_memory_mb=512, max_entries=64):
+        self.max_memory_kb, self.max_entries = int(max_memory_mb * 1024), max_entries
+        self._entries = OrderedDict(); self._memory_kb = 0; self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = 0
+
+    def _key(self, polydata, profile=None):
+        return (polydata.GetAddressAsString("vtkPolyData"), polydata.GetMTime(), profile)
+
+    def get(self, polydata, profile=None):
+        """Returns the cached entry for the polydata sanitized with profile, or None if absent or stale."""
+        with self._lock:
+            key = self._key(polydata, profile); entry = self._entries.get(key)
+            if entry is None or entry['source'].Get() is None or entry['sanitized'].GetMTime() != entry['sanitized_mtime']:
+                if entry is not None: self._discard(key)
+                self.misses += 1; return None
+            self._entries.move_to_end(key); self.hits += 1
+            return entry
+
+    def put(self, polydata, sanitized, is_valid=None, profile=None):
+        """Stores a sanitized result and evicts least-recently-used entries as needed."""
+        with self._lock:
+            key = self._key(polydata, profile)
+            if key in self._entries: self._discard(key)
+            self._purge_dead(); size_kb = sanitized.GetActualMemorySize()
+            if size_kb > self.max_memory_kb: return None
+            source = vtk.vtkWeakReference(); source.Set(polydata)  # tracks the VTK object itself; Python wrappers come and go
+            entry = {'source': source, 'sanitized': sanitized, 'sanitized_mtime': sanitized.GetMTime(), 'is_valid': is_valid, 'size_kb': size_kb}
+            self._entries[key] = entry; self._memory_kb += size_kb
+            while self._entries and (self._memory_kb > self.max_memory_kb or len(self._entries) > self.max_entries):
+                self._discard(next(iter(self._entries))); self.evictions += 1
+            return entry
+
+    def _purge_dead(self):
+        """Drops entries whose source polydata has been deleted; their keys can never match again."""
+        for key in [k for k, e in self._entries.items() if e['source'].Get() is None]: self._discard(key)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key); self._memory_kb -= entry['size_kb']
+
+    def clear(self):
+        with self._lock: self._entries.clear(); self._memory_kb = 0
+
+    def stats(self):
+        """Returns hit/miss counters and current memory use."""
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._entries), 'memory_mb': self._memory_kb / 1024.0, 'max_memory_mb': self.max_memory_kb / 1024.0}
\ No newline at end of file
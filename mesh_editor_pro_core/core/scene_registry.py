@@ -0,0 +1,64 @@
+# ===================================================================================
+# Python file : scene_registry.py
+# Description:
+# Keeps the actors currently in the scene in insertion order with a name index,
+# so membership tests, lookups by name, removal and unique-name generation take
+# constant time regardless of scene size. Pure backend logic with no GUI code.
+# ===================================================================================
+
+class SceneRegistry:
+    """
+    Ordered set of scene actors indexed by name. Iterating, len() and `in` behave like the list it replaces.
+    Names are normally unique; an actor restored by undo after a rename may share one, so the index keeps
+    every actor per name and lookups return the earliest.
+    """
+
+    def __init__(self, actors=()):
+        self._actors = {}      # actor -> None, in insertion order
+        self._by_name = {}     # name -> {actor: None}
+        self._next_suffix = {} # base name -> first numeric suffix worth trying
+        for actor in actors: self.add(actor)
+
+    def __iter__(self): return iter(self._actors)
+    def __len__(self): return len(self._actors)
+    def __bool__(self): return bool(self._actors)
+    def __contains__(self, actor): return actor in self._actors
+    def __getitem__(self, index): return list(self._actors)[index]
+
+    def add(self, actor):
+        if actor in self._actors: return
+        self._actors[actor] = None; self._by_name.setdefault(actor.name, {})[actor] = None
+
+    def remove(self, actor):
+        """Removes an actor; returns False if it was not in the scene."""
+        if actor not in self._actors: return False
+        del self._actors[actor]; self._unindex(actor, actor.name); return True
+
+    def clear(self):
+        self._actors.clear(); self._by_name.clear(); self._next_suffix.clear()
+
+    def find(self, name):
+        """Returns the actor with this name, or None."""
+        actors = self._by_name.get(name)
+        return next(iter(actors)) if actors else None
+
+    def rename(self, actor, new_name):
+        """Renames an actor in the scene, suffixing the name if another actor already uses it; returns the name given."""
+        self._unindex(actor, actor.name)
+        actor.name = self.unique_name(new_name)
+        self._by_name.setdefault(actor.name, {})[actor] = None
+        return actor.name
+
+    def unique_name(self, name, reserved=()):
+        """Returns name if it is free, otherwise the next free name_<n>; also avoids names in reserved."""
+        if name not in self._by_name and name not in reserved: return name
+        i = self._next_suffix.get(name, 1)
+        while f"{name}_{i}" in self._by_name or f"{name}_{i}" in reserved: i += 1
+        self._next_suffix[name] = i + 1
+        return f"{name}_{i}"
+
+    def _unindex(self, actor, name):
+        actors = self._by_name.get(name)
+        if actors is None: return
+        actors.pop(actor, None)
+        if not actors: del self._by_name[name]
\ No newline at end of file
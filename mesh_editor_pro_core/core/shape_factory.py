@@ -0,0 +1,33 @@
+# ===================================================================================
+# Python file : shape_factory.py
+# Description:
+# Builds the parametric 3D primitives offered by the Create 3D menu. Every call
+# creates its own source, so shapes can be built on worker threads for live
+# previews. Pure backend logic with no GUI code.
+# ===================================================================================
+
+import vtk
+
+# shape -> {parameter: (default, minimum, maximum, decimals)}, in the order the dialog shows them
+SHAPE_PARAMETERS = {
+    'cube': {'Size': (1, 0.1, 10, 2)},
+    'sphere': {'Radius': (1, 0.1, 10, 2), 'Resolution': (32, 3, 100, 0)},
+    'cone': {'Radius': (0.5, 0.1, 10, 2), 'Height': (1, 0.1, 10, 2), 'Resolution': (32, 3, 100, 0)},
+    'cylinder': {'Radius': (0.5, 0.1, 10, 2), 'Height': (1, 0.1, 10, 2), 'Resolution': (32, 3, 100, 0)},
+    'pyramid': {'Sides': (4, 3, 12, 0), 'SideLength': (1, 0.1, 10, 2), 'Height': (1, 0.1, 10, 2)},
+}
+
+def default_parameters(shape_type):
+    return {name: spec[0] for name, spec in SHAPE_PARAMETERS[shape_type].items()}
+
+def build_shape(shape_type, values):
+    """Returns a new polydata for a primitive; values maps the parameter names of SHAPE_PARAMETERS to numbers."""
+    if shape_type == 'cube': source = vtk.vtkCubeSource(); source.SetXLength(values['Size']); source.SetYLength(values['Size']); source.SetZLength(values['Size'])
+    elif shape_type == 'sphere': source = vtk.vtkSphereSource(); source.SetRadius(values['Radius']); source.SetThetaResolution(int(values['Resolution'])); source.SetPhiResolution(int(values['Resolution']))
+    elif shape_type in ('cone', 'cylinder'):
+        source = vtk.vtkConeSource() if shape_type == 'cone' else vtk.vtkCylinderSource()
+        source.SetRadius(values['Radius']); source.SetHeight(values['Height']); source.SetResolution(int(values['Resolution']))
+    elif shape_type == 'pyramid': source = vtk.vtkConeSource(); source.SetHeight(values['Height']); source.SetRadius(values['SideLength']); source.SetResolution(int(values['Sides']))
+    else: raise ValueError(f"Unknown shape type '{shape_type}'.")
+    source.Update(); polydata = vtk.vtkPolyData(); polydata.ShallowCopy(source.GetOutput())
+    return polydata
\ No newline at end of file
@@ -0,0 +1,139 @@
+# ===================================================================================
+# Python file : static_batcher.py
+# Description:
+# Optional draw-call batching for scenes of many small objects. Small, untransformed
+# actors that share an appearance (apart from colour) are merged into one actor per
+# appearance, with each object's colour carried as per-cell colours, and the
+# originals are taken out of the renderer while they are batched. Every merged cell
+# records which object and cell it came from, so picks resolve back to the original
+# ManagedActor. Pure VTK logic with no GUI code.
+# ===================================================================================
+
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+SOURCE_INDEX = "source_index"  # cell array: position of the source actor in its batch
+SOURCE_CELL = "source_cell"    # cell array: cell id within the source actor's geometry
+
+class StaticBatcher:
+    """
+    Tracks the scene's actors and, while enabled, draws batchable ones through merged batch actors. Call add()/remove()
+    as actors enter and leave the scene and update() before rendering; update() also picks up edited geometry,
+    appearance or visibility.
+    """
+
+    def __init__(self, renderer, max_cells=20_000, min_group=2):
+        self.renderer, self.max_cells, self.min_group = renderer, max_cells, min_group
+        self.enabled = False
+        self.scene = {}    # actor -> None, every actor in the scene
+        self.members = {}  # actor -> (key, polydata, stamp) for actors assigned to a group
+        self.groups = {}   # key -> {actor: None}
+        self.batches = {}  # key -> (batch actor, [source actors])
+        self.pending, self.dirty = {}, set()  # pending: actor -> None, in scene order
+
+    def set_enabled(self, enabled):
+        if enabled == self.enabled: return
+        self.enabled = enabled
+        if enabled: self.pending.update(self.scene); self.update(); return
+        for batch, _ in self.batches.values(): self.renderer.RemoveActor(batch)
+        for actor in self.members: self.renderer.AddActor(actor)
+        self.members.clear(); self.groups.clear(); self.batches.clear(); self.pending.clear(); self.dirty.clear()
+
+    def add(self, actor):
+        self.scene[actor] = None
+        if self.enabled: self.pending[actor] = None
+
+    def remove(self, actor):
+        """Forgets an actor that left the scene; its command has already taken it out of the renderer."""
+        self.scene.pop(actor, None); self.pending.pop(actor, None)
+        if actor in self.members: self._ungroup(actor)
+
+    def clear(self):
+        for batch, _ in self.batches.values(): self.renderer.RemoveActor(batch)
+        self.scene.clear(); self.members.clear(); self.groups.clear(); self.batches.clear(); self.pending.clear(); self.dirty.clear()
+
+    def update(self):
+        """Regroups added or edited actors and rebuilds the batches whose membership or geometry changed."""
+        if not self.enabled: return
+        for actor, (key, polydata, stamp) in list(self.members.items()):
+            if (actor.GetMTime(), polydata.GetMTime()) != stamp: self._ungroup(actor); self.pending[actor] = None
+        for actor in self.pending:
+            key = self.batch_key(actor)
+            if key is None: self.renderer.AddActor(actor); continue
+            polydata = actor.GetMapper().GetInput(); self.members[actor] = (key, polydata, (actor.GetMTime(), polydata.GetMTime()))
+            self.groups.setdefault(key, {})[actor] = None; self.dirty.add(key)
+        self.pending.clear()
+        for key in self.dirty: self._rebuild(key)
+        self.dirty.clear()
+
+    def resolve(self, prop, cell_id):
+        """Maps a picked prop and cell to the source actor and its own cell id; other props are returned unchanged."""
+        for batch, sources in self.batches.values():
+            if batch is prop and cell_id >= 0:
+                cells = batch.GetMapper().GetInput().GetCellData()
+                return sources[int(cells.GetArray(SOURCE_INDEX).GetValue(cell_id))], int(cells.GetArray(SOURCE_CELL).GetValue(cell_id))
+        return prop, cell_id
+
+    def batch_key(self, actor):
+        """The appearance an actor is batched by, or None if it must be drawn on its own."""
+        mapper = actor.GetMapper(); polydata = mapper.GetInput() if mapper else None
+        if polydata is None or not 0 < polydata.GetNumberOfCells() <= self.max_cells: return None
+        if not actor.GetVisibility() or not actor.GetIsIdentity() or actor.GetTexture() or actor.GetBackfaceProperty(): return None
+        if mapper.GetScalarVisibility() and (polydata.GetPointData().GetScalars() or polydata.GetCellData().GetScalars()): return None
+        look = actor.get_appearance()
+        return (look['opacity'], look['representation'], look['edge_visibility'], tuple(look['edge_color']), look['line_width']) + self._material(actor.GetProperty())
+
+    @staticmethod
+    def _material(prop):
+        """
+        Every vtkProperty setting besides colour that the batch copies from its first source, so merging never changes a
+        look. SetColor also sets the specular colour, which only counts while the material is specular.
+        """
+        return (prop.GetAmbient(), prop.GetDiffuse(), prop.GetSpecular(), prop.GetSpecularPower(), prop.GetSpecularColor() if prop.GetSpecular() else None, prop.GetInterpolation(),
+                prop.GetLighting(), prop.GetPointSize(), prop.GetBackfaceCulling(), prop.GetFrontfaceCulling(), prop.GetVertexVisibility(), prop.GetVertexColor() if prop.GetVertexVisibility() else None,
+                prop.GetRenderPointsAsSpheres(), prop.GetRenderLinesAsTubes(), prop.GetShading(), prop.GetMetallic(), prop.GetRoughness())
+
+    def stats(self):
+        batched = sum(len(sources) for _, sources in self.batches.values())
+        return {'actors': len(self.scene), 'batched': batched, 'batches': len(self.batches), 'draw_calls': len(self.scene) - batched + len(self.batches)}
+
+    def _ungroup(self, actor):
+        key = self.members.pop(actor)[0]; group = self.groups[key]; del group[actor]
+        if not group: del self.groups[key]
+        self.dirty.add(key)
+        if actor in self.scene: self.renderer.AddActor(actor)
+
+    def _rebuild(self, key):
+        old = self.batches.pop(key, None)
+        if old: self.renderer.RemoveActor(old[0])
+        sources = list(self.groups.get(key, ()))
+        if len(sources) < self.min_group:
+            for actor in sources: self.renderer.AddActor(actor)
+            return
+        batch = self._merge(sources); self.renderer.AddActor(batch); self.batches[key] = (batch, sources)
+        for actor in sources: self.renderer.RemoveActor(actor)
+
+    def _merge(self, sources):
+        """Appends the sources' geometry and tags each merged cell with its colour, source actor and source cell id."""
+        append, counts = vtk.vtkAppendPolyData(), np.empty((len(sources), 4), dtype=np.int64)
+        for i, actor in enumerate(sources):
+            polydata = actor.GetMapper().GetInput(); append.AddInputData(polydata)
+            counts[i] = polydata.GetNumberOfVerts(), polydata.GetNumberOfLines(), polydata.GetNumberOfPolys(), polydata.GetNumberOfStrips()
+        append.Update(); merged = vtk.vtkPolyData(); merged.ShallowCopy(append.GetOutput())
+        # The append filter emits all verts, then all lines, polys and strips, each in source order.
+        index, cell, first = [], [], np.cumsum(counts, axis=1) - counts
+        for kind in range(4):
+            owner = np.repeat(np.arange(len(sources)), counts[:, kind]); starts = np.cumsum(counts[:, kind]) - counts[:, kind]
+            index.append(owner); cell.append(first[owner, kind] + np.arange(len(owner)) - starts[owner])
+        index, cell = np.concatenate(index), np.concatenate(cell)
+        colours = np.clip(np.round(np.array([actor.GetProperty().GetColor() for actor in sources]) * 255), 0, 255).astype(np.uint8)
+        cells = merged.GetCellData(); cells.SetScalars(self._array(colours[index], "Colors"))
+        cells.AddArray(self._array(index.astype(np.int32), SOURCE_INDEX)); cells.AddArray(self._array(cell.astype(np.int32), SOURCE_CELL))
+        mapper = vtk.vtkPolyDataMapper(); mapper.SetInputData(merged); mapper.SetScalarModeToUseCellData(); mapper.SetColorModeToDirectScalars(); mapper.ScalarVisibilityOn()
+        batch = vtk.vtkActor(); batch.SetMapper(mapper); batch.GetProperty().DeepCopy(sources[0].GetProperty())
+        return batch
+
+    @staticmethod
+    def _array(values, name):
+        array = numpy_support.numpy_to_vtk(np.ascontiguousarray(values), deep=True); array.SetName(name); return array
\ No newline at end of file
@@ -1,24 +1,69 @@
 # ===================================================================================
 # Python file : working_plane.py
 # Description:
-# This module defines the backend logic for the working plane, including the
-# fix for the vtk.vtkMath.Cross method.
+# This module defines the backend logic for the working plane: an orthonormal
+# frame built directly from the origin and normal, cached as a 4x4 matrix, and
+# vectorized placement of 2D sketch geometry onto the plane.
 # ===================================================================================
 
+import numpy as np
 import vtk
+from vtk.util import numpy_support
+
+from mesh_editor_pro_core.core import mesh_arrays
 
 class WorkingPlane:
     """Manages the state of the active 2D working plane."""
 
     def __init__(self):
-        self.plane = vtk.vtkPlane(); self.transform = vtk.vtkTransform(); self.is_active = False; self.reset()
+        self.plane = vtk.vtkPlane(); self.transform = vtk.vtkTransform(); self.matrix = np.eye(4); self.is_active = False; self.reset()
+
     def set_from_origin_normal(self, origin, normal):
-        if vtk.vtkVector3d(normal).Norm() == 0: raise ValueError("Plane normal cannot be a zero vector.")
-        self.plane.SetOrigin(origin); self.plane.SetNormal(normal); self._generate_transform(); self.is_active = True
-    def _generate_transform(self):
-        normal = self.plane.GetNormal(); origin = self.plane.GetOrigin(); z_axis = (0, 0, 1)
-        axis = [0, 0, 0]; vtk.vtkMath.Cross(z_axis, normal, axis)
-        angle = vtk.vtkMath.DegreesFromRadians(vtk.vtkMath.AngleBetweenVectors(z_axis, normal))
-        self.transform.Identity(); self.transform.Translate(origin); self.transform.RotateWXYZ(angle, axis); self.transform.Update()
+        normal = np.asarray(normal, dtype=np.float64); length = np.linalg.norm(normal)
+        if length == 0: raise ValueError("Plane normal cannot be a zero vector.")
+        self.plane.SetOrigin(origin); self.plane.SetNormal(normal); self._generate_transform(np.asarray(origin, dtype=np.float64), normal / length); self.is_active = True
+
+    def _generate_transform(self, origin, normal):
+        """
+        Builds the plane frame as the smallest rotation taking +Z to the normal, in closed form, so sketches keep the
+        orientation they had with the former axis-angle construction; a normal along -Z flips about X.
+        """
+        c = normal[2]
+        if c < -1 + 1e-12: rotation = np.diag([1.0, -1.0, -1.0])
+        else:
+            v = np.array([-normal[1], normal[0], 0.0])  # (0, 0, 1) x normal
+            skew = np.array([[0, -v[2], v[1]], [v[2], 0, -v[0]], [-v[1], v[0], 0]])
+            rotation = np.eye(3) + skew + skew @ skew / (1 + c)
+        self.matrix = np.eye(4); self.matrix[:3, :3] = rotation; self.matrix[:3, 3] = origin
+        self.transform.SetMatrix(self.matrix.ravel().tolist())
+
     def get_transform(self): return self.transform
-    def reset(self): self.set_from_origin_normal((0, 0, 0), (0, 0, 1)); self.is_active = False
\ No newline at end of file
+
+    def reset(self): self.set_from_origin_normal((0, 0, 0), (0, 0, 1)); self.is_active = False
+
+    def to_world(self, points):
+        """Maps an (N, 2) or (N, 3) array of plane coordinates to (N, 3) world coordinates in one pass."""
+        points = np.asarray(points, dtype=np.float64)
+        if points.shape[1] == 2: points = np.column_stack([points, np.zeros(len(points))])
+        return points @ self.matrix[:3, :3].T + self.matrix[:3, 3]
+
+    def place(self, polydata):
+        """Moves polydata drawn in plane coordinates onto the plane, in place, normals included; returns it."""
+        mesh_arrays.transform_points(polydata, self.matrix); return polydata
+
+    def place_profiles(self, profiles, closed=True):
+        """
+        Builds one polydata holding every 2D profile ((K, 2) arrays of plane coordinates) as one cell each, in order,
+        with all points mapped onto the plane in a single vectorized pass. Closed profiles become polygons, open
+        ones polylines.
+        """
+        counts = np.array([len(p) for p in profiles], dtype=np.int64)
+        flat = np.concatenate([np.asarray(p, dtype=np.float64).reshape(-1, 2) for p in profiles]) if len(counts) else np.empty((0, 2))
+        points = vtk.vtkPoints(); points.SetData(numpy_support.numpy_to_vtk(self.to_world(flat), deep=True))
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64); np.cumsum(counts, out=offsets[1:])
+        cells = vtk.vtkCellArray()
+        cells.SetData(numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=True), numpy_support.numpy_to_vtkIdTypeArray(np.arange(len(flat), dtype=np.int64), deep=True))
+        polydata = vtk.vtkPolyData(); polydata.SetPoints(points)
+        if closed: polydata.SetPolys(cells)
+        else: polydata.SetLines(cells)
+        return polydata
\ No newline at end of file
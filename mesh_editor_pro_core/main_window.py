@@ -7,20 +7,35 @@
 
 import vtk
 import os
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QDockWidget, QListWidget, QListWidgetItem,
+import numpy as np
+import tempfile
+from contextlib import contextmanager
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QDockWidget,
                              QTabWidget, QTextEdit, QLineEdit, QVBoxLayout, QHBoxLayout,
-                             QInputDialog, QMenu, QMessageBox, QFileDialog, QAbstractItemView, QStatusBar)
-from PyQt5.QtCore import Qt
+                             QInputDialog, QMenu, QMessageBox, QFileDialog, QAbstractItemView, QStatusBar,
+                             QProgressBar, QPushButton, QLabel)
+from PyQt5.QtCore import Qt, QTimer
 from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 
 from mesh_editor_pro_core.core.commands import *
+from mesh_editor_pro_core.core.history import HistoryManager
+from mesh_editor_pro_core.core.lod import build_lod_levels
+from mesh_editor_pro_core.core.scene_registry import SceneRegistry
+from mesh_editor_pro_core.core.shape_factory import SHAPE_PARAMETERS, build_shape, default_parameters
+from mesh_editor_pro_core.core.static_batcher import StaticBatcher
 from mesh_editor_pro_core.core.managed_actor import ManagedActor
 from mesh_editor_pro_core.core.operations import MeshOperations
 from mesh_editor_pro_core.core.working_plane import WorkingPlane
 from mesh_editor_pro_core.core.plugin_manager import PluginManager
+from mesh_editor_pro_core.core.profiler import StageProfiler
 from mesh_editor_pro_core.ui.dialogs import *
 from mesh_editor_pro_core.ui.menu_setup import MenuSetup
 from mesh_editor_pro_core.ui.custom_interactor import PickingInteractorStyle
+from mesh_editor_pro_core.ui.background_task import BackgroundTask
+from mesh_editor_pro_core.ui.live_preview import LivePreview
+from mesh_editor_pro_core.ui.profiler_panel import ProfilerPanel
+from mesh_editor_pro_core.ui.render_scheduler import RenderScheduler
+from mesh_editor_pro_core.ui.scene_model import SceneListModel, SceneListView
 from mesh_editor_pro_core.utils.file_io import FileHandler
 
 class MeshCreatorApp(QMainWindow):
@@ -33,12 +48,19 @@ class MeshCreatorApp(QMainWindow):
         
         self.file_handler = FileHandler()
         self.mesh_ops = MeshOperations()
+        self.profiler = StageProfiler(); self.mesh_ops.profiler = self.profiler  # times every filter stage for the Profiler tab
         self.working_plane = WorkingPlane()
         
-        self.actors = []; self.actor_count = 0
-        self.undo_stack = []; self.redo_stack = []
-        self.current_project_path = None
+        self.actors = SceneRegistry(); self.actor_count = 0
+        self.scene_model = SceneListModel()  # shared by the object browser and selection dialogs
+        self.history = HistoryManager()
+        self.current_project_path = None; self.project_modified = False
         self.plane_visual_actor = None
+        self.active_task = None
+        self.pending_commands = None  # commands executed inside an open transaction()
+        self.autosave_task = None; self.autosave_needed = False; self.autosave_interval_ms = 5 * 60 * 1000
+        self.lod_min_cells = 200_000; self.lod_queue = []; self.lod_task = None
+        self.pick_locator_min_cells = 50_000; self.large_actors = {}  # meshes this large are picked through a cached cell locator
         
         self.setup_ui_layout()
         self.setup_vtk()
@@ -50,6 +72,8 @@ class MeshCreatorApp(QMainWindow):
         
         self.interactor.Initialize()
         self.update_plane_visuals()
+        self.autosave_timer = QTimer(self); self.autosave_timer.timeout.connect(self.autosave); self.autosave_timer.start(self.autosave_interval_ms)
+        self.update_history_status()
         self.log_message("info", "Application initialized successfully.")
 
     def setup_ui_layout(self):
@@ -60,10 +84,10 @@ class MeshCreatorApp(QMainWindow):
         self.left_dock = QDockWidget("Tools", self)
         self.left_tabs = QTabWidget()
         self.cmd_win = QTextEdit(); self.cmd_win.setReadOnly(True)
-        self.obj_browser = QListWidget()
-        self.obj_browser.itemDoubleClicked.connect(self.rename_item)
-        self.obj_browser.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.obj_browser.customContextMenuRequested.connect(self.browser_context_menu)
+        self.obj_browser = SceneListView(self.scene_model, QAbstractItemView.ExtendedSelection)
+        self.obj_browser.view.doubleClicked.connect(lambda index: self.rename_actor(self.obj_browser.proxy.actor(index)))
+        self.obj_browser.view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.obj_browser.view.customContextMenuRequested.connect(self.browser_context_menu)
         self.left_tabs.addTab(self.cmd_win, "Command"); self.left_tabs.addTab(self.obj_browser, "Browser")
         self.left_dock.setWidget(self.left_tabs)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.left_dock)
@@ -76,11 +100,18 @@ class MeshCreatorApp(QMainWindow):
         self.py_out = QTextEdit(); self.py_out.setReadOnly(True)
         self.py_in = QLineEdit(); self.py_in.returnPressed.connect(self.execute_py_command)
         console_layout.addWidget(self.py_out); console_layout.addWidget(self.py_in)
-        self.bottom_tabs.addTab(self.err_log, "Error Log"); self.bottom_tabs.addTab(console_widget, "Python Console")
+        self.profiler_panel = ProfilerPanel(self.profiler)
+        self.bottom_tabs.addTab(self.err_log, "Error Log"); self.bottom_tabs.addTab(console_widget, "Python Console"); self.bottom_tabs.addTab(self.profiler_panel, "Profiler")
+        self.bottom_tabs.currentChanged.connect(lambda index: self.profiler_panel.refresh() if self.bottom_tabs.widget(index) is self.profiler_panel else None)
         self.bottom_dock.setWidget(self.bottom_tabs)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.bottom_dock)
         
         self.setStatusBar(QStatusBar(self))
+        self.task_progress = QProgressBar(); self.task_progress.setRange(0, 100); self.task_progress.setMaximumWidth(200); self.task_progress.hide()
+        self.task_cancel_btn = QPushButton("Cancel"); self.task_cancel_btn.clicked.connect(self.cancel_operation); self.task_cancel_btn.hide()
+        self.history_label = QLabel(); self.history_label.setToolTip("Memory held by undo/redo geometry (spilled to disk in brackets).")
+        self.statusBar().addPermanentWidget(self.history_label)
+        self.statusBar().addPermanentWidget(self.task_progress); self.statusBar().addPermanentWidget(self.task_cancel_btn)
         self.show_status_message("Ready.")
 
     def setup_vtk(self):
@@ -88,165 +119,324 @@ class MeshCreatorApp(QMainWindow):
         self.layout.addWidget(self.vtk_widget, 1)
         self.renderer = vtk.vtkRenderer(); self.renderer.SetBackground(0.1, 0.2, 0.4)
         self.vtk_widget.GetRenderWindow().AddRenderer(self.renderer)
+        self.batcher = StaticBatcher(self.renderer)  # merges small objects into fewer draw calls when enabled
+        self.render_scheduler = RenderScheduler(self.vtk_widget.GetRenderWindow(), self.renderer, self.batcher.update, parent=self)
         self.interactor = self.vtk_widget.GetRenderWindow().GetInteractor()
         self.def_style = vtk.vtkInteractorStyleTrackballCamera()
-        self.pick_style = PickingInteractorStyle(self.on_surface_picked)
+        self.pick_style = PickingInteractorStyle(self.on_surface_picked, self.batcher.resolve, self._prepare_picker)
         self.interactor.SetInteractorStyle(self.def_style)
 
     def execute_command(self, command, log_msg=""):
+        if self.pending_commands is not None:
+            command.execute(); self.pending_commands.append(command); self._sync_actors_from_command(command, is_undo=False); return
         try:
             command.execute()
-            self.undo_stack.append(command)
-            self.redo_stack.clear()
+            self.history.push(command)
             self._sync_actors_from_command(command, is_undo=False)
+            self._set_modified(); self.trim_history()
             self.reset_camera_view()
             self.log_message('info', log_msg)
             self.show_status_message("Operation successful.")
         except Exception as e:
             self.log_message('error', f"Command failed: {e}")
 
+    @contextmanager
+    def transaction(self, log_msg="Batch edit"):
+        """
+        Groups every execute_command() inside the block into one undo step. The browser, camera reset, render and log
+        are updated once when the block ends; if it raises, the commands executed so far are undone. Nested blocks
+        join the outermost one.
+        """
+        if self.pending_commands is not None: yield; return
+        self.pending_commands = []
+        try: yield
+        except BaseException:
+            commands = self.pending_commands
+            try:
+                for command in reversed(commands): command.undo(); self._sync_actors_from_command(command, is_undo=True)
+            finally: self.pending_commands = None
+            self.request_render()
+            if commands: self.log_message('warning', f"{log_msg} rolled back ({len(commands)} commands).")
+            raise
+        commands, self.pending_commands = self.pending_commands, None
+        if not commands: return
+        command = commands[0] if len(commands) == 1 else MacroCommand(commands)
+        self._update_browser(command.added_actors(), command.removed_actors()); self.history.push(command)
+        self._set_modified(); self.trim_history(); self.reset_camera_view()
+        self.log_message('info', f"{log_msg} ({len(commands)} commands)."); self.show_status_message("Operation successful.")
+
     def undo(self):
-        if not self.undo_stack:
+        if not self.history.can_undo():
             return
         try:
-            command = self.undo_stack.pop()
-            command.undo()
-            self.redo_stack.append(command)
+            command = self.history.undo()
+            try: command.undo()
+            except Exception: self.history.cancel_undo(); raise
             self._sync_actors_from_command(command, is_undo=True)
+            self._set_modified(); self.trim_history()
             self.reset_camera_view()
             self.log_message('info', "Undo performed.")
         except Exception as e:
             self.log_message('error', f"Undo failed: {e}")
 
     def redo(self):
-        if not self.redo_stack:
+        if not self.history.can_redo():
             return
         try:
-            command = self.redo_stack.pop()
-            command.execute()
-            self.undo_stack.append(command)
+            command = self.history.redo()
+            try: command.execute()
+            except Exception: self.history.cancel_redo(); raise
             self._sync_actors_from_command(command, is_undo=False)
+            self._set_modified(); self.trim_history()
             self.reset_camera_view()
             self.log_message('info', "Redo performed.")
         except Exception as e:
             self.log_message('error', f"Redo failed: {e}")
 
     def new_project(self):
-        self.renderer.RemoveAllViewProps(); self.actors.clear(); self.undo_stack.clear()
-        self.redo_stack.clear(); self.actor_count = 0; self.obj_browser.clear()
-        self.current_project_path = None; self.reset_working_plane()
+        self.renderer.RemoveAllViewProps(); self.actors.clear(); self.batcher.clear(); self.history.clear(); self.update_history_status()
+        self.actor_count = 0; self.scene_model.reset(); self.lod_queue.clear(); self.large_actors.clear()
+        if self.lod_task: self.lod_task.cancel()
+        self.current_project_path = None; self.mesh_ops.sanitize_cache.clear(); self.reset_working_plane()
+        self._set_modified(False)
         self.log_message('info', "New project started.")
 
     def open_project(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Open", "", "3D Files(*.stl *.ply *.vtk *.obj *.vtp)")
-        if path: self.import_file(path)
+        path, _ = QFileDialog.getOpenFileName(self, "Open", "", "Projects and 3D Files(*.mep *.stl *.ply *.vtk *.obj *.vtp)")
+        if not path: return
+        if not path.lower().endswith('.mep'): self.import_file(path); return
+        try: objects = self.file_handler.load_project(path)
+        except Exception as e: self.log_message('error', str(e)); return
+        self.new_project()
+        for obj in objects:
+            actor = self._create_actor_from_polydata(obj['polydata'], obj['name'], execute=False)
+            if not actor: continue
+            actor.apply_appearance(obj['appearance']); self.renderer.AddActor(actor); self._add_actor_to_scene(actor)
+            actor.saved_blocks[path] = dict(obj['saved'], mtime=obj['polydata'].GetMTime())
+        self.current_project_path = path; self._set_modified(False); self.reset_camera_view()
+        self.log_message('info', f"Opened {path} ({len(objects)} objects).")
 
     def save_project(self):
         if not self.current_project_path: self.save_project_as(); return
         try:
             self.file_handler.save_project(self.current_project_path, self.actors)
+            self._set_modified(False)
             self.log_message('info', f"Saved to {self.current_project_path}.")
         except Exception as e: self.log_message('error', str(e))
 
     def save_project_as(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save As", "", "STL(*.stl);;PLY(*.ply);;VTK(*.vtk);;OBJ(*.obj);;VTP(*.vtp)")
+        path, _ = QFileDialog.getSaveFileName(self, "Save As", "", "Mesh Editor Project(*.mep);;STL(*.stl);;PLY(*.ply);;VTK(*.vtk);;OBJ(*.obj);;VTP(*.vtp)")
         if path:
             try:
                 self.file_handler.save_project(path, self.actors)
-                self.current_project_path = path
+                self.current_project_path = path; self._set_modified(False)
                 self.log_message('info', f"Saved to {path}.")
             except Exception as e: self.log_message('error', str(e))
 
+    def autosave(self):
+        """Writes changed objects to the autosave project on a worker thread."""
+        if not self.autosave_needed or self.autosave_task or not self.actors: return
+        path, project = self._autosave_path(), self.file_handler.project
+        try: items = project.snapshot(path, self.actors)
+        except Exception as e: self.log_message('warning', f"Autosave skipped: {e}"); return
+        task = BackgroundTask(lambda monitor: project.write(path, items))
+        task.signals.finished.connect(lambda result: self._on_autosave_done(path, items, result))
+        task.signals.failed.connect(lambda msg: self._on_autosave_done(path, items, None, msg))
+        self.autosave_needed = False; self.autosave_task = task.start()
+
+    def _on_autosave_done(self, path, items, result, error=None):
+        self.autosave_task = None; self.trim_history()
+        if error: self.autosave_needed = True; self.log_message('warning', f"Autosave failed: {error}"); return
+        self.file_handler.project.commit(path, items, result)
+        self.show_status_message(f"Autosaved {len(items)} objects ({result[2] / (1024 * 1024):.1f} MB written).")
+
+    def _autosave_path(self):
+        if self.current_project_path: return os.path.splitext(self.current_project_path)[0] + ".autosave.mep"
+        return os.path.join(tempfile.gettempdir(), "mesh_editor_autosave.mep")
+
+    def _set_modified(self, modified=True):
+        self.project_modified = modified; self.autosave_needed = self.autosave_needed or modified
+        name = os.path.basename(self.current_project_path) if self.current_project_path else "Untitled"
+        self.setWindowTitle(f"Mesh Editor Pro - {name}{'*' if modified else ''}")
+
     def import_file(self, path=None):
-        if not path:
-            path, _ = QFileDialog.getOpenFileName(self, "Import", "", "3D Files(*.stl *.ply *.vtk *.obj *.vtp)")
-        if path:
-            try:
-                self._create_actor_from_polydata(self.file_handler.import_file(path), name=os.path.basename(path))
-                self.log_message('info', f"Imported: {path}")
-            except Exception as e: self.log_message('error', str(e))
+        paths = [path] if path else QFileDialog.getOpenFileNames(self, "Import", "", "3D Files(*.stl *.ply *.vtk *.obj *.vtp)")[0]
+        if paths: self.import_files(paths)
+
+    def import_directory(self):
+        directory = QFileDialog.getExistingDirectory(self, "Import Directory")
+        if not directory: return
+        paths = self.file_handler.find_mesh_files(directory)
+        if not paths: self.log_message('warning', f"No importable mesh files in {directory}."); return
+        self.import_files(paths)
+
+    def import_files(self, paths):
+        """Parses the files in parallel on a worker thread and adds all of them as one undoable step."""
+        label = f"Import {os.path.basename(paths[0])}" if len(paths) == 1 else f"Import {len(paths)} files"
+        self.run_task(label, lambda monitor: self.file_handler.import_files(paths, monitor), self._on_files_imported)
+
+    def _on_files_imported(self, result):
+        meshes, errors = result
+        for path, msg in errors: self.log_message('error', msg)
+        taken, actors = set(), []
+        for path, pd in meshes:
+            actor = self._create_actor_from_polydata(pd, self.actors.unique_name(os.path.basename(path), taken), execute=False)
+            if actor: taken.add(actor.name); actors.append(actor)
+        if not actors: return
+        names = actors[0].name if len(actors) == 1 else f"{len(actors)} files"
+        self.execute_command(AddActorsCommand(self.renderer, actors) if len(actors) > 1 else AddActorCommand(self.renderer, actors[0]), f"Imported {names}.")
+
+    def run_operation(self, label, operation, on_success, inputs=()):
+        """Runs operation(mesh_ops) on a worker thread and hands the result to on_success on the GUI thread."""
+        return self.run_task(label, lambda monitor: operation(self.mesh_ops.with_monitor(monitor)), on_success, inputs)
+
+    def run_task(self, label, fn, on_success, inputs=()):
+        """Runs fn(monitor) on a worker thread with status-bar progress and cancel, then calls on_success(result)."""
+        if self.active_task: self.log_message('warning', "Another operation is still running."); return None
+        task = BackgroundTask(lambda monitor: self._profiled(label, fn, monitor))
+        task.signals.progress.connect(lambda value, stage: self._on_task_progress(label, value, stage))
+        task.signals.finished.connect(lambda result: self._on_task_finished(label, on_success, inputs, result))
+        task.signals.failed.connect(lambda msg: self._end_task() or self.log_message('error', f"{label} failed: {msg}"))
+        task.signals.cancelled.connect(lambda: self._end_task() or self.log_message('warning', f"{label} cancelled."))
+        self.active_task = task; self.task_progress.setValue(0); self.task_progress.show(); self.task_cancel_btn.show()
+        self.log_message('info', f"{label} started..."); return task.start()
+
+    def cancel_operation(self):
+        if self.active_task: self.active_task.cancel(); self.show_status_message("Cancelling...")
+
+    def _on_task_progress(self, label, value, stage):
+        self.task_progress.setValue(int(value * 100)); self.show_status_message(f"{label}: {stage}", 0)
+
+    def _on_task_finished(self, label, on_success, inputs, result):
+        self._end_task()
+        if any(a not in self.actors for a in inputs): self.log_message('warning', f"{label} discarded: its input objects changed while it was running."); return
+        try: on_success(result)
+        except Exception as e: self.log_message('error', f"{label} failed: {e}")
+
+    def _end_task(self):
+        self.active_task = None; self.task_progress.hide(); self.task_cancel_btn.hide(); self.show_status_message("Ready."); self.trim_history()
+        if self.bottom_tabs.currentWidget() is self.profiler_panel: self.profiler_panel.refresh()
+
+    def _profiled(self, label, fn, *args):
+        """Runs fn(*args) as one named operation in the profiler, so its filter stages are grouped under label."""
+        with self.profiler.operation(label): return fn(*args)
+
+    def trim_history(self):
+        """Offloads undo/redo geometry over the history budget; waits while a worker thread may still read it."""
+        if not self.active_task and not self.autosave_task:
+            try: self.history.trim(self.actors)
+            except Exception as e: self.log_message('warning', f"Could not offload undo history: {e}")
+        self.update_history_status()
+
+    def update_history_status(self):
+        stats = self.history.stats()
+        self.history_label.setText(f"History: {stats['memory_mb']:.0f} MB" + (f" (+{stats['disk_mb']:.0f} MB disk)" if stats['disk_mb'] >= 0.5 else ""))
+
+    def set_history_budget(self):
+        value, ok = QInputDialog.getInt(self, "Undo History", "Memory budget for undo/redo geometry (MB):", self.history.memory_budget_mb, 16, 1024 * 1024)
+        if ok: self.history.memory_budget_mb = value; self.trim_history(); self.log_message('info', f"Undo history budget set to {value} MB.")
+
+    def set_chord_tolerance(self):
+        value, ok = QInputDialog.getDouble(self, "Tessellation Tolerance", "Max revolve/loft deviation from the true surface\n(model units, 0 = fixed resolution):", self.mesh_ops.chord_tolerance or 0.0, 0.0, 1e6, 6)
+        if not ok: return
+        self.mesh_ops.chord_tolerance = value or None
+        self.log_message('info', f"Tessellation tolerance set to {value:g}." if value else "Revolve and loft use a fixed resolution.")
+
+    def set_sanitize_profile(self, profile):
+        """Selects how thoroughly operation results are cleaned; booleans always use at least 'standard'."""
+        self.mesh_ops.sanitize_profile = profile; self.log_message('info', f"Sanitize profile set to '{profile}'.")
+
+    def _commit_result(self, polydata, name, make_command, log_msg):
+        new_actor = self._create_actor_from_polydata(polydata, name, execute=False)
+        if new_actor: self.execute_command(make_command(new_actor), log_msg)
 
     def perform_boolean_gui(self, op_type):
         if len(self.actors) < 2: self.log_message('warning', "Need at least two meshes."); return
-        dialog = ObjectSelectionDialog("Select 2 Meshes", self.actors, QAbstractItemView.ExtendedSelection, self)
-        if dialog.exec_() and len(dialog.sel) == 2:
+        title = "Select Meshes (first is the target)" if op_type == 'difference' else "Select 2 or More Meshes"
+        dialog = ObjectSelectionDialog(title, self.scene_model, QAbstractItemView.ExtendedSelection, self)
+        if not dialog.exec_(): return
+        if len(dialog.sel) < 2: self.log_message('warning', "Select at least two meshes."); return
+        if len(dialog.sel) == 2:
             a1, a2 = dialog.sel
-            self.log_message('info', f"Performing {op_type}...")
-            try:
-                result_pd = self.mesh_ops.perform_boolean(a1.GetMapper().GetInput(), a2.GetMapper().GetInput(), op_type)
-                new_actor = self._create_actor_from_polydata(result_pd, f"{op_type}_result", execute=False)
-                self.execute_command(BooleanOperationCommand(self.renderer, new_actor, a1, a2), "Boolean successful.")
-            except Exception as e: self.log_message('error', f"Boolean failed: {e}")
-            
+            pd1, pd2 = a1.GetMapper().GetInput(), a2.GetMapper().GetInput()
+            self.run_operation(f"Boolean {op_type}", lambda ops: ops.perform_boolean(pd1, pd2, op_type),
+                               lambda pd: self._commit_result(pd, f"{op_type}_result", lambda new: BooleanOperationCommand(self.renderer, new, a1, a2), "Boolean successful."), inputs=(a1, a2))
+            return
+        actors = list(dialog.sel); polydatas = [a.GetMapper().GetInput() for a in actors]
+        self.run_operation(f"Boolean {op_type} of {len(actors)} meshes", lambda ops: ops.perform_boolean_nary(polydatas, op_type),
+                           lambda pd: self._commit_result(pd, f"{op_type}_result", lambda new: NaryBooleanCommand(self.renderer, new, actors), f"Boolean of {len(actors)} meshes successful."), inputs=actors)
+
+    def decimate_gui(self):
+        dialog = ObjectSelectionDialog("Select Mesh to Decimate", self.scene_model, QAbstractItemView.SingleSelection, self)
+        if not dialog.exec_() or not dialog.sel: return
+        actor = dialog.sel[0]; polydata = actor.GetMapper().GetInput(); count = polydata.GetNumberOfCells()
+        if count < 8: self.log_message('warning', f"'{actor.name}' is too small to decimate."); return
+        diagonal = np.linalg.norm(np.subtract(*np.reshape(polydata.GetBounds(), (3, 2)).T))
+        param_dialog = ParameterDialog({'Target Triangles': (count // 2, 4, count, 0), 'Max Error (0 = none)': (0, 0, diagonal / 10, 6), 'Feature Angle': (30, 0, 180, 0)}, self)
+        if not param_dialog.exec_(): return
+        values = param_dialog.getValues(); target, max_error = int(values['Target Triangles']), values['Max Error (0 = none)'] or None
+        commit = lambda pd: self._commit_result(pd, f"{actor.name}_dec", lambda new: ReplaceActorCommand(self.renderer, new, actor), f"Decimated '{actor.name}' from {count:,} to {pd.GetNumberOfCells():,} triangles.")
+        self.run_operation("Decimate", lambda ops: ops.perform_decimate(polydata, target, max_error, values['Feature Angle']), commit, inputs=(actor,))
+
     def extrude_gui(self):
-        dialog = ObjectSelectionDialog("Select Profile to Extrude", self.actors, QAbstractItemView.SingleSelection, self)
+        dialog = ObjectSelectionDialog("Select Profile to Extrude", self.scene_model, QAbstractItemView.SingleSelection, self)
         if dialog.exec_() and dialog.sel:
-            actor = dialog.sel[0]
+            actor = dialog.sel[0]; profile = vtk.vtkPolyData(); profile.ShallowCopy(actor.GetMapper().GetInput())
             param_dialog = ParameterDialog({'Length': (1, 0.1, 100, 2)}, self)
-            if param_dialog.exec_():
-                try:
-                    length = param_dialog.getValues()['Length']
-                    new_pd = self.mesh_ops.perform_extrude(actor.GetMapper().GetInput(), length)
-                    new_actor = self._create_actor_from_polydata(new_pd, f"{actor.name}_ext", execute=False)
-                    self.execute_command(ReplaceActorCommand(self.renderer, new_actor, actor), "Extrude successful.")
-                except Exception as e: self.log_message('error', f"Extrude failed: {e}")
+            values, built = self._exec_with_preview(param_dialog, lambda monitor, v: self.mesh_ops.with_monitor(monitor).perform_extrude(profile, v['Length']))
+            if values is None: return
+            commit = lambda pd: self._commit_result(pd, f"{actor.name}_ext", lambda new: ReplaceActorCommand(self.renderer, new, actor), "Extrude successful.")
+            if built is not None: commit(built); return
+            self.run_operation("Extrude", lambda ops: ops.perform_extrude(profile, values['Length']), commit, inputs=(actor,))
 
     def revolve_gui(self):
-        dialog = ObjectSelectionDialog("Select Profile to Revolve", self.actors, QAbstractItemView.SingleSelection, self)
+        dialog = ObjectSelectionDialog("Select Profile to Revolve", self.scene_model, QAbstractItemView.SingleSelection, self)
         if dialog.exec_() and dialog.sel:
-            actor = dialog.sel[0]
+            actor = dialog.sel[0]; profile = vtk.vtkPolyData(); profile.ShallowCopy(actor.GetMapper().GetInput())
             param_dialog = ParameterDialog({'Angle': (360, 1, 360, 0)}, self)
-            if param_dialog.exec_():
-                try:
-                    angle = param_dialog.getValues()['Angle']
-                    new_pd = self.mesh_ops.perform_revolve(actor.GetMapper().GetInput(), angle)
-                    new_actor = self._create_actor_from_polydata(new_pd, f"{actor.name}_rev", execute=False)
-                    self.execute_command(ReplaceActorCommand(self.renderer, new_actor, actor), "Revolve successful.")
-                except Exception as e: self.log_message('error', f"Revolve failed: {e}")
+            values, built = self._exec_with_preview(param_dialog, lambda monitor, v: self.mesh_ops.with_monitor(monitor).perform_revolve(profile, v['Angle']))
+            if values is None: return
+            commit = lambda pd: self._commit_result(pd, f"{actor.name}_rev", lambda new: ReplaceActorCommand(self.renderer, new, actor), "Revolve successful.")
+            if built is not None: commit(built); return
+            self.run_operation("Revolve", lambda ops: ops.perform_revolve(profile, values['Angle']), commit, inputs=(actor,))
 
     def sweep_gui(self):
-        prof_dialog = ObjectSelectionDialog("Select Profile for Sweep", self.actors, QAbstractItemView.SingleSelection, self)
+        prof_dialog = ObjectSelectionDialog("Select Profile for Sweep", self.scene_model, QAbstractItemView.SingleSelection, self)
         if prof_dialog.exec_() and prof_dialog.sel:
             profile_actor = prof_dialog.sel[0]
-            path_actors = [a for a in self.actors if a != profile_actor]
-            if not path_actors: self.log_message('warning', "No other objects available for path."); return
-            path_dialog = ObjectSelectionDialog("Select Path for Sweep", path_actors, QAbstractItemView.SingleSelection, self)
+            if len(self.actors) < 2: self.log_message('warning', "No other objects available for path."); return
+            path_dialog = ObjectSelectionDialog("Select Path for Sweep", self.scene_model, QAbstractItemView.SingleSelection, self, exclude=[profile_actor])
             if path_dialog.exec_() and path_dialog.sel:
-                try:
-                    path_actor = path_dialog.sel[0]
-                    new_pd = self.mesh_ops.perform_sweep(profile_actor.GetMapper().GetInput(), path_actor.GetMapper().GetInput())
-                    self._create_actor_from_polydata(new_pd, f"sweep_{profile_actor.name}")
-                except Exception as e: self.log_message('error', f"Sweep failed: {e}")
+                path_actor = path_dialog.sel[0]
+                profile, path = profile_actor.GetMapper().GetInput(), path_actor.GetMapper().GetInput()
+                self.run_operation("Sweep", lambda ops: ops.perform_sweep(profile, path), lambda pd: self._create_actor_from_polydata(pd, f"sweep_{profile_actor.name}"), inputs=(profile_actor, path_actor))
 
     def loft_gui(self):
-        dialog = ObjectSelectionDialog("Select 2+ Profiles for Loft", self.actors, QAbstractItemView.ExtendedSelection, self)
+        dialog = ObjectSelectionDialog("Select 2+ Profiles for Loft", self.scene_model, QAbstractItemView.ExtendedSelection, self)
         if dialog.exec_() and len(dialog.sel) >= 2:
-            try:
-                profiles = [actor.GetMapper().GetInput() for actor in dialog.sel]
-                new_pd = self.mesh_ops.perform_loft(profiles)
-                self._create_actor_from_polydata(new_pd, "loft_result")
-            except Exception as e: self.log_message('error', f"Loft failed: {e}")
+            profiles = [actor.GetMapper().GetInput() for actor in dialog.sel]
+            self.run_operation("Loft", lambda ops: ops.perform_loft(profiles), lambda pd: self._create_actor_from_polydata(pd, "loft_result"), inputs=tuple(dialog.sel))
 
     def create_shape_gui(self, shape_type):
         dialog_map = {"point": PointDialog, "line": LineDialog, "rectangle": RectangleDialog, "circle": CircleDialog}
         if shape_type in dialog_map:
             dialog = dialog_map[shape_type](self)
             if dialog.exec_(): self._create_actor_from_polydata(self._get_polydata_for_2d_shape(shape_type, dialog.getValues()), shape_type.capitalize())
-        else:
-            params_map = {'cube':{'Size':(1,0.1,10,2)}, 'sphere':{'Radius':(1,0.1,10,2),'Resolution':(32,3,100,0)}, 'cone':{'Radius':(0.5,0.1,10,2),'Height':(1,0.1,10,2),'Resolution':(32,3,100,0)}, 'cylinder':{'Radius':(0.5,0.1,10,2),'Height':(1,0.1,10,2),'Resolution':(32,3,100,0)}, 'pyramid':{'Sides':(4,3,12,0),'SideLength':(1,0.1,10,2),'Height':(1,0.1,10,2)}}
-            if shape_type not in params_map: return
-            source = self._get_source_for_3d_shape(shape_type)
-            preview = ManagedActor("preview"); preview.GetProperty().SetRepresentationToWireframe(); preview.GetProperty().SetColor(1, 1, 0)
-            mapper = vtk.vtkPolyDataMapper(); mapper.SetInputConnection(source.GetOutputPort()); preview.SetMapper(mapper)
-            dialog = ParameterDialog(params_map[shape_type], self)
-            dialog.vChanged.connect(lambda: self._update_source_for_3d_shape(source, shape_type, dialog.getValues()) or self.vtk_widget.GetRenderWindow().Render())
-            self._update_source_for_3d_shape(source, shape_type, {k: v[0] for k, v in params_map[shape_type].items()})
-            self.renderer.AddActor(preview)
-            if dialog.exec_():
-                self._update_source_for_3d_shape(source, shape_type, dialog.getValues())
-                self._create_actor_from_polydata(source.GetOutput(), shape_type.capitalize())
-            self.renderer.RemoveActor(preview)
-            self.vtk_widget.GetRenderWindow().Render()
+        elif shape_type in SHAPE_PARAMETERS:
+            values, built = self._exec_with_preview(ParameterDialog(SHAPE_PARAMETERS[shape_type], self), lambda monitor, v: build_shape(shape_type, v), default_parameters(shape_type))
+            if values is None: return
+            self._create_actor_from_polydata(built if built is not None else build_shape(shape_type, values), shape_type.capitalize())
+
+    def _exec_with_preview(self, dialog, build, initial=None):
+        """
+        Runs a ParameterDialog with a live wireframe preview of build(monitor, values), built off-thread after edits pause.
+        Returns (values, geometry already built for them or None), or (None, None) if the dialog was cancelled.
+        """
+        preview = LivePreview(self.renderer, lambda monitor, values: self._profiled("Preview", build, monitor, values), self.request_render, parent=self)
+        preview.failed.connect(lambda msg: self.show_status_message(f"Preview failed: {msg}"))
+        dialog.vChanged.connect(lambda: preview.request(dialog.getValues())); preview.request(initial or dialog.getValues())
+        values = dialog.getValues() if dialog.exec_() else None
+        return values, preview.close(values)
 
     def define_plane_from_input(self):
         dialog = PlaneDialog(self)
@@ -261,6 +451,12 @@ class MeshCreatorApp(QMainWindow):
         self.interactor.SetInteractorStyle(self.pick_style)
         self.show_status_message('PICKING MODE: Left-click surface.')
 
+    def _prepare_picker(self, picker):
+        """Registers the cached cell locators of large meshes so picking them does not test every cell."""
+        picker.RemoveAllLocators()
+        for actor in self.large_actors:
+            if self.renderer.HasViewProp(actor): picker.AddLocator(actor.cell_locator())
+
     def on_surface_picked(self, point, normal):
         try:
             self.working_plane.set_from_origin_normal(point, normal)
@@ -279,9 +475,7 @@ class MeshCreatorApp(QMainWindow):
     def _create_actor_from_polydata(self, polydata, name=None, execute=True):
         if not polydata or polydata.GetNumberOfPoints() == 0: self.log_message('warning', "Empty geometry."); return None
         mapper = vtk.vtkPolyDataMapper(); mapper.SetInputData(polydata)
-        final_name = name or f"Mesh_{self.actor_count + 1}"
-        base_name, i = final_name, 1
-        while any(a.name == final_name for a in self.actors): final_name = f"{base_name}_{i}"; i += 1
+        final_name = self.actors.unique_name(name or f"Mesh_{self.actor_count + 1}")
         if name is None: self.actor_count += 1
         actor = ManagedActor(name=final_name); actor.SetMapper(mapper)
         prop = actor.GetProperty(); prop.SetColor(vtk.vtkMath.Random(.7, 1), vtk.vtkMath.Random(.7, 1), vtk.vtkMath.Random(.7, 1))
@@ -290,12 +484,44 @@ class MeshCreatorApp(QMainWindow):
         self.execute_command(AddActorCommand(self.renderer, actor), f"Created '{final_name}'."); return actor
 
     def _add_actor_to_scene(self, actor):
-        self.actors.append(actor)
-        self.obj_browser.addItem(QListWidgetItem(actor.name))
+        self.actors.add(actor)
+        if self.pending_commands is None: self.scene_model.add_actors([actor])
+        self.batcher.add(actor); self._schedule_lods(actor)
+        if actor.GetMapper().GetInput().GetNumberOfCells() >= self.pick_locator_min_cells: self.large_actors[actor] = None
+
+    def _schedule_lods(self, actor):
+        """Queues a background build of decimated LOD mappers for large meshes that lack current ones."""
+        polydata = actor.GetMapper().GetInput() if actor.GetMapper() else None
+        if polydata is None or polydata.GetNumberOfCells() < self.lod_min_cells or actor.lod_levels_current() or actor in self.lod_queue: return
+        self.lod_queue.append(actor); self._build_next_lods()
+
+    def _build_next_lods(self):
+        while self.lod_task is None and self.lod_queue:
+            actor = self.lod_queue.pop(0)
+            if actor not in self.actors or actor.lod_levels_current(): continue
+            # The worker decimates a shallow copy, so offloading the actor's geometry cannot free arrays under it.
+            source = actor.GetMapper().GetInput(); polydata = vtk.vtkPolyData(); polydata.ShallowCopy(source); mtime = source.GetMTime()
+            task = BackgroundTask(lambda monitor: build_lod_levels(polydata, monitor=monitor))
+            task.signals.finished.connect(lambda levels: self._on_lods_built(actor, mtime, levels))
+            task.signals.failed.connect(lambda msg: self._on_lods_built(actor, mtime, [], msg))
+            task.signals.cancelled.connect(lambda: self._on_lods_built(actor, mtime, []))
+            self.lod_task = task.start()
+
+    def _on_lods_built(self, actor, mtime, levels, error=None):
+        self.lod_task = None
+        if error: self.log_message('warning', f"Could not build levels of detail for '{actor.name}': {error}")
+        source = actor.GetMapper().GetInput() if actor.GetMapper() else None
+        if levels and source is not None and source.GetMTime() == mtime: actor.set_lod_levels(levels, mtime)
+        self._build_next_lods()
 
     def _remove_actor_from_scene(self, actor):
-        if actor in self.actors: self.actors.remove(actor)
-        for item in self.obj_browser.findItems(actor.name, Qt.MatchExactly): self.obj_browser.takeItem(self.obj_browser.row(item))
+        if not self.actors.remove(actor): return
+        self.batcher.remove(actor); self.large_actors.pop(actor, None)
+        if self.pending_commands is None: self.scene_model.remove_actors([actor])
+
+    def _update_browser(self, added, removed):
+        """Applies the net scene change of a transaction to the scene model in one pass."""
+        self.scene_model.remove_actors(removed); self.scene_model.add_actors(added)
 
     def _get_polydata_for_2d_shape(self, shape_type, vals):
         pd = None
@@ -303,20 +529,9 @@ class MeshCreatorApp(QMainWindow):
         if shape_type == 'line': l = vtk.vtkLineSource(); l.SetPoint1(vals['X1'], vals['Y1'], 0); l.SetPoint2(vals['X2'], vals['Y2'], 0); l.Update(); pd = l.GetOutput()
         if shape_type == 'rectangle': pl = vtk.vtkPlaneSource(); w, h = vals['Width'] / 2, vals['Height'] / 2; pl.SetCenter(0, 0, 0); pl.SetPoint1(w, -h, 0); pl.SetPoint2(-w, h, 0); pl.Update(); pd = pl.GetOutput()
         if shape_type == 'circle': pg = vtk.vtkRegularPolygonSource(); pg.SetRadius(vals['Radius']); pg.SetNumberOfSides(int(vals['Resolution'])); pg.Update(); pd = pg.GetOutput()
-        if pd and self.working_plane.is_active:
-            t = vtk.vtkTransformPolyDataFilter(); t.SetTransform(self.working_plane.get_transform()); t.SetInputData(pd); t.Update(); return t.GetOutput()
+        if pd and self.working_plane.is_active: self.working_plane.place(pd)
         return pd
 
-    def _get_source_for_3d_shape(self, st):
-        return {'cube': vtk.vtkCubeSource, 'sphere': vtk.vtkSphereSource, 'cone': vtk.vtkConeSource, 'cylinder': vtk.vtkCylinderSource, 'pyramid': vtk.vtkConeSource}[st]()
-
-    def _update_source_for_3d_shape(self, source, shape_type, vals):
-        if shape_type == 'cube': source.SetXLength(vals['Size']); source.SetYLength(vals['Size']); source.SetZLength(vals['Size'])
-        elif shape_type == 'sphere': source.SetRadius(vals['Radius']); source.SetThetaResolution(int(vals['Resolution'])); source.SetPhiResolution(int(vals['Resolution']))
-        elif shape_type in ['cone', 'cylinder']: source.SetRadius(vals['Radius']); source.SetHeight(vals['Height']); source.SetResolution(int(vals['Resolution']))
-        elif shape_type == 'pyramid': source.SetHeight(vals['Height']); source.SetRadius(vals['SideLength']); source.SetResolution(int(vals['Sides']))
-        source.Update()
-
     def update_plane_visuals(self):
         if self.plane_visual_actor: self.renderer.RemoveActor(self.plane_visual_actor)
         if not self.working_plane.is_active: self.reset_camera_view(); return
@@ -328,14 +543,12 @@ class MeshCreatorApp(QMainWindow):
         self.renderer.AddActor(self.plane_visual_actor); self.reset_camera_view()
 
     def _sync_actors_from_command(self, command, is_undo):
-        op_map = {
-            AddActorCommand: (lambda c: self._remove_actor_from_scene(c.actor), lambda c: self._add_actor_to_scene(c.actor)),
-            DeleteActorCommand: (lambda c: self._add_actor_to_scene(c.actor), lambda c: self._remove_actor_from_scene(c.actor)),
-            ReplaceActorCommand: (lambda c: (self._remove_actor_from_scene(c.new_actor), self._add_actor_to_scene(c.old_actor)), lambda c: (self._remove_actor_from_scene(c.old_actor), self._add_actor_to_scene(c.new_actor))),
-            BooleanOperationCommand: (lambda c: (self._remove_actor_from_scene(c.new_actor), self._add_actor_to_scene(c.old_actor1), self._add_actor_to_scene(c.old_actor2)), lambda c: (self._remove_actor_from_scene(c.old_actor1), self._remove_actor_from_scene(c.old_actor2), self._add_actor_to_scene(c.new_actor)))
-        }
-        action = op_map[type(command)][0 if is_undo else 1]
-        action(command)
+        added, removed = command.added_actors(), command.removed_actors()
+        if is_undo: added, removed = removed, added
+        for actor in removed: self._remove_actor_from_scene(actor)
+        for actor in added: self._add_actor_to_scene(actor)
+        for actor in command.changed_actors():
+            if actor in self.actors: self._schedule_lods(actor)  # in-place edits cleared the levels of detail
 
     def log_message(self, level, msg):
         log_map = {'info': self.cmd_win, 'warning': self.err_log, 'error': self.err_log}
@@ -344,41 +557,70 @@ class MeshCreatorApp(QMainWindow):
         log_widget.append(f"<font color='{color_map.get(level, 'black')}'><b>[{level.upper()}]</b> {msg}</font>")
 
     def browser_context_menu(self, point):
-        item = self.obj_browser.itemAt(point)
-        if not item or item.text() == "working_plane_visual": return
-        menu = QMenu(); re_action = menu.addAction("Rename"); del_action = menu.addAction("Delete"); action = menu.exec_(self.obj_browser.mapToGlobal(point))
-        if action == re_action: self.rename_item(item)
-        elif action == del_action: self.delete_actor_by_name(item.text())
-
-    def rename_item(self, item):
-        old_name = item.text()
+        actor = self.obj_browser.actor_at(point)
+        if actor is None: return
+        menu = QMenu(); re_action = menu.addAction("Rename"); del_action = menu.addAction("Delete"); action = menu.exec_(self.obj_browser.view.viewport().mapToGlobal(point))
+        if action == re_action: self.rename_actor(actor)
+        elif action == del_action: self.delete_actor(actor)
+
+    def rename_actor(self, actor):
+        if actor not in self.actors: return
+        old_name = actor.name
         new_name, ok = QInputDialog.getText(self, "Rename", "New name:", text=old_name)
         if not (ok and new_name and new_name != old_name): return
-        base, i = new_name, 1
-        while any(a.name == new_name for a in self.actors if a.name != old_name): new_name = f"{base}_{i}"; i += 1
-        for actor in self.actors:
-            if actor.name == old_name: actor.name = new_name; break
-        item.setText(new_name)
+        new_name = self.actors.rename(actor, new_name); self.scene_model.actor_changed(actor); self._set_modified()
         self.log_message('info', f"Renamed '{old_name}' to '{new_name}'.")
 
+    def delete_actor(self, actor):
+        if actor in self.actors: self.execute_command(DeleteActorCommand(self.renderer, actor), f"Deleted '{actor.name}'.")
+
     def delete_actor_by_name(self, name):
-        actor = next((a for a in self.actors if a.name == name), None)
-        if actor: self.execute_command(DeleteActorCommand(self.renderer, actor), f"Deleted '{name}'.")
+        actor = self.actors.find(name)
+        if actor: self.delete_actor(actor)
 
     def delete_selected_actor(self):
-        selected = self.obj_browser.selectedItems()
-        if selected: self.delete_actor_by_name(selected[0].text())
-        else: self.log_message('warning', 'No object selected.')
+        selected = self.obj_browser.selected_actors()
+        if not selected: self.log_message('warning', 'No object selected.'); return
+        with self.transaction(f"Deleted {len(selected)} objects"):
+            for actor in selected: self.delete_actor(actor)
 
     def execute_py_command(self):
         cmd = self.py_in.text()
         self.py_out.append(f"<font color='blue'>>>> {cmd}</font>")
         self.py_in.clear()
-        try: exec(cmd, {"app": self, "vtk": vtk})
+        stamps = {actor: self._geometry_stamp(actor) for actor in self.actors}
+        try: exec(cmd, {"app": self, "vtk": vtk, "np": np})
         except Exception as e: self.py_out.append(f"<font color='red'>{type(e).__name__}: {e}</font>")
-        self.vtk_widget.GetRenderWindow().Render()
+        edited = [actor for actor, stamp in stamps.items() if self._geometry_stamp(actor) != stamp]  # in-place edits, even by a script that failed halfway
+        if edited: self.geometry_changed(edited)
+        else: self.request_render()
+
+    @staticmethod
+    def _geometry_stamp(actor):
+        polydata = actor.GetMapper().GetInput() if actor.GetMapper() else None
+        return (polydata.GetAddressAsString("vtkPolyData"), polydata.GetMTime()) if polydata is not None else None
+
+    def geometry_changed(self, actors):
+        """Call after editing actors' geometry in place (plugins, console scripts): rebuilds levels of detail, flags the project modified and renders."""
+        for actor in actors:
+            if actor in self.actors: self._schedule_lods(actor)
+        self._set_modified()
+        self.request_render()
+
+    def request_render(self):
+        """Asks for a render; requests made in the same event-loop turn or frame are merged into one."""
+        self.render_scheduler.request()
+
+    def reset_camera_view(self): self.render_scheduler.request(reset_camera=True)
+
+    def set_static_batching(self, enabled):
+        """Turns draw-call batching of small objects on or off."""
+        self.batcher.set_enabled(enabled); self.request_render(); stats = self.batcher.stats()
+        self.log_message('info', f"Static batching on: {stats['actors']} objects drawn with {stats['draw_calls']} draw calls." if enabled else "Static batching off.")
 
-    def reset_camera_view(self): self.renderer.ResetCamera(); self.vtk_widget.GetRenderWindow().Render()
     def about_dialog(self): QMessageBox.about(self, "About Mesh Editor Pro", "Mesh Editor Pro\nVersion 2.4\nEnhanced stability and features.")
+    def closeEvent(self, event):
+        self.render_scheduler.stop(); self.history.clear(); super().closeEvent(event)
+
     def not_implemented(self): self.log_message("warning", "Feature not yet implemented.")
     def show_status_message(self, msg, timeout=5000): self.statusBar().showMessage(msg, timeout)
\ No newline at end of file
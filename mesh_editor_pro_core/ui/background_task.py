@@ -0,0 +1,29 @@
+# ===================================================================================
+# Python file : background_task.py
+# Description:
+# Runs backend work on a QThreadPool worker so the GUI stays responsive. Progress,
+# results and errors are delivered back to the GUI thread through Qt signals.
+# ===================================================================================
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from mesh_editor_pro_core.core.progress import OperationCancelled, ProgressMonitor
+
+class TaskSignals(QObject):
+    progress = pyqtSignal(float, str)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+class BackgroundTask(QRunnable):
+    """Runs fn(monitor, *args) on a pool thread; the monitor reports progress and carries the cancel flag."""
+    def __init__(self, fn, *args):
+        super().__init__(); self.fn, self.args = fn, args; self.signals = TaskSignals()
+        self.monitor = ProgressMonitor(self.signals.progress.emit)
+    def cancel(self): self.monitor.cancel()
+    def start(self, pool=None): (pool or QThreadPool.globalInstance()).start(self); return self
+    def run(self):
+        try: result = self.fn(self.monitor, *self.args)
+        except OperationCancelled: self.signals.cancelled.emit(); return
+        except Exception as e: self.signals.failed.emit(str(e)); return
+        if self.monitor.cancelled: self.signals.cancelled.emit()
+        else: self.signals.finished.emit(result)
\ No newline at end of file
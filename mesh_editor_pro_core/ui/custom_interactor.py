@@ -8,15 +8,20 @@
 import vtk
 
 class PickingInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
-    """Custom interactor style for picking points on actors in the scene."""
-    def __init__(self, callback): super().__init__(); self.callback = callback; self.AddObserver("LeftButtonPressEvent", self.on_left_press); self.picker = vtk.vtkCellPicker(); self.picker.SetTolerance(0.005)
+    """
+    Custom interactor style for picking points on actors in the scene. prepare(picker) runs before each pick, e.g. to
+    register cached cell locators; resolve(prop, cell_id) maps merged display actors back to scene actors.
+    """
+    def __init__(self, callback, resolve=None, prepare=None):
+        super().__init__(); self.callback = callback; self.resolve = resolve or (lambda prop, cell_id: (prop, cell_id)); self.prepare = prepare
+        self.AddObserver("LeftButtonPressEvent", self.on_left_press); self.picker = vtk.vtkCellPicker(); self.picker.SetTolerance(0.005)
     def on_left_press(self, obj, event):
         try:
-            pos = self.GetInteractor().GetEventPosition(); self.picker.Pick(pos[0], pos[1], 0, self.GetDefaultRenderer())
+            pos = self.GetInteractor().GetEventPosition()
+            if self.prepare: self.prepare(self.picker)
+            self.picker.Pick(pos[0], pos[1], 0, self.GetDefaultRenderer())
             if self.picker.GetCellId() != -1:
-                point = self.picker.GetPickPosition(); actor = self.picker.GetActor(); pdata = actor.GetMapper().GetInput()
-                if not pdata.GetCellData().GetNormals():
-                    nf = vtk.vtkPolyDataNormals(); nf.SetInputData(pdata); nf.ComputeCellNormalsOn(); nf.Update(); pdata = nf.GetOutput()
-                self.callback(point, pdata.GetCellData().GetNormals().GetTuple(self.picker.GetCellId()))
+                point = self.picker.GetPickPosition(); actor, cell_id = self.resolve(self.picker.GetActor(), self.picker.GetCellId())
+                self.callback(point, actor.cell_normal(cell_id))
             else: self.OnLeftButtonDown()
         except Exception: self.OnLeftButtonDown()
\ No newline at end of file
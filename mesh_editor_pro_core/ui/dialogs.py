@@ -5,8 +5,9 @@
 # entirely part of the GUI layer.
 # ===================================================================================
 
-from PyQt5.QtWidgets import (QDialog, QDialogButtonBox, QFormLayout, QListWidget, QDoubleSpinBox, QSlider, QHBoxLayout, QSpinBox, QVBoxLayout, QAbstractItemView)
+from PyQt5.QtWidgets import (QDialog, QDialogButtonBox, QFormLayout, QDoubleSpinBox, QSlider, QHBoxLayout, QSpinBox, QVBoxLayout)
 from PyQt5.QtCore import Qt, pyqtSignal
+from mesh_editor_pro_core.ui.scene_model import SceneListModel, SceneListView
 
 class BaseShapeDialog(QDialog):
     def __init__(self, p=None): super().__init__(p); self.l = QFormLayout(self); self.w = {}
@@ -34,8 +35,11 @@ class ParameterDialog(QDialog):
         b=QDialogButtonBox(QDialogButtonBox.Ok|QDialogButtonBox.Cancel); b.accepted.connect(self.accept); b.rejected.connect(self.reject); l.addWidget(b)
     def getValues(self): return {n:w.value() for n,w in self.w.items()}
 class ObjectSelectionDialog(QDialog):
-    def __init__(self, t, a, m, p=None):
-        super().__init__(p); self.setWindowTitle(t); l=QVBoxLayout(self); self.lw=QListWidget(); self.lw.addItems([act.name for act in a if act.name!="working_plane_visual"]); self.lw.setSelectionMode(m); l.addWidget(self.lw)
+    """Picks objects from a SceneListModel (or a plain list of actors) with incremental search; 'exclude' hides actors."""
+    def __init__(self, t, a, m, p=None, exclude=()):
+        super().__init__(p); self.setWindowTitle(t); l=QVBoxLayout(self)
+        model = a if isinstance(a, SceneListModel) else SceneListModel([act for act in a if act.name!="working_plane_visual"], self)
+        self.list=SceneListView(model, m, exclude, self); l.addWidget(self.list)
         b=QDialogButtonBox(QDialogButtonBox.Ok|QDialogButtonBox.Cancel); b.accepted.connect(self.accept); b.rejected.connect(self.reject); l.addWidget(b); self.sel=[]
     def accept(self):
-        amap={a.name:a for a in self.parent().actors}; [self.sel.append(amap[i.text()]) for i in self.lw.selectedItems() if i.text() in amap]; super().accept()
\ No newline at end of file
+        self.sel=self.list.selected_actors(); super().accept()
\ No newline at end of file
@@ -0,0 +1,83 @@
+# ===================================================================================
+# Python file : live_preview.py
+# Description:
+# Wireframe preview of geometry that depends on dialog parameters. Parameter
+# changes are debounced, the geometry is built on a worker thread, and every
+# result is cached by its parameter tuple, so scrubbing a slider back and forth
+# shows already-built geometry at once and the final accept can reuse it.
+# ===================================================================================
+
+from collections import OrderedDict
+
+import vtk
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from mesh_editor_pro_core.ui.background_task import BackgroundTask
+
+class LivePreview(QObject):
+    """
+    Shows build(monitor, params) for the latest requested params as a wireframe actor in renderer. Only one build runs
+    at a time; requests arriving meanwhile collapse into the most recent one.
+    """
+    failed = pyqtSignal(str)
+
+    def __init__(self, renderer, build, request_render, delay_ms=120, max_entries=64, max_memory_mb=256, parent=None):
+        super().__init__(parent)
+        self.renderer, self.build, self.request_render = renderer, build, request_render
+        self.max_entries, self.max_memory_kb = max_entries, int(max_memory_mb * 1024)
+        self.cache = OrderedDict(); self.memory_kb = 0  # parameter key -> polydata, least recently used first
+        self.latest = None; self.task = None; self.closed = False
+        self.timer = QTimer(self); self.timer.setSingleShot(True); self.timer.setInterval(delay_ms); self.timer.timeout.connect(self._build_latest)
+        self.actor = vtk.vtkActor(); self.actor.SetMapper(vtk.vtkPolyDataMapper()); self.actor.PickableOff(); self.actor.VisibilityOff()
+        prop = self.actor.GetProperty(); prop.SetRepresentationToWireframe(); prop.SetColor(1, 1, 0); prop.SetLighting(False)
+        renderer.AddActor(self.actor)
+
+    @staticmethod
+    def key(params): return tuple(sorted(params.items()))
+
+    def request(self, params):
+        """Shows params' geometry now if it is cached, otherwise builds it once the parameters stop changing."""
+        if self.closed: return
+        key = self.key(params); self.latest = (key, dict(params))
+        if key in self.cache: self.timer.stop(); self._show(key)
+        else: self.timer.start()
+
+    def cached(self, params):
+        """The geometry already built for params, or None."""
+        return self.cache.get(self.key(params))
+
+    def close(self, params=None):
+        """
+        Removes the preview and frees it: a build still running is cancelled and its result dropped, the cache is
+        emptied and the object is scheduled for deletion. Returns the geometry already built for params, or None.
+        """
+        built = self.cached(params) if params is not None else None
+        self.closed = True; self.timer.stop(); self.renderer.RemoveActor(self.actor); self.request_render()
+        if self.task: self.task.cancel()
+        self.cache.clear(); self.memory_kb = 0; self.latest = None; self.build = None; self.actor.GetMapper().RemoveAllInputs()
+        self.deleteLater(); return built
+
+    def _build_latest(self):
+        if self.closed or self.task or self.latest is None or self.latest[0] in self.cache: return
+        key, params = self.latest
+        task = BackgroundTask(lambda monitor: self.build(monitor, params))
+        task.signals.finished.connect(lambda polydata: self._on_built(key, polydata))
+        task.signals.failed.connect(lambda msg: self._on_built(key, None, msg))
+        task.signals.cancelled.connect(lambda: self._on_built(key, None))
+        self.task = task.start()
+
+    def _on_built(self, key, polydata, error=None):
+        self.task = None
+        if self.closed: return
+        if error: self.failed.emit(error)
+        if polydata is not None: self._store(key, polydata)
+        if not self.latest or self.latest[0] != key: self._build_latest()
+        elif polydata is not None: self._show(key)
+
+    def _store(self, key, polydata):
+        self.cache[key] = polydata; self.memory_kb += polydata.GetActualMemorySize()
+        while len(self.cache) > 1 and (len(self.cache) > self.max_entries or self.memory_kb > self.max_memory_kb):
+            self.memory_kb -= self.cache.popitem(last=False)[1].GetActualMemorySize()
+
+    def _show(self, key):
+        self.cache.move_to_end(key); self.actor.GetMapper().SetInputData(self.cache[key]); self.actor.VisibilityOn(); self.request_render()
\ No newline at end of file
@@ -5,7 +5,9 @@
 # submenu for Extrude, Revolve, Sweep, and Loft.
 # ===================================================================================
 
-from PyQt5.QtWidgets import QAction, QMenu
+from PyQt5.QtWidgets import QAction, QActionGroup, QMenu
+
+from mesh_editor_pro_core.core.operations import SANITIZE_PROFILES
 
 class MenuSetup:
     """Handles the creation of the standard application menus."""
@@ -32,7 +34,7 @@ class MenuSetup:
 
     def _setup_file_menu(self, menu_bar):
         file_menu = menu_bar.addMenu("&File")
-        self._add_actions(file_menu, [("New Project", self.main_window.new_project, "Ctrl+N"), ("Open...", self.main_window.open_project, "Ctrl+O"), ("Save", self.main_window.save_project, "Ctrl+S"), ("Save As...", self.main_window.save_project_as, "Ctrl+Shift+S"), None, ("Import...", self.main_window.import_file), ("Export...", self.main_window.save_project_as), None, ("Exit", self.main_window.close, "Alt+F4")])
+        self._add_actions(file_menu, [("New Project", self.main_window.new_project, "Ctrl+N"), ("Open...", self.main_window.open_project, "Ctrl+O"), ("Save", self.main_window.save_project, "Ctrl+S"), ("Save As...", self.main_window.save_project_as, "Ctrl+Shift+S"), None, ("Import...", self.main_window.import_file), ("Import Directory...", self.main_window.import_directory), ("Export...", self.main_window.save_project_as), None, ("Exit", self.main_window.close, "Alt+F4")])
 
     def _setup_edit_menu(self, menu_bar):
         edit_menu = menu_bar.addMenu("&Edit")
@@ -41,6 +43,8 @@ class MenuSetup:
     def _setup_view_menu(self, menu_bar):
         view_menu = menu_bar.addMenu("&View")
         self._add_actions(view_menu, [("Reset View", self.main_window.reset_camera_view)])
+        batching = QAction("Static Batching", self.main_window, checkable=True, toggled=self.main_window.set_static_batching)
+        batching.setToolTip("Draw small objects that share an appearance as one merged mesh."); view_menu.addAction(batching)
         panels = view_menu.addMenu("Panels")
         panels.addAction(self.main_window.left_dock.toggleViewAction())
         panels.addAction(self.main_window.bottom_dock.toggleViewAction())
@@ -58,12 +62,17 @@ class MenuSetup:
         self._add_actions(adv_shapes, [("Extrude...", self.main_window.extrude_gui), ("Revolve...", self.main_window.revolve_gui), ("Sweep...", self.main_window.sweep_gui), ("Loft...", self.main_window.loft_gui)])
 
     def _setup_modify_menu(self, menu_bar):
-        bool_ops = menu_bar.addMenu("&Modify").addMenu("Boolean Operations")
+        modify_menu = menu_bar.addMenu("&Modify"); bool_ops = modify_menu.addMenu("Boolean Operations")
         self._add_actions(bool_ops, [("Union", lambda: self.main_window.perform_boolean_gui('union')), ("Intersection", lambda: self.main_window.perform_boolean_gui('intersection')), ("Difference", lambda: self.main_window.perform_boolean_gui('difference'))])
+        self._add_actions(modify_menu, [("Decimate...", self.main_window.decimate_gui)])
 
     def _setup_tools_menu(self, menu_bar):
         tools_menu = menu_bar.addMenu("&Tools")
-        self._add_actions(tools_menu, [("Measure...", self.main_window.not_implemented), ("Settings...", self.main_window.not_implemented)])
+        self._add_actions(tools_menu, [("Measure...", self.main_window.not_implemented), ("Undo History Budget...", self.main_window.set_history_budget), ("Tessellation Tolerance...", self.main_window.set_chord_tolerance), ("Settings...", self.main_window.not_implemented)])
+        profiles = tools_menu.addMenu("Sanitize Profile"); group = QActionGroup(self.main_window)
+        for profile in SANITIZE_PROFILES:
+            action = QAction(profile.capitalize(), self.main_window, checkable=True, triggered=lambda c, p=profile: self.main_window.set_sanitize_profile(p))
+            action.setChecked(profile == self.main_window.mesh_ops.sanitize_profile); group.addAction(action); profiles.addAction(action)
 
     def _setup_help_menu(self, menu_bar):
         help_menu = menu_bar.addMenu("&Help")
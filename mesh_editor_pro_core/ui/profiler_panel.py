@@ -0,0 +1,66 @@
+# ===================================================================================
+# Python file : profiler_panel.py
+# Description:
+# Panel listing the operations recorded by a StageProfiler, each expandable into
+# its filter stages with wall time, cell counts and memory change, plus a
+# per-filter summary. Stages run in worker processes are marked with their
+# process id. Traces can be exported for chrome://tracing or Perfetto.
+# ===================================================================================
+
+import os
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QFileDialog, QHBoxLayout, QLabel, QMessageBox, QPushButton, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
+
+COLUMNS = ["Operation / stage", "Time (ms)", "Share", "Input cells", "Output cells", "Output (MB)", "RSS change (MB)", "Peak growth (MB)"]
+
+class ProfilerPanel(QWidget):
+    """Shows a StageProfiler's records; refresh() rebuilds the tree from a snapshot, newest operation first."""
+
+    def __init__(self, profiler, parent=None, max_operations=200):
+        super().__init__(parent); self.profiler, self.max_operations = profiler, max_operations
+        layout = QVBoxLayout(self); layout.setContentsMargins(0, 0, 0, 0)
+        self.tree = QTreeWidget(); self.tree.setColumnCount(len(COLUMNS)); self.tree.setHeaderLabels(COLUMNS); self.tree.setUniformRowHeights(True)
+        self.summary = QLabel(); self.summary.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        buttons = QHBoxLayout(); buttons.addWidget(self.summary, 1)
+        for text, slot in (("Refresh", self.refresh), ("Clear", self.clear), ("Export Trace...", self.export_trace)):
+            button = QPushButton(text); button.clicked.connect(slot); buttons.addWidget(button)
+        layout.addWidget(self.tree); layout.addLayout(buttons)
+
+    def refresh(self):
+        operations, stages = self.profiler.snapshot(); by_op = {}
+        for stage in stages: by_op.setdefault(stage['operation'], []).append(stage)
+        self.tree.clear(); items = []
+        for op in reversed(operations[-self.max_operations:]):
+            total = op['seconds'] or sum(s['seconds'] for s in by_op.get(op['id'], ()))
+            status = "" if op['status'] == 'ok' else f" [{op['status']}]"
+            item = QTreeWidgetItem([op['name'] + status, f"{1000 * total:.1f}"] + [""] * (len(COLUMNS) - 2))
+            for stage in by_op.get(op['id'], ()): item.addChild(self._stage_item(stage, total))
+            items.append(item)
+        if by_op.get(None):
+            loose = QTreeWidgetItem(["(outside an operation)", f"{1000 * sum(s['seconds'] for s in by_op[None]):.1f}"] + [""] * (len(COLUMNS) - 2))
+            for stage in by_op[None][-1000:]: loose.addChild(self._stage_item(stage, None))
+            items.append(loose)
+        self.tree.addTopLevelItems(items)
+        if items: items[0].setExpanded(True)
+        for column in range(len(COLUMNS)): self.tree.resizeColumnToContents(column)
+        top = self.profiler.summary()[:3]
+        self.summary.setText("Slowest filters: " + ", ".join(f"{e['name']} {1000 * e['seconds']:.0f} ms ({e['calls']}x)" for e in top) if top else "No stages recorded.")
+
+    def _stage_item(self, stage, total):
+        share = f"{100 * stage['seconds'] / total:.0f}%" if total else ""
+        fmt = lambda value, scale=1.0, spec=",.0f": "" if value is None else format(value * scale, spec)
+        name = stage['name'] if stage['process'] == os.getpid() else f"{stage['name']} [worker {stage['process']}]"
+        item = QTreeWidgetItem([name, f"{1000 * stage['seconds']:.1f}", share, fmt(stage['input_cells']), fmt(stage['output_cells']),
+                                fmt(stage['output_kb'], 1 / 1024, ".1f"), fmt(stage['rss_delta_mb'], 1.0, "+.1f"), fmt(stage['peak_growth_mb'], 1.0, ".1f")])
+        for column in range(1, len(COLUMNS)): item.setTextAlignment(column, Qt.AlignRight | Qt.AlignVCenter)
+        return item
+
+    def clear(self): self.profiler.clear(); self.refresh()
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "mesh_trace.json", "Chrome Trace(*.json)")
+        if not path: return None
+        try: self.profiler.export_chrome_trace(path)
+        except OSError as e: QMessageBox.warning(self, "Export Trace", f"Could not write {path}: {e}"); return None
+        return path
\ No newline at end of file
@@ -0,0 +1,47 @@
+# ===================================================================================
+# Python file : render_scheduler.py
+# Description:
+# Coalesces render requests from across the application. Callers ask for a
+# render instead of rendering directly; requests made in the same event-loop turn,
+# or within one frame interval of the last render, are served by a single
+# Render() call. Counters of requested versus actual renders show how much work
+# the coalescing saves.
+# ===================================================================================
+
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+class RenderScheduler(QObject):
+    """
+    Renders a render window at most once per event-loop turn and per frame interval. prepare, if given, runs just
+    before each render; a request with reset_camera=True resets the renderer's camera first.
+    """
+
+    def __init__(self, render_window, renderer, prepare=None, frame_ms=16, parent=None):
+        super().__init__(parent)
+        self.render_window, self.renderer, self.prepare, self.frame_ms = render_window, renderer, prepare, frame_ms
+        self.requested = self.rendered = 0; self.pending = self.reset_pending = False; self.last_render = 0.0
+        self.timer = QTimer(self); self.timer.setSingleShot(True); self.timer.timeout.connect(self.flush)
+
+    def request(self, reset_camera=False):
+        """Schedules a render on a later event-loop turn; further requests until then are merged into it."""
+        self.requested += 1; self.pending = True; self.reset_pending = self.reset_pending or reset_camera
+        if self.timer.isActive(): return
+        elapsed_ms = (time.perf_counter() - self.last_render) * 1000
+        self.timer.start(int(max(0.0, self.frame_ms - elapsed_ms)))
+
+    def flush(self):
+        """Renders now if a render is pending, e.g. before reading back the image."""
+        self.timer.stop()
+        if not self.pending: return
+        self.pending = False
+        if self.prepare: self.prepare()
+        if self.reset_pending: self.renderer.ResetCamera(); self.reset_pending = False
+        self.render_window.Render(); self.rendered += 1
+        self.last_render = time.perf_counter()
+
+    def stop(self): self.timer.stop()
+
+    def stats(self):
+        return {'requested': self.requested, 'rendered': self.rendered, 'coalesced': self.requested - self.rendered}
\ No newline at end of file
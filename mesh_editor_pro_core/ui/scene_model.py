@@ -0,0 +1,137 @@
+# ===================================================================================
+# Python file : scene_model.py
+# Description:
+# Qt item model over the scene's actors, shared by the object browser and the
+# object selection dialogs. Views only ask for the rows they draw, so opening a
+# list of tens of thousands of objects costs no per-item widgets, and a filter
+# proxy provides incremental, case-insensitive search by name.
+# ===================================================================================
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QTimer
+from PyQt5.QtWidgets import QAbstractItemView, QLineEdit, QListView, QVBoxLayout, QWidget
+
+class SceneListModel(QAbstractListModel):
+    """
+    One row per actor, in scene order; Qt.UserRole returns the actor itself. Each actor keeps the slot it was added
+    in, and a Fenwick tree over occupied slots maps slots to rows and back in O(log n), so removing or renaming one
+    object never renumbers the rows after it. Slots are compacted once more than half of them are free.
+    """
+
+    BATCH_RESET_RANGES = 32  # removals touching more separate row ranges than this reset the model instead
+
+    def __init__(self, actors=(), parent=None):
+        super().__init__(parent); self._build(list(actors))
+
+    def _build(self, actors):
+        """Lays actors out in fresh slots with room to grow and builds the tree over them in O(n)."""
+        capacity = max(64, 2 * len(actors)); self._slots = actors + [None] * (capacity - len(actors)); self._next = len(actors)
+        self._slot_of = {actor: slot for slot, actor in enumerate(actors)}
+        tree = [0] + [1] * len(actors) + [0] * (capacity - len(actors))
+        for i in range(1, capacity + 1):
+            parent = i + (i & -i)
+            if parent <= capacity: tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add(self, slot, delta):
+        i, tree = slot + 1, self._tree
+        while i < len(tree): tree[i] += delta; i += i & -i
+
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._slot_of)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        actor = self.actor_at(index.row())
+        if role in (Qt.DisplayRole, Qt.EditRole): return actor.name
+        if role == Qt.UserRole: return actor
+        return None
+
+    def actor_at(self, row):
+        if not 0 <= row < len(self._slot_of): raise IndexError(row)
+        tree, pos, remaining, step = self._tree, 0, row + 1, 1 << ((len(self._tree) - 1).bit_length() - 1)
+        while step:
+            if pos + step < len(tree) and tree[pos + step] < remaining: pos += step; remaining -= tree[pos]
+            step >>= 1
+        return self._slots[pos]
+
+    def row_of(self, actor):
+        """The row of actor, or None if it is not in the model."""
+        slot = self._slot_of.get(actor)
+        if slot is None: return None
+        row, i, tree = -1, slot + 1, self._tree
+        while i: row += tree[i]; i -= i & -i
+        return row
+
+    def actors(self): return [actor for actor in self._slots[:self._next] if actor is not None]
+
+    def add_actors(self, actors):
+        actors = [a for a in actors if a not in self._slot_of]
+        if not actors: return
+        first = len(self._slot_of); self.beginInsertRows(QModelIndex(), first, first + len(actors) - 1)
+        if self._next + len(actors) > len(self._slots): self._build(self.actors() + actors)
+        else:
+            for actor in actors: self._slots[self._next] = actor; self._slot_of[actor] = self._next; self._add(self._next, 1); self._next += 1
+        self.endInsertRows()
+
+    def remove_actors(self, actors):
+        """Removes rows in contiguous ranges from the bottom up; falls back to one reset when they are scattered."""
+        found = sorted(((self.row_of(actor), actor) for actor in set(actors) if actor in self._slot_of), key=lambda pair: pair[0])
+        if not found: return
+        ranges = []
+        for row, actor in found:
+            if ranges and ranges[-1][1] == row - 1: ranges[-1][1] = row; ranges[-1][2].append(actor)
+            else: ranges.append([row, row, [actor]])
+        if len(ranges) > self.BATCH_RESET_RANGES:
+            gone = {actor for _, actor in found}; self.reset([a for a in self.actors() if a not in gone]); return
+        for first, last, removed in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for actor in removed: slot = self._slot_of.pop(actor); self._slots[slot] = None; self._add(slot, -1)
+            self.endRemoveRows()
+        if len(self._slot_of) < self._next // 2: self._build(self.actors())  # rows are unchanged, so views need no signal
+
+    def actor_changed(self, actor):
+        """Refreshes the row of an actor whose name changed."""
+        row = self.row_of(actor)
+        if row is None: return
+        index = self.index(row); self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def reset(self, actors=()):
+        self.beginResetModel(); self._build(list(actors)); self.endResetModel()
+
+class SceneFilterProxy(QSortFilterProxyModel):
+    """Case-insensitive name search over a SceneListModel, optionally hiding some actors."""
+
+    def __init__(self, source, excluded=(), parent=None):
+        super().__init__(parent); self.excluded = set(excluded)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive); self.setSourceModel(source)
+
+    def filterAcceptsRow(self, row, parent):
+        if self.excluded and self.sourceModel().actor_at(row) in self.excluded: return False
+        return super().filterAcceptsRow(row, parent)
+
+    def actor(self, index):
+        """The actor behind a proxy index, or None."""
+        return self.sourceModel().actor_at(self.mapToSource(index).row()) if index.isValid() else None
+
+class SceneListView(QWidget):
+    """A search box above a list view of a SceneListModel; typing filters the list after a short pause."""
+
+    SEARCH_DELAY_MS = 150
+
+    def __init__(self, model, selection_mode=QAbstractItemView.ExtendedSelection, excluded=(), parent=None):
+        super().__init__(parent); layout = QVBoxLayout(self); layout.setContentsMargins(0, 0, 0, 0)
+        self.search = QLineEdit(); self.search.setPlaceholderText("Search objects..."); self.search.setClearButtonEnabled(True)
+        self.proxy = SceneFilterProxy(model, excluded, self)
+        self.view = QListView(); self.view.setModel(self.proxy); self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(selection_mode); self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.search_timer = QTimer(self); self.search_timer.setSingleShot(True); self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(lambda: self.proxy.setFilterFixedString(self.search.text()))
+        self.search.textChanged.connect(lambda _: self.search_timer.start())
+        layout.addWidget(self.search); layout.addWidget(self.view)
+
+    def selected_actors(self):
+        """Selected actors in the order they were selected."""
+        return [self.proxy.actor(index) for index in self.view.selectionModel().selectedIndexes()]
+
+    def actor_at(self, point):
+        """The actor under a point in view coordinates, or None."""
+        return self.proxy.actor(self.view.indexAt(point))
\ No newline at end of file
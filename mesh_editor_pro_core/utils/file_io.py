@@ -5,31 +5,116 @@
 # raising exceptions on failure and containing no GUI code.
 # ===================================================================================
 
+import os
+import multiprocessing
+import numpy as np
 import vtk
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from mesh_editor_pro_core.core import mesh_arrays
+from mesh_editor_pro_core.core.progress import OperationCancelled, ProgressMonitor
+from mesh_editor_pro_core.utils.streaming_io import StreamingMeshReader
+from mesh_editor_pro_core.utils.project_io import ProjectFile
+
+READER_MAP = {'.stl': vtk.vtkSTLReader, '.ply': vtk.vtkPLYReader, '.vtk': vtk.vtkPolyDataReader, '.obj': vtk.vtkOBJReader, '.vtp': vtk.vtkXMLPolyDataReader}
+
+def _import_to_arrays(settings, file_path):
+    """Worker-process entry point: parses one file and returns its geometry as picklable arrays."""
+    polydata = FileHandler(*settings).import_file(file_path)
+    return {key: np.array(array) for key, array in mesh_arrays.polydata_to_arrays(polydata, attributes=True).items()}
 
 class FileHandler:
     """Manages saving and loading of mesh files as a backend service."""
 
+    def __init__(self, streaming_threshold_mb=256, memory_budget_mb=4096, chunk_triangles=1_000_000, import_workers=None, parallel_import_min_mb=32):
+        self.streaming_threshold_mb, self.memory_budget_mb, self.chunk_triangles = streaming_threshold_mb, memory_budget_mb, chunk_triangles
+        self.import_workers, self.parallel_import_min_mb = import_workers or os.cpu_count() or 1, parallel_import_min_mb
+        self.project = ProjectFile()
+
     def save_project(self, file_path, actors):
         """Saves the geometric data of all actors to a single file."""
         try:
             if not actors: raise ValueError("Scene is empty. Nothing to save.")
-            ext = "." + file_path.split('.')[-1].lower()
-            writer_map = {'.stl': vtk.vtkSTLWriter, '.ply': vtk.vtkPLYWriter, '.vtk': vtk.vtkPolyDataWriter, '.obj': vtk.vtkOBJWriter, '.vtp': vtk.vtkXMLPolyDataWriter}
-            if ext not in writer_map: raise ValueError(f"Unsupported file extension: {ext}")
+            if file_path.lower().endswith('.mep'): self.project.save(file_path, actors); return
+            writer = self._get_writer(file_path)
             append = vtk.vtkAppendPolyData()
             for actor in actors:
                 if actor.name != "working_plane_visual" and actor.GetMapper() and actor.GetMapper().GetInput(): append.AddInputData(actor.GetMapper().GetInput())
             append.Update()
             if append.GetOutput().GetNumberOfPoints() == 0: raise ValueError("No valid geometry found to save.")
-            writer = writer_map[ext](); writer.SetFileName(file_path); writer.SetInputConnection(append.GetOutputPort()); writer.Write()
+            writer.SetInputConnection(append.GetOutputPort()); writer.Write()
         except Exception as e: raise IOError(f"Failed to save project to {file_path}: {e}")
 
-    def import_file(self, file_path):
-        """Loads geometric data from a file."""
+    def load_project(self, file_path):
+        """Loads a native .mep project; returns a list of {'name', 'appearance', 'polydata'}."""
+        try: return self.project.load(file_path)
+        except Exception as e: raise IOError(f"Failed to open project {file_path}: {e}")
+
+    def export_polydata(self, file_path, polydata):
+        """Writes a single polydata to a mesh file."""
+        try:
+            if not polydata or polydata.GetNumberOfPoints() == 0: raise ValueError("No valid geometry found to export.")
+            writer = self._get_writer(file_path); writer.SetInputData(polydata); writer.Write()
+        except Exception as e: raise IOError(f"Failed to export to {file_path}: {e}")
+
+    def _get_writer(self, file_path):
+        ext = "." + file_path.split('.')[-1].lower()
+        writer_map = {'.stl': vtk.vtkSTLWriter, '.ply': vtk.vtkPLYWriter, '.vtk': vtk.vtkPolyDataWriter, '.obj': vtk.vtkOBJWriter, '.vtp': vtk.vtkXMLPolyDataWriter}
+        if ext not in writer_map: raise ValueError(f"Unsupported file extension: {ext}")
+        writer = writer_map[ext](); writer.SetFileName(file_path); return writer
+
+    def import_file(self, file_path, monitor=None, streaming=None):
+        """
+        Loads geometric data from a file. Binary STL/PLY files above streaming_threshold_mb are read in
+        chunks within memory_budget_mb; streaming=True/False forces the mode.
+        """
+        monitor = monitor or ProgressMonitor()
         try:
             ext = "." + file_path.split('.')[-1].lower()
-            reader_map = {'.stl': vtk.vtkSTLReader, '.ply': vtk.vtkPLYReader, '.vtk': vtk.vtkPolyDataReader, '.obj': vtk.vtkOBJReader, '.vtp': vtk.vtkXMLPolyDataReader}
-            if ext not in reader_map: raise ValueError(f"Unsupported file extension: {ext}")
-            reader = reader_map[ext](); reader.SetFileName(file_path); reader.Update(); return reader.GetOutput()
-        except Exception as e: raise IOError(f"Failed to import file {file_path}: {e}")
\ No newline at end of file
+            if ext not in READER_MAP: raise ValueError(f"Unsupported file extension: {ext}")
+            streamer = StreamingMeshReader(self.chunk_triangles, self.memory_budget_mb, monitor)
+            if streaming is None: streaming = os.path.getsize(file_path) >= self.streaming_threshold_mb * 1024 * 1024
+            if streaming and streamer.can_stream(file_path):
+                try: return streamer.read(file_path)
+                except ValueError: pass
+            reader = monitor.observe(READER_MAP[ext]()); reader.SetFileName(file_path); reader.Update(); monitor.check(); return reader.GetOutput()
+        except OperationCancelled: raise
+        except Exception as e: raise IOError(f"Failed to import file {file_path}: {e}")
+
+    def find_mesh_files(self, directory, recursive=True):
+        """Returns the sorted paths of all importable mesh files in a directory."""
+        found = []
+        for root, dirs, files in os.walk(directory):
+            found += [os.path.join(root, f) for f in files if os.path.splitext(f)[1].lower() in READER_MAP]
+            if not recursive: break
+        return sorted(found)
+
+    def import_files(self, file_paths, monitor=None):
+        """
+        Loads several files, parsing them in parallel worker processes once their total size outweighs the cost of
+        starting the pool. Returns (meshes, errors): a list of (path, polydata) in input order for the files that
+        loaded, and a list of (path, message) for those that did not.
+        """
+        monitor = monitor or ProgressMonitor(); loaded, errors = {}, []
+        total_mb = sum(os.path.getsize(p) for p in file_paths if os.path.isfile(p)) / (1024 * 1024)
+        if len(file_paths) == 1 or self.import_workers == 1 or total_mb < self.parallel_import_min_mb:
+            for i, path in enumerate(file_paths):
+                try: loaded[path] = self._require_geometry(path, self.import_file(path, monitor if len(file_paths) == 1 else None))
+                except IOError as e: errors.append((path, str(e)))
+                monitor.report((i + 1) / len(file_paths), f"Imported {os.path.basename(path)}"); monitor.check()
+        else:
+            # Spawned workers do not inherit the GUI process's threads and VTK state.
+            settings = (self.streaming_threshold_mb, self.memory_budget_mb, self.chunk_triangles, 1)
+            pool = ProcessPoolExecutor(max_workers=min(self.import_workers, len(file_paths)), mp_context=multiprocessing.get_context('spawn'))
+            try:
+                futures = {pool.submit(_import_to_arrays, settings, path): path for path in file_paths}
+                for done, future in enumerate(as_completed(futures), 1):
+                    path = futures[future]
+                    try: loaded[path] = self._require_geometry(path, mesh_arrays.arrays_to_polydata(future.result(), deep=False))
+                    except Exception as e: errors.append((path, str(e)))
+                    monitor.report(done / len(file_paths), f"Imported {os.path.basename(path)}"); monitor.check()
+            finally: pool.shutdown(wait=True, cancel_futures=True)
+        return [(path, loaded[path]) for path in file_paths if path in loaded], errors
+
+    def _require_geometry(self, file_path, polydata):
+        if polydata.GetNumberOfPoints() == 0: raise IOError(f"No geometry found in {file_path}.")
+        return polydata
\ No newline at end of file
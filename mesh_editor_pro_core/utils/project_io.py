@@ -0,0 +1,180 @@
+# ===================================================================================
+# Python file : project_io.py
+# Description:
+# Reads and writes the native '.mep' project container. Each object's points and
+# cell connectivity are stored as raw, 64-byte aligned arrays, followed by a small
+# JSON index of names, display properties and array locations. On load the arrays
+# are memory-mapped, so VTK shares the file pages instead of copying geometry.
+# Saves only append the blocks of objects whose geometry changed.
+# ===================================================================================
+
+import json
+import os
+import struct
+import uuid
+import numpy as np
+import vtk
+
+from mesh_editor_pro_core.core import mesh_arrays
+
+MAGIC = b'MEPROJ01'
+ALIGN = 64
+FOOTER = struct.Struct('<QQ8s')  # index offset, index length, magic
+DETACH_BEFORE_REPLACE = os.name == 'nt'  # Windows cannot replace a file that is still memory-mapped
+
+class ProjectFile:
+    """
+    Native project container: raw geometry arrays plus a JSON index at the end of the file.
+    Saves are incremental: objects whose geometry is unchanged since the last save keep their
+    existing blocks, changed objects are appended, and a new index and footer are written last.
+    The file is compacted into a fresh generation once more than half of it is unreferenced.
+    """
+
+    VERSION = 1
+    COMPACT_RATIO = 0.5
+    COPY_CHUNK = 16 * 1024 * 1024
+
+    def __init__(self): self.mapped = {}  # absolute path -> vtkWeakReferences to the polydata load() mapped from it
+
+    def save(self, file_path, actors):
+        """Snapshots, writes and commits in one call; used for interactive saves on the GUI thread."""
+        items = self.snapshot(file_path, actors)
+        self.commit(file_path, items, self.write(file_path, items))
+
+    def snapshot(self, file_path, actors):
+        """
+        Captures everything a save needs on the GUI thread: names, appearance, the geometry version and,
+        for objects whose blocks cannot be reused, zero-copy array views. The result can be written from
+        a worker thread with write().
+        """
+        objects = [a for a in actors if a.name != "working_plane_visual" and a.GetMapper() and a.GetMapper().GetInput()]
+        if not objects: raise ValueError("Scene is empty. Nothing to save.")
+        generation = self._current_generation(file_path); items = []
+        for actor in objects:
+            polydata = actor.GetMapper().GetInput(); saved = actor.saved_blocks.get(file_path)
+            reuse = saved if saved and generation is not None and saved['generation'] == generation and saved['mtime'] == polydata.GetMTime() else None
+            items.append({'actor': actor, 'name': actor.name, 'appearance': actor.get_appearance(), 'mtime': polydata.GetMTime(),
+                          'saved': reuse, 'arrays': None if reuse else mesh_arrays.polydata_to_arrays(polydata)})
+        if DETACH_BEFORE_REPLACE and self._should_compact(file_path, generation, items) and self._detach(file_path):
+            for item in items:
+                polydata = item['actor'].GetMapper().GetInput(); item['mtime'] = polydata.GetMTime()
+                if item['arrays'] is not None: item['arrays'] = mesh_arrays.polydata_to_arrays(polydata)
+        return items
+
+    def write(self, file_path, items):
+        """Writes a snapshot; returns (generation, per-item array descriptors, bytes of geometry written)."""
+        generation = self._current_generation(file_path); reused, fresh = self._sizes(items)
+        if self._should_compact(file_path, generation, items): return self._write_compacted(file_path, items) + (reused + fresh,)
+        with open(file_path, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            try:
+                descs = [item['saved']['arrays'] if item['saved'] else self._write_arrays(f, item['arrays']) for item in items]
+                self._write_index(f, generation, items, descs); f.flush()
+            except BaseException:
+                f.truncate(size); raise  # cut the partial append so the previous index and footer stay last
+        return generation, descs, fresh
+
+    def _sizes(self, items):
+        """(bytes of reused blocks, bytes of geometry still to write) for a snapshot."""
+        return (sum(self._nbytes(item['saved']['arrays']) for item in items if item['saved']),
+                sum(sum(a.nbytes for a in item['arrays'].values()) for item in items if item['arrays'] is not None))
+
+    def _should_compact(self, file_path, generation, items):
+        """True if the save rewrites a fresh generation rather than appending to the file."""
+        if generation is None: return True
+        reused, fresh = self._sizes(items); return reused + fresh < self.COMPACT_RATIO * (os.path.getsize(file_path) + fresh)
+
+    def _detach(self, file_path):
+        """
+        Gives every live polydata loaded from file_path its own copy of its arrays, so no mapping of the file is left and
+        it can be replaced. Call on the GUI thread. Returns True if any polydata was copied.
+        """
+        detached = False
+        for ref in self.mapped.pop(os.path.abspath(file_path), ()):
+            polydata = ref.Get()
+            if polydata is None: continue
+            copy = vtk.vtkPolyData(); copy.DeepCopy(polydata); polydata.ShallowCopy(copy); detached = True
+        return detached
+
+    def commit(self, file_path, items, result):
+        """Records on each actor which blocks now hold its geometry; call on the GUI thread after write()."""
+        generation, descs = result[0], result[1]
+        for item, desc in zip(items, descs): item['actor'].saved_blocks[file_path] = {'generation': generation, 'mtime': item['mtime'], 'arrays': desc}
+
+    def load(self, file_path):
+        """
+        Returns a list of {'name', 'appearance', 'polydata', 'saved'} whose geometry is memory-mapped from
+        the file; 'saved' is the block record to store in the new actor's saved_blocks.
+        """
+        index = self.read_index(file_path)
+        mapped = np.memmap(file_path, dtype=np.uint8, mode='c')
+        objects = [{'name': entry['name'], 'appearance': entry.get('appearance', {}),
+                    'polydata': mesh_arrays.arrays_to_polydata({key: self._view(mapped, desc) for key, desc in entry['arrays'].items()}, deep=False),
+                    'saved': {'generation': index.get('generation'), 'arrays': entry['arrays']}}
+                   for entry in index['objects']]
+        refs = [ref for ref in self.mapped.get(os.path.abspath(file_path), ()) if ref.Get() is not None]
+        for obj in objects: ref = vtk.vtkWeakReference(); ref.Set(obj['polydata']); refs.append(ref)
+        self.mapped[os.path.abspath(file_path)] = refs
+        return objects
+
+    def read_index(self, file_path):
+        """Reads and validates the JSON index stored at the end of the file."""
+        with open(file_path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC: raise ValueError("Not a Mesh Editor Pro project file.")
+            f.seek(-FOOTER.size, os.SEEK_END); index_offset, index_length, magic = FOOTER.unpack(f.read(FOOTER.size))
+            if magic != MAGIC: raise ValueError("Project file is truncated or corrupt.")
+            f.seek(index_offset); index = json.loads(f.read(index_length).decode('utf-8'))
+        if index.get('version', 0) > self.VERSION: raise ValueError(f"Project file version {index['version']} is newer than supported.")
+        return index
+
+    def _view(self, mapped, desc):
+        dtype = np.dtype(desc['dtype']); count = int(np.prod(desc['shape'], dtype=np.int64))
+        return mapped[desc['offset']:desc['offset'] + count * dtype.itemsize].view(dtype).reshape(desc['shape'])
+
+    def _write_arrays(self, f, arrays):
+        descs = {}
+        for key, array in arrays.items():
+            array = np.ascontiguousarray(array); self._pad(f)
+            descs[key] = {'offset': f.tell(), 'dtype': array.dtype.str, 'shape': list(array.shape)}
+            f.write(memoryview(array).cast('B'))
+        return descs
+
+    def _write_index(self, f, generation, items, descs):
+        entries = [{'name': item['name'], 'appearance': item['appearance'], 'arrays': desc} for item, desc in zip(items, descs)]
+        self._pad(f); offset = f.tell()
+        data = json.dumps({'format': 'mesh_editor_pro', 'version': self.VERSION, 'generation': generation, 'objects': entries}).encode('utf-8')
+        f.write(data); f.write(FOOTER.pack(offset, len(data), MAGIC))
+
+    def _write_compacted(self, file_path, items):
+        """Rewrites live blocks only into a new file generation and swaps it in atomically."""
+        generation, tmp_path, descs = uuid.uuid4().hex, file_path + ".tmp", []
+        source = open(file_path, 'rb') if any(item['saved'] for item in items) else None
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(MAGIC.ljust(ALIGN, b'\0'))
+                for item in items: descs.append(self._copy_arrays(source, f, item['saved']['arrays']) if item['saved'] else self._write_arrays(f, item['arrays']))
+                self._write_index(f, generation, items, descs)
+        finally:
+            if source: source.close()
+        os.replace(tmp_path, file_path)
+        return generation, descs
+
+    def _copy_arrays(self, source, f, old_descs):
+        descs = {}
+        for key, desc in old_descs.items():
+            self._pad(f); descs[key] = dict(desc, offset=f.tell()); source.seek(desc['offset']); remaining = self._nbytes({key: desc})
+            while remaining:
+                block = source.read(min(remaining, self.COPY_CHUNK))
+                if not block: raise IOError("Project file ended inside a geometry block.")
+                f.write(block); remaining -= len(block)
+        return descs
+
+    def _current_generation(self, file_path):
+        try: return self.read_index(file_path).get('generation')
+        except (OSError, ValueError): return None
+
+    def _nbytes(self, descs):
+        return sum(np.dtype(d['dtype']).itemsize * int(np.prod(d['shape'], dtype=np.int64)) for d in descs.values())
+
+    def _pad(self, f):
+        f.write(b'\0' * (-f.tell() % ALIGN))
\ No newline at end of file
@@ -0,0 +1,130 @@
+# ===================================================================================
+# Python file : streaming_io.py
+# Description:
+# Chunked import of large binary STL and PLY files. The file is memory-mapped and
+# processed in fixed-size blocks, duplicate STL vertices are merged block by block,
+# progress is reported through a ProgressMonitor and the estimated peak memory is
+# checked against a configurable budget. Pure backend logic with no GUI code.
+# ===================================================================================
+
+import os
+import numpy as np
+
+from mesh_editor_pro_core.core import mesh_arrays
+from mesh_editor_pro_core.core.progress import ProgressMonitor
+
+STL_RECORD = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+PLY_TYPES = {'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1', 'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+             'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4', 'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8'}
+
+class StreamingMeshReader:
+    """Reads binary STL and triangle-only binary PLY files in chunks within a memory budget."""
+
+    BYTES_PER_TRIANGLE = 56        # connectivity + offsets + merged points + per-block unique vertices
+    BYTES_PER_CHUNK_TRIANGLE = 160 # transient sort and inverse arrays while merging one block
+
+    def __init__(self, chunk_triangles=1_000_000, memory_budget_mb=4096, monitor=None):
+        self.chunk_triangles, self.memory_budget_mb = chunk_triangles, memory_budget_mb
+        self.monitor = monitor or ProgressMonitor()
+
+    def can_stream(self, file_path):
+        """True if the file is a binary STL or a binary PLY whose layout this reader supports."""
+        try:
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext == '.stl': return self._stl_triangle_count(file_path) is not None
+            if ext == '.ply': return self._ply_layout(file_path) is not None
+        except (OSError, ValueError): pass
+        return False
+
+    def read(self, file_path):
+        """Returns the mesh as vtkPolyData; raises ValueError for unsupported layouts and MemoryError over budget."""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.stl': return self._read_stl(file_path)
+        if ext == '.ply': return self._read_ply(file_path)
+        raise ValueError(f"Streaming import does not support {ext} files.")
+
+    def _chunk_size(self):
+        budget_chunk = int(self.memory_budget_mb * 1024 * 1024 * 0.1 / self.BYTES_PER_CHUNK_TRIANGLE)
+        return max(1024, min(self.chunk_triangles, budget_chunk))
+
+    def _check_budget(self, triangles, extra_bytes=0):
+        needed_mb = (triangles * self.BYTES_PER_TRIANGLE + extra_bytes) / (1024 * 1024) + self._chunk_size() * self.BYTES_PER_CHUNK_TRIANGLE / (1024 * 1024)
+        if needed_mb > self.memory_budget_mb: raise MemoryError(f"Importing {triangles} triangles needs about {needed_mb:.0f} MB, over the {self.memory_budget_mb} MB budget.")
+
+    def _stl_triangle_count(self, file_path):
+        with open(file_path, 'rb') as f: header = f.read(84)
+        if len(header) < 84: return None
+        count = int.from_bytes(header[80:84], 'little')
+        return count if os.path.getsize(file_path) == 84 + STL_RECORD.itemsize * count else None
+
+    def _read_stl(self, file_path):
+        count = self._stl_triangle_count(file_path)
+        if count is None: raise ValueError("Not a binary STL file.")
+        self._check_budget(count)
+        records = np.memmap(file_path, dtype=STL_RECORD, mode='r', offset=84, shape=(count,))
+        key_type, chunk = np.dtype((np.void, 12)), self._chunk_size()
+        connectivity = np.empty(3 * count, dtype=np.int64); block_vertices, merged = [], 0
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            keys = np.ascontiguousarray(records['vertices'][start:stop]).reshape(-1, 3).view(key_type).ravel()
+            unique, inverse = np.unique(keys, return_inverse=True)
+            connectivity[3 * start:3 * stop] = inverse.ravel() + merged; block_vertices.append(unique); merged += len(unique)
+            self.monitor.report(0.8 * stop / max(count, 1), "Reading STL"); self.monitor.check()
+        del records
+        keys = np.concatenate(block_vertices) if block_vertices else np.empty(0, dtype=key_type); del block_vertices
+        unique, remap = np.unique(keys, return_inverse=True); del keys
+        remap = remap.ravel()
+        for start in range(0, len(connectivity), 3 * chunk):
+            block = connectivity[start:start + 3 * chunk]; block[:] = remap[block]
+            self.monitor.report(0.8 + 0.2 * min(start + 3 * chunk, len(connectivity)) / max(len(connectivity), 1), "Merging points"); self.monitor.check()
+        points, triangles = np.ascontiguousarray(unique).view(np.float32).reshape(-1, 3), connectivity.reshape(-1, 3)
+        valid = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 0] != triangles[:, 2])
+        if not valid.all(): triangles = triangles[valid]
+        return mesh_arrays.polydata_from_triangles(points, triangles, compact=False, deep=False)
+
+    def _ply_layout(self, file_path):
+        """Parses a PLY header; returns (header_size, vertex_dtype, vertex_count, face_dtype, face_count) or None."""
+        with open(file_path, 'rb') as f:
+            if f.readline().strip() != b'ply': return None
+            fmt, elements = None, []
+            while True:
+                line = f.readline()
+                if not line: return None
+                words = line.decode('ascii', 'replace').split()
+                if not words or words[0] in ('comment', 'obj_info'): continue
+                if words[0] == 'end_header': break
+                if words[0] == 'format': fmt = words[1]
+                elif words[0] == 'element': elements.append((words[1], int(words[2]), []))
+                elif words[0] == 'property' and elements: elements[-1][2].append(words[1:])
+            header_size = f.tell()
+        order = {'binary_little_endian': '<', 'binary_big_endian': '>'}.get(fmt)
+        if order is None or len(elements) < 2 or elements[0][0] != 'vertex' or elements[1][0] != 'face': return None
+        (_, vertex_count, vertex_props), (_, face_count, face_props) = elements[0], elements[1]
+        if any(p[0] == 'list' or p[0] not in PLY_TYPES for p in vertex_props) or not {'x', 'y', 'z'} <= {p[1] for p in vertex_props}: return None
+        if len(face_props) != 1 or face_props[0][0] != 'list' or face_props[0][1] not in PLY_TYPES or face_props[0][2] not in PLY_TYPES: return None
+        vertex_dtype = np.dtype([(p[1], order + PLY_TYPES[p[0]]) for p in vertex_props])
+        face_dtype = np.dtype([('n', order + PLY_TYPES[face_props[0][1]]), ('indices', order + PLY_TYPES[face_props[0][2]], (3,))])
+        if os.path.getsize(file_path) < header_size + vertex_dtype.itemsize * vertex_count + face_dtype.itemsize * face_count: return None
+        return header_size, vertex_dtype, vertex_count, face_dtype, face_count
+
+    def _read_ply(self, file_path):
+        layout = self._ply_layout(file_path)
+        if layout is None: raise ValueError("Not a binary triangle PLY file.")
+        header_size, vertex_dtype, vertex_count, face_dtype, face_count = layout
+        self._check_budget(face_count, vertex_count * 12)
+        vertices = np.memmap(file_path, dtype=vertex_dtype, mode='r', offset=header_size, shape=(vertex_count,))
+        faces = np.memmap(file_path, dtype=face_dtype, mode='r', offset=header_size + vertex_dtype.itemsize * vertex_count, shape=(face_count,))
+        points = np.empty((vertex_count, 3), dtype=np.float32); connectivity = np.empty((face_count, 3), dtype=np.int64)
+        chunk, total = self._chunk_size(), max(vertex_count + face_count, 1)
+        for start in range(0, vertex_count, chunk):
+            block = vertices[start:start + chunk]
+            for axis, name in enumerate('xyz'): points[start:start + chunk, axis] = block[name]
+            self.monitor.report(min(start + chunk, vertex_count) / total, "Reading PLY vertices"); self.monitor.check()
+        for start in range(0, face_count, chunk):
+            block = faces[start:start + chunk]
+            if np.any(block['n'] != 3): raise ValueError("PLY contains non-triangle faces; streaming import needs a triangle mesh.")
+            connectivity[start:start + chunk] = block['indices']
+            self.monitor.report((vertex_count + min(start + chunk, face_count)) / total, "Reading PLY faces"); self.monitor.check()
+        del vertices, faces
+        if face_count and (connectivity.min() < 0 or connectivity.max() >= vertex_count): raise ValueError("PLY face indices are out of range.")
+        return mesh_arrays.polydata_from_triangles(points, connectivity, compact=False, deep=False)
\ No newline at end of file